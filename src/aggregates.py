@@ -0,0 +1,47 @@
+import math
+
+# Günlük özetler birleştirilerek güncellenir: sayılar ve toplamlar eklenir,
+# min/max karşılaştırılır, ilk değer korunur, son değer yenisiyle değişir.
+# ?4 kaydın zaman damgasıdır; None ise şimdiki zaman kullanılır.
+UPSERT_AGGREGATES = """
+INSERT INTO trend_aggregates
+    (niche, keyword_id, source_id, day, metric, value_count, value_sum, value_sum_sq,
+     value_min, value_max, value_first, value_last, first_ts, last_ts)
+VALUES (?1, ?2, ?3, date(COALESCE(?4, CURRENT_TIMESTAMP)), ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12,
+        COALESCE(?4, CURRENT_TIMESTAMP), COALESCE(?4, CURRENT_TIMESTAMP))
+ON CONFLICT (niche, keyword_id, source_id, day, metric) DO UPDATE SET
+    value_count = value_count + excluded.value_count,
+    value_sum = value_sum + excluded.value_sum,
+    value_sum_sq = value_sum_sq + excluded.value_sum_sq,
+    value_min = COALESCE(MIN(value_min, excluded.value_min), value_min, excluded.value_min),
+    value_max = COALESCE(MAX(value_max, excluded.value_max), value_max, excluded.value_max),
+    value_first = COALESCE(value_first, excluded.value_first),
+    value_last = COALESCE(excluded.value_last, value_last),
+    last_ts = excluded.last_ts
+"""
+
+
+def aggregate_params(rows):
+    """
+    Kayıtları UPSERT_AGGREGATES parametrelerine çevir.
+
+    Args:
+        rows: (niche, keyword_id, source_id, source, data, timestamp) demetleri
+
+    Returns:
+        list: executemany için parametre demetleri
+    """
+    # Analiz paketi yalnızca yazma sırasında yüklenir
+    from .analysis.aggregates import build_aggregates
+
+    aggregates = build_aggregates(
+        [(index, row[3], row[4]) for index, row in enumerate(rows) if row[1] is not None and row[2] is not None])
+
+    params = []
+    for index, metrics in aggregates.items():
+        niche, keyword_id, source_id, _, _, timestamp = rows[index]
+        for metric, summary in metrics.items():
+            if not math.isfinite(summary[1]) or not math.isfinite(summary[2]):
+                continue
+            params.append((niche or "", keyword_id, source_id, timestamp, metric) + tuple(summary))
+    return params
@@ -0,0 +1,3 @@
+# src/analysis/__init__.py
+
+from .registry import get_analyzer, register_analyzer
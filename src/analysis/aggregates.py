@@ -0,0 +1,32 @@
+import logging
+
+from .registry import get_analyzer
+
+logger = logging.getLogger(__name__)
+
+
+def build_aggregates(entries):
+    """
+    Kayıtları kaynak analizörleriyle birleştirilebilir özetlere çevir.
+
+    Args:
+        entries: (kayıt indeksi, kaynak, veri) demetleri
+
+    Returns:
+        dict: {indeks: {metrik: (count, sum, sum_sq, min, max, first, last)}}
+    """
+    by_source = {}
+    for index, source, data in entries:
+        by_source.setdefault(source, []).append((index, data))
+
+    aggregates = {}
+    for source, source_entries in by_source.items():
+        analyzer = get_analyzer(source)
+        if analyzer is None:
+            continue
+        try:
+            aggregates.update(analyzer.aggregate(source_entries))
+        except Exception as e:
+            # Özet çıkarılamazsa ham kayıt yine saklanır; analyze --raw ile hesaplanabilir
+            logger.error(f"Error aggregating {source} results: {str(e)}")
+    return aggregates
@@ -0,0 +1,181 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+from .frames import item_frame, entry_counts, sums, distribution
+
+# Birleştirilebilir özet: (count, sum, sum_sq, min, max, first, last)
+ITEMS_METRIC = "_items"
+
+
+class SourceAnalyzer(ABC):
+    """Bir kaynağın tüm kayıtlarını tek bir çağrıda analiz eden temel sınıf"""
+
+    # Scraper'ların sonuçlarda kullandığı kaynak adı (örn. "reddit")
+    source = None
+    # Analiz başarısız olursa hata mesajının öneki
+    error_label = "Analiz hatası"
+
+    @abstractmethod
+    def analyze(self, entries):
+        """
+        Args:
+            entries: (kayıt indeksi, veri) demetleri
+
+        Returns:
+            tuple: ({indeks: istatistikler}, {indeks: tahminler})
+        """
+        pass
+
+    @abstractmethod
+    def aggregate(self, entries):
+        """
+        Kayıtları veritabanında gün gün birleştirilebilecek özetlere çevir.
+
+        Returns:
+            dict: {indeks: {metrik: (count, sum, sum_sq, min, max, first, last)}}
+        """
+        pass
+
+    @abstractmethod
+    def analyze_aggregates(self, groups):
+        """
+        Birleştirilmiş özetlerden analyze ile aynı biçimde istatistik üret.
+
+        Args:
+            groups: (indeks, {"metrics": {metrik: özet}, "series": son seri veya None}) demetleri
+        """
+        pass
+
+
+class ItemAnalyzer(SourceAnalyzer):
+    """
+    Verisi öğe listesi olan kaynaklar (post, video, ürün...) için temel sınıf.
+    Alt sınıflar okuyacakları alanları bildirir; öğeler tek bir DataFrame'e
+    düzleştirilir ve compute tüm kayıtlar için sütun hesaplarını bir kerede yapar.
+    """
+
+    # Öğe başına okunacak alanlar: sütun adı -> (anahtar veya anahtar yolu, varsayılan)
+    numeric_fields = {}
+    categorical_fields = {}
+    # prepare içinde eklenen sayısal sütunlar
+    derived_fields = ()
+    # Öğesi olmayan kayıtlar için döndürülecek istatistikler
+    empty_stats = {}
+
+    @property
+    def total_fields(self):
+        return list(self.numeric_fields) + list(self.derived_fields)
+
+    def _frame(self, entries):
+        lists = [(index, data) for index, data in entries if isinstance(data, list) and data]
+        frame = item_frame(lists, numeric=self.numeric_fields, categorical=self.categorical_fields)
+        self.prepare(frame)
+        return frame
+
+    def analyze(self, entries):
+        counts = entry_counts(entries)
+        active = counts[counts > 0]
+
+        totals = None
+        distributions = {}
+        if len(active):
+            frame = self._frame(entries)
+            totals = sums(frame, self.total_fields, active.index)
+            distributions = {column: distribution(frame, column) for column in self.categorical_fields}
+
+        return self._stats(active.index, active.to_numpy(), totals, distributions,
+                           counts.index[counts == 0]), {}
+
+    def aggregate(self, entries):
+        counts = entry_counts(entries)
+        result = {
+            index: {ITEMS_METRIC: (1, count, count * count, count, count, count, count)}
+            for index, count in counts.items()
+        }
+        if not (counts > 0).any():
+            return result
+
+        frame = self._frame(entries)
+        columns = self.total_fields
+        grouped = frame.groupby("entry")[columns]
+        summary = grouped.agg(["count", "sum", "min", "max", "first", "last"])
+        squares = (frame[columns] ** 2).groupby(frame["entry"]).sum()
+
+        for index in summary.index:
+            for column in columns:
+                row = summary.loc[index, column]
+                result[index][column] = (
+                    int(row["count"]), float(row["sum"]), float(squares.loc[index, column]),
+                    float(row["min"]), float(row["max"]), float(row["first"]), float(row["last"])
+                )
+
+        # Kategorik sayımlarda "first" değerin ilk görülme sırasını tutar
+        for column in self.categorical_fields:
+            for index, values in distribution(frame, column).items():
+                for position, (value, count) in enumerate(values.items()):
+                    result[index][f"{column}={value}"] = (count, count, count * count, None, None, position, None)
+
+        return result
+
+    def analyze_aggregates(self, groups):
+        """
+        Penceredeki tüm kazımalar birleştirilir: sayılar ve toplamlar kazıma
+        başına ortalamaya çevrilir, dağılımlar pencere toplamı olarak raporlanır.
+        Tek bir kazıma için sonuç analyze ile aynıdır.
+        """
+        index = []
+        count = []
+        totals = []
+        distributions = {column: {} for column in self.categorical_fields}
+        empty = []
+
+        for entry, group in groups:
+            metrics = group["metrics"]
+            scrapes, items = metrics.get(ITEMS_METRIC, (0, 0))[:2]
+            if not scrapes or not items:
+                empty.append(entry)
+                continue
+
+            index.append(entry)
+            count.append(int(round(items / scrapes)))
+            totals.append({column: metrics.get(column, (0, 0))[1] / scrapes for column in self.total_fields})
+
+            ordered = sorted(metrics.items(), key=lambda item: (item[1][5] is None, item[1][5] or 0))
+            for metric, summary in ordered:
+                column, separator, value = metric.partition("=")
+                if separator and column in distributions:
+                    distributions[column].setdefault(entry, {})[value] = int(summary[0])
+
+        totals = pd.DataFrame(totals, index=index, columns=self.total_fields, dtype=np.float64)
+        return self._stats(pd.Index(index), np.array(count, dtype=np.int64), totals, distributions, empty), {}
+
+    def _stats(self, index, count, totals, distributions, empty):
+        stats = {}
+        if len(index):
+            columns = self.compute(index, count, totals, distributions)
+            table = pd.DataFrame({"source": self.source, **columns}, index=index)
+            stats = table.to_dict("index")
+
+        for entry in empty:
+            stats[entry] = {"source": self.source, **self.empty_stats}
+        return stats
+
+    def prepare(self, frame):
+        """Toplamadan önce derived_fields sütunlarını eklemek için kanca"""
+        pass
+
+    @abstractmethod
+    def compute(self, index, count, totals, distributions):
+        """
+        Args:
+            index: Öğesi olan kayıtların indeksleri
+            count: Bu kayıtların öğe sayıları (NumPy dizisi)
+            totals: Kayıt başına sayısal sütun toplamları (index sırasıyla)
+            distributions: Kategorik sütun -> {indeks: {değer: adet}}
+
+        Returns:
+            dict: Çıktı alanı -> sütun değerleri, çıktıdaki sırayla
+        """
+        pass
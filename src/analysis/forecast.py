@@ -0,0 +1,268 @@
+import hashlib
+from collections import OrderedDict
+from itertools import product
+from statistics import NormalDist
+
+import numpy as np
+
+# Holt-Winters için denenen (alpha, beta, gamma) kombinasyonları; tüm seriler
+# ve kombinasyonlar tek bir (seri, kombinasyon) dizisinde birlikte güncellenir
+SMOOTHING_GRID = np.array(list(product((0.2, 0.5, 0.8), (0.05, 0.2), (0.1, 0.3))), dtype=np.float64)
+
+MODELS = ("holt_winters", "seasonal_naive", "log_linear")
+
+
+class Forecaster:
+    """
+    Tüm zaman serilerini tek bir NumPy geçişinde tahmin eder. Seriler sola
+    hizalı bir matrise yerleştirilir; model seçimi son `horizon` noktanın
+    geriye dönük testiyle seri başına yapılır ve sonuç önbelleğe alınır.
+    """
+
+    def __init__(self, horizon=3, confidence=0.95, season_length=7, models=MODELS,
+                 trend_window=28, cache_size=4096):
+        """
+        Args:
+            horizon: Tahmin edilecek adım sayısı
+            confidence: Tahmin aralığının güven düzeyi (0-1)
+            season_length: Mevsimsellik periyodu (günlük veride 7)
+            models: Geriye dönük testte karşılaştırılacak modeller
+            trend_window: Log-doğrusal trendin uydurulduğu son nokta sayısı
+            cache_size: Önbellekte tutulacak en fazla model seçimi
+        """
+        unknown = [model for model in models if model not in MODELS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen tahmin modeli: {', '.join(unknown)}")
+
+        self.horizon = max(1, int(horizon))
+        self.confidence = confidence
+        self.season_length = max(1, int(season_length))
+        self.models = tuple(models) or MODELS
+        self.trend_window = max(2, int(trend_window))
+        self.cache_size = cache_size
+        self.z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        self._selections = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `forecasting` bölümünden tahminleyici oluştur"""
+        options = (config or {}).get("forecasting", {}) or {}
+        return cls(
+            horizon=options.get("horizon", 3),
+            confidence=options.get("confidence", 0.95),
+            season_length=options.get("season_length", 7),
+            models=options.get("models", MODELS),
+            trend_window=options.get("trend_window", 28)
+        )
+
+    def forecast(self, flat, starts, lengths):
+        """
+        Args:
+            flat: Uç uca eklenmiş seri değerleri
+            starts: Serilerin flat içindeki başlangıçları
+            lengths: Seri uzunlukları
+
+        Returns:
+            dict: values, lower, upper ((seri, ufuk) dizileri), model (seri başına ad),
+                mae (geriye dönük test hatası, test yapılamadıysa NaN)
+        """
+        lengths = np.asarray(lengths, dtype=np.int64)
+        matrix = self._matrix(flat, starts, lengths)
+        steps = np.arange(1, self.horizon + 1)
+
+        model, mae, sigma = self._select(matrix, lengths)
+
+        values = np.empty((len(lengths), self.horizon), dtype=np.float64)
+        for code, name in enumerate(self.models):
+            rows = model == code
+            if rows.any():
+                values[rows] = self._predict(name, matrix[rows], lengths[rows])
+
+        # Geriye dönük testi olmayan kısa seriler: son değerden %10'luk artış
+        short = model < 0
+        if short.any():
+            last = matrix[short, lengths[short] - 1]
+            values[short] = last[:, None] * (1 + 0.1 * steps)
+
+        # Trend değerleri ve sayımlar negatif olamaz
+        values = np.maximum(values, 0.0)
+        spread = self.z * sigma[:, None] * np.sqrt(steps)
+        return {
+            "values": values,
+            "lower": np.maximum(values - spread, 0.0),
+            "upper": values + spread,
+            "model": [self.models[code] if code >= 0 else "growth" for code in model],
+            "mae": mae
+        }
+
+    def _matrix(self, flat, starts, lengths):
+        """Serileri NaN ile doldurulmuş (seri, zaman) matrisine sola hizalı yerleştir"""
+        width = int(lengths.max()) if len(lengths) else 0
+        matrix = np.full((len(lengths), width), np.nan)
+        columns = np.arange(width)
+        valid = columns[None, :] < lengths[:, None]
+        positions = np.asarray(starts, dtype=np.int64)[:, None] + columns[None, :]
+        matrix[valid] = np.asarray(flat, dtype=np.float64)[positions[valid]]
+        return matrix
+
+    def _select(self, matrix, lengths):
+        """
+        Seri başına en düşük geriye dönük test hatalı modeli seç.
+
+        Returns:
+            tuple: (model kodu, -1 kısa seri; MAE; tahmin aralığı için hata std)
+        """
+        count = len(lengths)
+        model = np.full(count, -1, dtype=np.int64)
+        mae = np.full(count, np.nan)
+        sigma = np.zeros(count)
+
+        keys = [self._cache_key(matrix[i, :lengths[i]]) for i in range(count)]
+        testable = lengths >= self.horizon + 3
+        missing = []
+        for i in np.flatnonzero(testable):
+            cached = self._selections.get(keys[i])
+            if cached is None:
+                missing.append(i)
+            else:
+                self._selections.move_to_end(keys[i])
+                model[i], mae[i], sigma[i] = cached
+
+        if missing:
+            rows = np.array(missing, dtype=np.int64)
+            history = lengths[rows] - self.horizon
+            columns = history[:, None] + np.arange(self.horizon)[None, :]
+            actual = np.take_along_axis(matrix[rows], columns, axis=1)
+
+            errors = np.stack([
+                self._predict(name, matrix[rows], history) - actual for name in self.models
+            ])
+            model_mae = np.abs(errors).mean(axis=2)
+            best = model_mae.argmin(axis=0)
+            picked = errors[best, np.arange(len(rows))]
+
+            model[rows] = best
+            mae[rows] = model_mae[best, np.arange(len(rows))]
+            sigma[rows] = np.sqrt((picked ** 2).mean(axis=1))
+
+            for i in rows:
+                self._selections[keys[i]] = (model[i], mae[i], sigma[i])
+            while len(self._selections) > self.cache_size:
+                self._selections.popitem(last=False)
+
+        # Test edilemeyen seriler için ardışık farkların dağılımı kullanılır
+        short = ~testable & (lengths > 1)
+        if short.any():
+            sigma[short] = np.nanstd(np.diff(matrix[short], axis=1), axis=1)
+        return model, mae, sigma
+
+    def _cache_key(self, values):
+        digest = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        return digest, self.models, self.horizon, self.season_length, self.trend_window
+
+    def _predict(self, name, matrix, lengths):
+        """Seriyi ilk `lengths` noktasıyla uydurup sonraki horizon adımı tahmin et"""
+        if name == "holt_winters":
+            return self._holt_winters(matrix, lengths)
+        if name == "seasonal_naive":
+            return self._seasonal_naive(matrix, lengths)
+        return self._log_linear(matrix, lengths)
+
+    def _seasonal_naive(self, matrix, lengths):
+        """Bir önceki sezonun aynı günü; sezondan kısa serilerde son değer"""
+        m = self.season_length
+        steps = np.arange(self.horizon)
+        columns = np.where(
+            (lengths >= m)[:, None],
+            (lengths - m)[:, None] + steps[None, :] % m,
+            (lengths - 1)[:, None]
+        )
+        return np.take_along_axis(matrix, columns, axis=1)
+
+    def _log_linear(self, matrix, lengths):
+        """Son trend_window noktanın log1p değerlerine en küçük kareler doğrusu"""
+        width = matrix.shape[1]
+        columns = np.arange(width, dtype=np.float64)[None, :]
+        window = ((columns < lengths[:, None]) & (columns >= (lengths - self.trend_window)[:, None])).astype(np.float64)
+        logs = np.log1p(np.nan_to_num(np.maximum(matrix, 0.0)))
+
+        n = window.sum(axis=1)
+        mean_t = (window * columns).sum(axis=1) / n
+        mean_y = (window * logs).sum(axis=1) / n
+        centered = columns - mean_t[:, None]
+        variance = (window * centered ** 2).sum(axis=1)
+        slope = np.where(variance > 0, (window * centered * (logs - mean_y[:, None])).sum(axis=1)
+                         / np.where(variance > 0, variance, 1.0), 0.0)
+
+        future = (lengths - 1)[:, None] + np.arange(1, self.horizon + 1)[None, :]
+        return np.expm1(mean_y[:, None] + slope[:, None] * (future - mean_t[:, None]))
+
+    def _holt_winters(self, matrix, lengths):
+        """
+        Toplamsal Holt-Winters (ETS(A,A,A)). İki tam sezondan kısa serilerde
+        mevsimsel bileşen kapatılır (Holt doğrusal trend). Yumuşatma katsayıları
+        SMOOTHING_GRID içinden bir adım sonrası hata karesine göre seçilir.
+        """
+        count, width = matrix.shape
+        m = self.season_length
+        alpha, beta, gamma = (SMOOTHING_GRID[:, k][None, :] for k in range(3))
+        grid = len(SMOOTHING_GRID)
+        rows = np.arange(count)
+
+        seasonal = lengths >= 2 * m
+        first = matrix[:, 0]
+        span = np.clip(np.minimum(lengths - 1, m), 1, None)
+        trend0 = np.where(lengths > 1, (matrix[rows, span] - first) / span, 0.0)
+
+        season = np.zeros((count, grid, m))
+        if seasonal.any() and width >= m:
+            base = matrix[:, :m] - np.nanmean(matrix[:, :m], axis=1, keepdims=True)
+            season[seasonal] = np.nan_to_num(base[seasonal])[:, None, :]
+
+        level = np.repeat(first[:, None], grid, axis=1)
+        trend = np.repeat(trend0[:, None], grid, axis=1)
+        sse = np.zeros((count, grid))
+        use_season = seasonal[:, None].astype(np.float64)
+
+        for t in range(1, width):
+            active = (t < lengths)[:, None]
+            y = np.nan_to_num(matrix[:, t])[:, None]
+            s = season[:, :, t % m]
+
+            error = y - (level + trend + s)
+            sse += np.where(active, error * error, 0.0)
+
+            new_level = alpha * (y - s) + (1 - alpha) * (level + trend)
+            new_trend = beta * (new_level - level) + (1 - beta) * trend
+            new_season = (gamma * (y - new_level) + (1 - gamma) * s) * use_season
+
+            level = np.where(active, new_level, level)
+            trend = np.where(active, new_trend, trend)
+            season[:, :, t % m] = np.where(active, new_season, s)
+
+        best = sse.argmin(axis=1)
+        level = level[rows, best]
+        trend = trend[rows, best]
+        season = season[rows, best]
+
+        steps = np.arange(1, self.horizon + 1)
+        phase = ((lengths - 1)[:, None] + steps[None, :]) % m
+        return level[:, None] + trend[:, None] * steps[None, :] + np.take_along_axis(season, phase, axis=1)
+
+
+_default = None
+
+
+def configure_forecaster(config):
+    """Analizörlerin kullanacağı varsayılan tahminleyiciyi config.yaml'dan oluştur"""
+    global _default
+    _default = Forecaster.from_config(config)
+    return _default
+
+
+def get_forecaster():
+    """Varsayılan tahminleyiciyi döndür (yapılandırılmadıysa varsayılan ayarlarla)"""
+    global _default
+    if _default is None:
+        _default = Forecaster()
+    return _default
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+
+def _lookup(item, path, default):
+    """dict.get zincirini uygula: ("metrics", "like_count") -> item["metrics"]["like_count"]"""
+    if not isinstance(item, dict):
+        return default
+    if isinstance(path, str):
+        return item.get(path, default)
+    for key in path[:-1]:
+        item = item.get(key, {})
+        if not isinstance(item, dict):
+            return default
+    return item.get(path[-1], default)
+
+
+def item_frame(entries, numeric=None, categorical=None):
+    """
+    Kayıtlardaki liste öğelerini tek bir tipli DataFrame'e düzleştir.
+
+    Args:
+        entries: (kayıt indeksi, veri listesi) demetleri
+        numeric: sütun adı -> (anahtar veya anahtar yolu, varsayılan) (float64)
+        categorical: sütun adı -> (anahtar veya anahtar yolu, varsayılan) (object)
+
+    Returns:
+        DataFrame: "entry" sütunu ve istenen alanlar, öğe başına bir satır
+    """
+    numeric = numeric or {}
+    categorical = categorical or {}
+    items = [(index, item) for index, data in entries for item in data]
+
+    columns = {"entry": np.fromiter((index for index, _ in items), dtype=np.int64, count=len(items))}
+    for name, (path, default) in numeric.items():
+        values = pd.to_numeric(pd.Series([_lookup(item, path, default) for _, item in items], dtype=object),
+                               errors="coerce")
+        columns[name] = values.fillna(0).to_numpy(dtype=np.float64)
+    for name, (path, default) in categorical.items():
+        columns[name] = pd.Series([_lookup(item, path, default) for _, item in items], dtype=object)
+
+    return pd.DataFrame(columns)
+
+
+def entry_counts(entries):
+    """Kayıt başına öğe sayısı (liste olmayan veri için 0)"""
+    return pd.Series(
+        [len(data) if isinstance(data, list) else 0 for _, data in entries],
+        index=[index for index, _ in entries],
+        dtype=np.int64
+    )
+
+
+def sums(frame, columns, index):
+    """Kayıt başına sütun toplamları; öğesi olmayan kayıtlar 0 alır"""
+    return frame.groupby("entry")[columns].sum().reindex(index, fill_value=0.0)
+
+
+def distribution(frame, column):
+    """Kayıt başına değer dağılımı, değerler ilk görülme sırasıyla"""
+    counts = frame.groupby(["entry", column], sort=False, dropna=False).size()
+    result = {}
+    for (index, value), count in counts.items():
+        result.setdefault(index, {})[value] = int(count)
+    return result
+
+
+def safe_div(numerator, denominator):
+    """Payda pozitif değilse 0 döndüren vektörel bölme"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, 0.0)
+
+
+def top_key(counts):
+    """En sık görülen değer (eşitlikte ilk görülen)"""
+    return max(counts.items(), key=lambda x: x[1])[0] if counts else "none"
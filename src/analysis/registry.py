@@ -0,0 +1,50 @@
+import importlib
+
+# Kaynak adı -> "modül:Sınıf". Modüller yalnızca o kaynağa ait veri
+# analiz edileceği zaman içe aktarılır.
+ANALYZERS = {
+    "google_trends": ".sources.google_trends:GoogleTrendsAnalyzer",
+    "twitter": ".sources.twitter:TwitterAnalyzer",
+    "reddit": ".sources.reddit:RedditAnalyzer",
+    "hackernews": ".sources.hackernews:HackerNewsAnalyzer",
+    "instagram": ".sources.instagram:InstagramAnalyzer",
+    "youtube": ".sources.youtube:YouTubeAnalyzer",
+    "news": ".sources.news:NewsAnalyzer",
+    "pinterest": ".sources.pinterest:PinterestAnalyzer",
+    "linkedin": ".sources.linkedin:LinkedInAnalyzer",
+    "amazon": ".sources.amazon:AmazonAnalyzer",
+    "ebay": ".sources.ebay:EbayAnalyzer",
+    "otto": ".sources.otto:OttoAnalyzer",
+}
+
+_instances = {}
+
+
+def register_analyzer(source, analyzer):
+    """
+    Bir kaynak için analizör kaydet.
+
+    Args:
+        source: Scraper sonuçlarındaki kaynak adı
+        analyzer: SourceAnalyzer alt sınıfı veya "paket.modül:Sınıf" yolu
+    """
+    ANALYZERS[source] = analyzer
+    _instances.pop(source, None)
+
+
+def get_analyzer(source):
+    """Kaynağın analizörünü döndür (gerekirse modülünü yükleyerek); yoksa None"""
+    if source in _instances:
+        return _instances[source]
+
+    analyzer = ANALYZERS.get(source)
+    if analyzer is None:
+        return None
+
+    if isinstance(analyzer, str):
+        module_path, class_name = analyzer.split(":")
+        module = importlib.import_module(module_path, package=__package__)
+        analyzer = getattr(module, class_name)
+
+    _instances[source] = analyzer()
+    return _instances[source]
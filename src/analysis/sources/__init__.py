@@ -0,0 +1,4 @@
+# src/analysis/sources/__init__.py
+#
+# Kaynak analizörleri registry üzerinden tembel olarak yüklenir;
+# bu paket bilerek hiçbir modülü içe aktarmaz.
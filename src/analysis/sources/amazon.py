@@ -0,0 +1,48 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+from ..frames import safe_div, top_key
+
+
+class AmazonAnalyzer(ItemAnalyzer):
+    source = "amazon"
+    error_label = "Amazon analiz hatası"
+    numeric_fields = {
+        "price": ("price", 0),
+        "old_price": ("old_price", 0),
+        "rating": ("rating", 0),
+        "reviews": ("review_count", 0),
+    }
+    categorical_fields = {
+        "category": ("category", "other"),
+    }
+    derived_fields = ("discount", "discounted")
+    empty_stats = {"product_count": 0, "avg_price": 0, "product_popularity": 0}
+
+    def prepare(self, frame):
+        # İndirim yalnızca hem eski hem yeni fiyatı olan ürünler için hesaplanır
+        discounted = (frame["old_price"] != 0) & (frame["price"] != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frame["discount"] = np.where(
+                discounted, (frame["old_price"] - frame["price"]) / frame["old_price"] * 100, 0.0)
+        frame["discounted"] = discounted.astype(np.float64)
+
+    def compute(self, index, count, totals, distributions):
+        avg_price = totals["price"].to_numpy() / count
+        avg_rating = totals["rating"].to_numpy() / count
+        avg_reviews = totals["reviews"].to_numpy() / count
+        avg_discount = safe_div(totals["discount"].to_numpy(), totals["discounted"].to_numpy())
+        categories = distributions["category"]
+        category_counts = [categories.get(entry, {}) for entry in index]
+
+        return {
+            "product_count": count,
+            "avg_price": avg_price,
+            "avg_rating": avg_rating,
+            "avg_reviews": avg_reviews,
+            "avg_discount": avg_discount,
+            "product_popularity": avg_reviews * avg_rating,
+            "category_distribution": category_counts,
+            "top_category": [top_key(counts) for counts in category_counts],
+            "commercial_potential": (avg_reviews ** 0.7) * (avg_rating ** 0.3) * (100 - avg_discount) / 100
+        }
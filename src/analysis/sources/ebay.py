@@ -0,0 +1,38 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+from ..frames import safe_div
+
+
+class EbayAnalyzer(ItemAnalyzer):
+    source = "ebay"
+    error_label = "eBay analiz hatası"
+    numeric_fields = {
+        "price": ("price", 0),
+        "shipping": ("shipping", 0),
+    }
+    categorical_fields = {
+        "listing_type": ("listing_type", "unknown"),
+        "condition": ("condition", "unknown"),
+    }
+    empty_stats = {"listing_count": 0, "avg_price": 0, "market_liquidity": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_price = totals["price"].to_numpy() / count
+        avg_shipping = totals["shipping"].to_numpy() / count
+        listing_types = distributions["listing_type"]
+        conditions = distributions["condition"]
+        type_counts = [listing_types.get(entry, {}) for entry in index]
+        auctions = np.array([counts.get("Auction", 0) for counts in type_counts], dtype=np.float64)
+        listings = np.array([sum(counts.values()) for counts in type_counts], dtype=np.float64)
+
+        return {
+            "listing_count": count,
+            "avg_price": avg_price,
+            "avg_shipping": avg_shipping,
+            "total_cost": avg_price + avg_shipping,
+            "listing_type_distribution": type_counts,
+            "condition_distribution": [conditions.get(entry, {}) for entry in index],
+            "auction_ratio": safe_div(auctions, listings),
+            "market_liquidity": count / (avg_price + 1) * 10  # Pazar likiditesi
+        }
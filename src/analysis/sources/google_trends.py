@@ -0,0 +1,164 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from ..base import SourceAnalyzer
+from ..forecast import get_forecaster
+from ..frames import safe_div
+
+# Analyzer'ın eski davranışıyla aynı: yalnızca "12", "12.5", ".5" biçimindeki metinler sayıdır
+_NUMERIC_TEXT = re.compile(r"(?:\d+\.?\d*|\.\d+)")
+
+
+def trend_values(data):
+    """
+    Google Trends verisini float dizisine çevir. Sayı olmayan değerler 0 olur.
+
+    Args:
+        data: tarih -> değer sözlüğü veya trend_points'ten okunmuş NumPy dizisi
+    """
+    if isinstance(data, np.ndarray):
+        values = data.astype(np.float64, copy=False)
+        return np.where(values >= 0, values, 0.0)
+
+    raw = pd.Series(list(data.values()), dtype=object)
+    kinds = raw.map(type)
+    is_number = kinds.isin([int, float, np.int64, np.float64])
+    is_text = kinds == str
+
+    values = np.zeros(len(raw), dtype=np.float64)
+    if is_number.any():
+        numbers = raw[is_number].astype(np.float64).to_numpy()
+        values[is_number.to_numpy()] = np.where(np.isfinite(numbers) & (numbers >= 0), numbers, 0.0)
+    if is_text.any():
+        texts = raw[is_text].astype(str)
+        valid = texts.str.fullmatch(_NUMERIC_TEXT)
+        values[is_text.to_numpy()] = np.where(valid, pd.to_numeric(texts.where(valid, "0")), 0.0)
+    return values
+
+
+class GoogleTrendsAnalyzer(SourceAnalyzer):
+    """Tüm Google Trends serilerini tek bir düz dizi üzerinde analiz eder"""
+
+    source = "google_trends"
+    error_label = "Analiz hatası"
+
+    def _flatten(self, entries):
+        """Serileri tek bir düz diziye ekle: (indeksler, düz dizi, başlangıçlar, uzunluklar)"""
+        indices = []
+        series = []
+        for index, data in entries:
+            # Hata sonuçları ({"error": ...}) seri değildir; ham ve özet yollarında atlanır
+            if isinstance(data, dict) and "error" in data:
+                continue
+            if isinstance(data, (dict, np.ndarray)):
+                values = trend_values(data)
+                if len(values):
+                    indices.append(index)
+                    series.append(values)
+
+        if not series:
+            return indices, None, None, None
+
+        lengths = np.array([len(values) for values in series], dtype=np.int64)
+        flat = np.concatenate(series)
+        starts = np.r_[0, np.cumsum(lengths)[:-1]]
+        return indices, flat, starts, lengths
+
+    def _stats(self, indices, lengths, mean, std, first, last, peak):
+        trend_strength = np.where(lengths > 1, np.abs((last - first) / np.maximum(first, 1)) * 100, 0.0)
+
+        table = pd.DataFrame({
+            "source": self.source,
+            "mean": mean,
+            "std": std,
+            "trend": np.where(last > first, "yükseliyor", "düşüyor"),
+            "trend_strength": trend_strength,
+            "peak_value": peak,
+            "current_value": last,
+            "popularity_index": safe_div(last * 100, peak)
+        }, index=indices)
+        return table.to_dict("index")
+
+    def predict(self, indices, flat, starts, lengths):
+        """
+        Tüm serileri tek seferde tahmin et.
+
+        Returns:
+            tuple: ({indeks: tahmin değerleri}, {indeks: model ve güven aralığı alanları})
+        """
+        forecast = get_forecaster().forecast(flat, starts, lengths)
+        predictions = {}
+        details = {}
+        for i, index in enumerate(indices):
+            predictions[index] = [float(value) for value in forecast["values"][i]]
+            details[index] = {
+                "forecast_model": forecast["model"][i],
+                "forecast_lower": [float(value) for value in forecast["lower"][i]],
+                "forecast_upper": [float(value) for value in forecast["upper"][i]],
+                "forecast_mae": None if np.isnan(forecast["mae"][i]) else float(forecast["mae"][i])
+            }
+        return predictions, details
+
+    def analyze(self, entries):
+        indices, flat, starts, lengths = self._flatten(entries)
+        if not indices:
+            return {}, {}
+
+        mean = np.add.reduceat(flat, starts) / lengths
+        deviations = flat - np.repeat(mean, lengths)
+        std = np.sqrt(np.add.reduceat(deviations * deviations, starts) / lengths)
+        stats = self._stats(indices, lengths, mean, std,
+                            first=flat[starts],
+                            last=flat[starts + lengths - 1],
+                            peak=np.maximum.reduceat(flat, starts))
+
+        predictions, details = self.predict(indices, flat, starts, lengths)
+        for index, fields in details.items():
+            stats[index].update(fields)
+        return stats, predictions
+
+    def aggregate(self, entries):
+        indices, flat, starts, lengths = self._flatten(entries)
+        if not indices:
+            return {}
+
+        ends = starts + lengths - 1
+        total = np.add.reduceat(flat, starts)
+        squares = np.add.reduceat(flat * flat, starts)
+        low = np.minimum.reduceat(flat, starts)
+        high = np.maximum.reduceat(flat, starts)
+
+        return {
+            index: {"value": (int(lengths[i]), float(total[i]), float(squares[i]), float(low[i]),
+                              float(high[i]), float(flat[starts[i]]), float(flat[ends[i]]))}
+            for i, index in enumerate(indices)
+        }
+
+    def analyze_aggregates(self, groups):
+        """
+        İstatistikler penceredeki tüm noktaların özetinden, tahminler ise
+        en son kazınan seriden hesaplanır.
+        """
+        groups = [(index, group) for index, group in groups
+                  if group["metrics"].get("value") and group["metrics"]["value"][0]]
+        if not groups:
+            return {}, {}
+
+        summary = np.array([group["metrics"]["value"][:7] for _, group in groups], dtype=np.float64)
+        count, total, squares, _, peak, first, last = summary.T
+        mean = total / count
+        std = np.sqrt(np.maximum(squares / count - mean * mean, 0.0))
+        indices = [index for index, _ in groups]
+        stats = self._stats(indices, count, mean, std, first, last, peak)
+
+        latest = [(index, group["series"]) for index, group in groups if group.get("series") is not None]
+        series_indices, flat, starts, lengths = self._flatten(latest)
+        predictions = {}
+        if series_indices:
+            predictions, details = self.predict(series_indices, flat, starts, lengths)
+            for index, fields in details.items():
+                stats[index].update(fields)
+
+        return stats, predictions
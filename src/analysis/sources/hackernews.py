@@ -0,0 +1,24 @@
+from ..base import ItemAnalyzer
+
+
+class HackerNewsAnalyzer(ItemAnalyzer):
+    source = "hackernews"
+    error_label = "HackerNews analiz hatası"
+    numeric_fields = {
+        "points": ("points", 0),
+        "comments": ("num_comments", 0),
+    }
+    empty_stats = {"hit_count": 0, "tech_relevance": 0, "developer_interest": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_points = totals["points"].to_numpy() / count
+        avg_comments = totals["comments"].to_numpy() / count
+
+        return {
+            "hit_count": count,
+            "avg_points": avg_points,
+            "avg_comments": avg_comments,
+            "tech_relevance": (avg_points / (avg_comments + 1)) * 10,  # Teknolojik ilgi endeksi
+            "discussion_quality": (avg_comments * avg_points) / 100,  # Tartışma kalitesi
+            "developer_interest": avg_points * count / 10  # Geliştirici ilgisi
+        }
@@ -0,0 +1,31 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+
+
+class InstagramAnalyzer(ItemAnalyzer):
+    source = "instagram"
+    error_label = "Instagram analiz hatası"
+    numeric_fields = {
+        "likes": ("likes_count", 0),
+        "comments": ("comments_count", 0),
+    }
+    categorical_fields = {
+        "type": ("type", "unknown"),
+    }
+    empty_stats = {"post_count": 0, "engagement_rate": 0, "visual_trend_score": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_likes = totals["likes"].to_numpy() / count
+        avg_comments = totals["comments"].to_numpy() / count
+        types = distributions["type"]
+
+        return {
+            "post_count": count,
+            "avg_likes": avg_likes,
+            "avg_comments": avg_comments,
+            "engagement_rate": (avg_likes + avg_comments * 2) / count,
+            "post_type_distribution": [types.get(entry, {}) for entry in index],
+            "visual_trend_score": avg_likes * np.sqrt(count) / 100,  # Görsel trendler skoru
+            "social_visibility": (avg_likes ** 0.7) * (count ** 0.3)  # Sosyal görünürlük
+        }
@@ -0,0 +1,34 @@
+from ..base import ItemAnalyzer
+from ..frames import top_key
+
+
+class LinkedInAnalyzer(ItemAnalyzer):
+    source = "linkedin"
+    error_label = "LinkedIn analiz hatası"
+    numeric_fields = {
+        "likes": (("engagement", "likes"), 0),
+        "comments": (("engagement", "comments"), 0),
+        "shares": (("engagement", "shares"), 0),
+    }
+    categorical_fields = {
+        "industry": ("industry_relevance", "general"),
+    }
+    empty_stats = {"post_count": 0, "professional_engagement": 0, "b2b_relevance": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_likes = totals["likes"].to_numpy() / count
+        avg_comments = totals["comments"].to_numpy() / count
+        avg_shares = totals["shares"].to_numpy() / count
+        industries = distributions["industry"]
+        industry_counts = [industries.get(entry, {}) for entry in index]
+
+        return {
+            "post_count": count,
+            "avg_likes": avg_likes,
+            "avg_comments": avg_comments,
+            "avg_shares": avg_shares,
+            "professional_engagement": (avg_comments * 2 + avg_shares * 3) / 5,
+            "industry_distribution": industry_counts,
+            "top_industry": [top_key(counts) for counts in industry_counts],
+            "b2b_relevance": (count * avg_shares) / 10  # B2B ilgi endeksi
+        }
@@ -0,0 +1,41 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+from ..frames import safe_div
+
+
+class NewsAnalyzer(ItemAnalyzer):
+    source = "news"
+    error_label = "News analiz hatası"
+    numeric_fields = {
+        "relevance": ("relevance_score", 0.5),
+    }
+    categorical_fields = {
+        "sentiment": ("sentiment", "neutral"),
+        "outlet": ("source", ""),
+    }
+    empty_stats = {"article_count": 0, "sentiment_score": 0, "trending_status": "none"}
+
+    def compute(self, index, count, totals, distributions):
+        sentiments = distributions["sentiment"]
+        outlets = distributions["outlet"]
+
+        # Duygu analizi dağılımı
+        sentiment_counts = []
+        for entry in index:
+            counts = {"positive": 0, "neutral": 0, "negative": 0}
+            counts.update(sentiments.get(entry, {}))
+            sentiment_counts.append(counts)
+        balance = np.array([counts["positive"] - counts["negative"] for counts in sentiment_counts],
+                           dtype=np.float64)
+        articles = np.array([sum(sentiments.get(entry, {}).values()) for entry in index], dtype=np.float64)
+        outlet_count = np.array([len(outlets.get(entry, {})) for entry in index], dtype=np.float64)
+
+        return {
+            "article_count": count,
+            "sentiment_distribution": sentiment_counts,
+            "sentiment_score": safe_div(balance, articles) * 100,  # -100 ile 100 arası
+            "source_diversity": outlet_count / count * 10,  # Kaynak çeşitliliği
+            "media_attention": totals["relevance"].to_numpy(),
+            "trending_status": np.where(count > 10, "high", np.where(count > 5, "medium", "low"))
+        }
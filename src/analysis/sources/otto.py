@@ -0,0 +1,43 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+from ..frames import safe_div
+
+
+class OttoAnalyzer(ItemAnalyzer):
+    source = "otto"
+    error_label = "Otto analiz hatası"
+    numeric_fields = {
+        "price": ("price", 0),
+        "sale_price": ("sale_price", 0),
+        "rating": ("rating", 0),
+    }
+    categorical_fields = {
+        "category": ("category", "other"),
+    }
+    derived_fields = ("discount", "discounted")
+    empty_stats = {"product_count": 0, "avg_price": 0, "german_market_index": 0}
+
+    def prepare(self, frame):
+        # İndirim yalnızca hem liste hem indirimli fiyatı olan ürünler için hesaplanır
+        discounted = (frame["sale_price"] != 0) & (frame["price"] != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            frame["discount"] = np.where(
+                discounted, (frame["price"] - frame["sale_price"]) / frame["price"] * 100, 0.0)
+        frame["discounted"] = discounted.astype(np.float64)
+
+    def compute(self, index, count, totals, distributions):
+        avg_price = totals["price"].to_numpy() / count
+        avg_rating = totals["rating"].to_numpy() / count
+        discount_items = totals["discounted"].to_numpy()
+        categories = distributions["category"]
+
+        return {
+            "product_count": count,
+            "avg_price": avg_price,
+            "avg_rating": avg_rating,
+            "avg_discount": safe_div(totals["discount"].to_numpy(), discount_items),
+            "discount_product_ratio": discount_items / count,
+            "category_distribution": [categories.get(entry, {}) for entry in index],
+            "german_market_index": count * avg_rating / (avg_price + 1) * 10
+        }
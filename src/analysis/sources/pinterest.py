@@ -0,0 +1,33 @@
+import numpy as np
+
+from ..base import ItemAnalyzer
+from ..frames import safe_div, top_key
+
+
+class PinterestAnalyzer(ItemAnalyzer):
+    source = "pinterest"
+    error_label = "Pinterest analiz hatası"
+    numeric_fields = {
+        "saves": ("save_count", 0),
+        "clicks": ("link_clicks", 0),
+    }
+    categorical_fields = {
+        "category": ("category", "other"),
+    }
+    empty_stats = {"pin_count": 0, "click_save_ratio": 0, "inspiration_score": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_saves = totals["saves"].to_numpy() / count
+        avg_clicks = totals["clicks"].to_numpy() / count
+        categories = distributions["category"]
+        category_counts = [categories.get(entry, {}) for entry in index]
+
+        return {
+            "pin_count": count,
+            "avg_saves": avg_saves,
+            "avg_clicks": avg_clicks,
+            "click_save_ratio": safe_div(avg_clicks, avg_saves),
+            "category_distribution": category_counts,
+            "top_category": [top_key(counts) for counts in category_counts],
+            "inspiration_score": avg_saves * np.sqrt(count) / 10  # İlham vericilik skoru
+        }
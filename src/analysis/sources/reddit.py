@@ -0,0 +1,25 @@
+from ..base import ItemAnalyzer
+from ..frames import safe_div
+
+
+class RedditAnalyzer(ItemAnalyzer):
+    source = "reddit"
+    error_label = "Reddit analiz hatası"
+    numeric_fields = {
+        "score": ("score", 0),
+        "comments": ("comments", 0),
+    }
+    empty_stats = {"post_count": 0, "discussion_index": 0, "community_interest": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_score = totals["score"].to_numpy() / count
+        avg_comments = totals["comments"].to_numpy() / count
+
+        return {
+            "post_count": count,
+            "avg_score": avg_score,
+            "avg_comments": avg_comments,
+            "community_engagement": safe_div(avg_comments, avg_score),
+            "discussion_index": (avg_score + avg_comments * 2) / 3,  # Tartışma endeksi
+            "community_interest": count * avg_score / 100  # Topluluk ilgisi
+        }
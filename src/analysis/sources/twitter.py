@@ -0,0 +1,26 @@
+from ..base import ItemAnalyzer
+
+
+class TwitterAnalyzer(ItemAnalyzer):
+    source = "twitter"
+    error_label = "Twitter analiz hatası"
+    numeric_fields = {
+        "likes": (("metrics", "like_count"), 0),
+        "retweets": (("metrics", "retweet_count"), 0),
+        "replies": (("metrics", "reply_count"), 0),
+    }
+    empty_stats = {"tweet_count": 0, "engagement_score": 0, "viral_potential": 0}
+
+    def compute(self, index, count, totals, distributions):
+        likes = totals["likes"].to_numpy()
+        retweets = totals["retweets"].to_numpy()
+        replies = totals["replies"].to_numpy()
+
+        return {
+            "tweet_count": count,
+            "avg_likes": likes / count,
+            "avg_retweets": retweets / count,
+            "avg_replies": replies / count,
+            "engagement_score": (likes + retweets * 2 + replies * 3) / count,
+            "viral_potential": retweets / (likes + 1) * 100  # Viral potansiyel göstergesi
+        }
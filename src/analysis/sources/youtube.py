@@ -0,0 +1,28 @@
+from ..base import ItemAnalyzer
+from ..frames import safe_div
+
+
+class YouTubeAnalyzer(ItemAnalyzer):
+    source = "youtube"
+    error_label = "YouTube analiz hatası"
+    numeric_fields = {
+        "views": ("view_count", 0),
+        "likes": ("like_count", 0),
+        "comments": ("comment_count", 0),
+    }
+    empty_stats = {"video_count": 0, "engagement_ratio": 0, "popularity_score": 0}
+
+    def compute(self, index, count, totals, distributions):
+        avg_views = totals["views"].to_numpy() / count
+        avg_likes = totals["likes"].to_numpy() / count
+        avg_comments = totals["comments"].to_numpy() / count
+
+        return {
+            "video_count": count,
+            "avg_views": avg_views,
+            "avg_likes": avg_likes,
+            "avg_comments": avg_comments,
+            "engagement_ratio": safe_div(avg_likes + avg_comments, avg_views),  # Video etkileşim oranı
+            "popularity_score": (avg_views + avg_likes * 10) / 2,  # Video popülerlik skoru
+            "content_interest": (count * avg_views) / 1000  # İçerik ilgisi
+        }
@@ -1,15 +1,20 @@
 import typer
 import asyncio
-import yaml
+import json
+import signal
+from contextlib import nullcontext
+from typing import List
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 from rich import box
 
+from .config import load_config
 from .database import Database
-from .scraper import get_scraper
 from .analyzer import Analyzer
-from .output import OutputManager
+from .analysis.forecast import configure_forecaster
+from .output import NdjsonWriter, OutputManager, is_json_array
+from .planner import ScrapePlan
 
 app = typer.Typer(help="Anahtar kelime trend analiz aracı")
 console = Console()
@@ -23,17 +28,20 @@ def add_source(
         source_type: str = typer.Option("api", help="Kaynak tipi (api, web)"),
         auth_type: str = typer.Option(None, help="Kimlik doğrulama tipi"),
         auth_credentials: str = typer.Option(None, help="Kimlik bilgileri"),
-        scrape_method: str = typer.Option("simple", help="Kazıma yöntemi")
+        scrape_method: str = typer.Option("simple", help="Kazıma yöntemi"),
+        extra_params: str = typer.Option(None, help='Scraper ayarları (JSON, örn. \'{"api_url": "http://localhost:8000"}\')')
 ):
     """Yeni bir veri kaynağı ekler"""
     console.print(Panel("Veri Kaynağı Ekleniyor", style="blue", box=box.ROUNDED))
-    asyncio.run(_add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method))
+    asyncio.run(_add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method, extra_params))
 
 
-async def _add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method):
+async def _add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method,
+                      extra_params=None):
     try:
-        async with Database() as db:
-            await db.add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method)
+        async with Database.from_config(load_config()) as db:
+            await db.add_source(category, name, url, source_type, auth_type, auth_credentials, scrape_method,
+                                json.loads(extra_params) if extra_params else None)
             console.print(Panel(f"[green]Kaynak eklendi:[/green] {name} ({category})", style="green", box=box.ROUNDED))
     except Exception as e:
         console.print(Panel(f"[bold red]Hata:[/bold red] {str(e)}", style="red", box=box.ROUNDED))
@@ -45,17 +53,21 @@ async def _add_source(category, name, url, source_type, auth_type, auth_credenti
 def research(
         category: str = typer.Argument(..., help="Araştırılacak kategori"),
         limit: int = typer.Option(10, help="Sonuç limiti"),
-        output_file: str = typer.Option("research.json", help="Çıktı dosyası"),
-        scrape_method: str = typer.Option("playwright", help="Kazıma yöntemi (playwright, api, mock)")
+        output_file: str = typer.Option("research.ndjson", help="Çıktı dosyası (NDJSON, satır başına bir sonuç; .json uzantısında JSON dizisi)"),
+        scrape_method: str = typer.Option("playwright", help="Kazıma yöntemi (playwright, api, mock)"),
+        workers: int = typer.Option(1, help="İşçi süreç sayısı (1: tek süreç, 0: çekirdek sayısı kadar)")
 ):
     """Belirtilen kategorideki kaynaklarla araştırma yap"""
     console.print(Panel(f"[bold]{category}[/bold] Kategorisi İçin Araştırma", style="blue", box=box.ROUNDED))
-    asyncio.run(_research(category, limit, output_file, scrape_method))
+    asyncio.run(_research(category, limit, output_file, scrape_method, workers))
 
 
-async def _research(category, limit, output_file, scrape_method):
+async def _research(category, limit, output_file, scrape_method, workers=1):
     try:
-        async with Database() as db:
+        # Konfigürasyon dosyasından anahtar kelimeleri ve veritabanı ayarlarını al
+        config = load_config()
+
+        async with Database.from_config(config) as db:
             sources = await db.get_sources_by_category(category)
 
             if not sources:
@@ -68,16 +80,15 @@ async def _research(category, limit, output_file, scrape_method):
             for source in sources:
                 source["scrape_method"] = scrape_method
 
-            # Konfigürasyon dosyasından anahtar kelimeleri al
-            with open("config/config.yaml", "r") as f:
-                config = yaml.safe_load(f)
-
             keywords = config["niches"].get(category, {}).get("keywords", [])
             if not keywords:
                 console.print(Panel(f"[yellow]Uyarı:[/yellow] '{category}' kategorisinde anahtar kelime bulunamadı.",
                                     style="yellow", box=box.ROUNDED))
                 return
 
+            plan = ScrapePlan()
+            plan.add(category, sources, keywords)
+
             with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -85,34 +96,14 @@ async def _research(category, limit, output_file, scrape_method):
                     TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                     TimeElapsedColumn(),
             ) as progress:
-                task = progress.add_task(f"[cyan]Araştırma yapılıyor...", total=len(sources) * len(keywords))
-
-                all_results = []
-                completed = 0
-
-                for source in sources:
-                    scraper = get_scraper(source)
-                    async with scraper:
-                        results = await scraper.scrape(keywords, limit=limit)
-
-                        for result in results:
-                            await db.save_trends(
-                                category,
-                                result["keyword"],
-                                result["source"],
-                                result["data"]
-                            )
-                            all_results.append(result)
-                            completed += 1
-                            progress.update(task, completed=completed)
+                task = progress.add_task(f"[cyan]Araştırma yapılıyor...", total=len(plan))
+                count = await _stream_to_storage(config, db, plan, output_file, limit,
+                                                 on_result=lambda: progress.advance(task), workers=workers)
 
             console.print(
-                Panel(f"[green]Araştırma tamamlandı![/green] {len(all_results)} sonuç bulundu.", style="green",
+                Panel(f"[green]Araştırma tamamlandı![/green] {count} sonuç bulundu.", style="green",
                       box=box.ROUNDED))
-
-            # Sonuçları dosyaya kaydet
-            output = OutputManager(format="json")
-            output.save_to_file(all_results, output_file)
+            console.print(f"[green]Sonuçlar {output_file} dosyasına kaydedildi![/green]")
 
     except Exception as e:
         console.print(Panel(f"[bold red]Hata:[/bold red] {str(e)}", style="red", box=box.ROUNDED))
@@ -126,24 +117,35 @@ def analyze(
         keyword: str = typer.Option(None, help="Anahtar kelime filtresi"),
         days: int = typer.Option(7, help="Kaç günlük veri"),
         format: str = typer.Option("terminal", help="Çıktı formatı (terminal, json)"),
-        output_file: str = typer.Option("analysis.json", help="Çıktı dosyası (JSON formatı için)")
+        output_file: str = typer.Option("analysis.json", help="Çıktı dosyası (JSON formatı için)"),
+        raw: bool = typer.Option(False, "--raw", help="Günlük özetler yerine ham kayıtlardan yeniden hesapla")
 ):
     """Kazınmış verileri analiz et"""
     console.print(Panel(f"[bold]{category}[/bold] Kategorisi İçin Analiz", style="blue", box=box.ROUNDED))
-    asyncio.run(_analyze(category, keyword, days, format, output_file))
+    asyncio.run(_analyze(category, keyword, days, format, output_file, raw))
 
 
-async def _analyze(category, keyword, days, format, output_file):
+async def _analyze(category, keyword, days, format, output_file, raw=False):
     try:
-        async with Database() as db:
-            data = await db.get_trends(category, keyword, days)
+        config = load_config()
+        configure_forecaster(config)
+
+        async with Database.from_config(config) as db:
+            if raw:
+                # Zaman serileri sözlüğe çevrilmeden NumPy dizileri olarak okunur
+                data = await db.get_trends(category, keyword, days, expand_points=False)
+            else:
+                # Kazıma sırasında güncellenen günlük özetler; ham kayıtlar okunmaz
+                data = await db.get_aggregates(category, keyword, days)
 
             if not data:
                 console.print(
                     Panel(f"[yellow]Uyarı:[/yellow] Analiz edilecek veri bulunamadı.", style="yellow", box=box.ROUNDED))
                 return
 
-            analyzer = Analyzer(data)
+            # Özet modunda yalnızca tahminler için son seriler okunur
+            series = await db.get_trend_arrays(category, keyword, days, source=None, latest=not raw)
+            analyzer = Analyzer(data, series=series, aggregated=not raw)
             results = analyzer.run_analysis()
 
             output = OutputManager(format=format)
@@ -158,33 +160,82 @@ async def _analyze(category, keyword, days, format, output_file):
         console.print(traceback.format_exc())
 
 
+async def _stream_to_storage(config, db, plan, output_file, limit=10, on_result=None, workers=1):
+    """
+    Plandaki işleri çalıştır; her sonucu hazır olur olmaz veritabanına (işi isteyen
+    her nişe) ve NDJSON çıktı dosyasına yaz. Sonuçlar bellekte biriktirilmez.
+
+    Args:
+        workers: İşçi süreç sayısı (1: bu süreçte çalıştır, 0: çekirdek sayısı kadar)
+
+    Returns:
+        int: Yazılan sonuç sayısı
+    """
+    # Scraper yığını (playwright, pytrends...) yalnızca kazıma komutlarında yüklenir
+    from .engine import ScrapeEngine
+    from .sharding import ShardedRunner
+    if workers == 1:
+        engine = ScrapeEngine.from_config(config)
+        results = engine.stream_jobs(plan.jobs, limit=limit)
+    else:
+        # Her işçi süreç kendi tarayıcısı ve event loop'u ile kazır; veritabanına yalnızca bu süreç yazar
+        engine = None
+        results = ShardedRunner.from_config(config, workers).stream(config, plan.jobs, limit=limit)
+    try:
+        with NdjsonWriter(output_file) as output:
+            async with db.writer() as writer:
+                async for result, job in results:
+                    # Sonucu işi isteyen her nişe, o nişteki yazılışıyla kaydet
+                    for niche, keyword in job.targets:
+                        await writer.add(niche, keyword, result["source"], result.get("data"))
+                    result["niches"] = job.niches
+                    output.write(result)
+                    if on_result:
+                        on_result()
+            return output.count
+    finally:
+        await results.aclose()
+        if engine:
+            await engine.close()
+
+
 # CLI dosyasındaki scrape komutu tanımlaması şöyle olmalı:
 
 @app.command()
 def scrape(
-        category: str = typer.Argument(..., help="Kazınacak kategori"),
-        output_file: str = typer.Option("trends.json", help="Çıktı dosyası"),
-        scrape_method: str = typer.Option("playwright", help="Kazıma yöntemi (playwright, api, mock)")
+        categories: List[str] = typer.Argument(None, help="Kazınacak kategoriler"),
+        all_niches: bool = typer.Option(False, "--all", help="Tüm kategorileri kazı"),
+        output_file: str = typer.Option("trends.ndjson", help="Çıktı dosyası (NDJSON, satır başına bir sonuç; .json uzantısında JSON dizisi)"),
+        scrape_method: str = typer.Option("playwright", help="Kazıma yöntemi (playwright, api, mock)"),
+        workers: int = typer.Option(1, help="İşçi süreç sayısı (1: tek süreç, 0: çekirdek sayısı kadar)")
 ):
-    """Belirtilen kategorideki trendleri kazır"""
-    console.print(Panel(f"[bold]{category}[/bold] Kategorisi İçin Trend Kazıma", style="green", box=box.ROUNDED))
-    asyncio.run(_scrape(category, output_file, scrape_method))
+    """Belirtilen kategorilerdeki trendleri kazır; ortak (kaynak, anahtar kelime) işleri bir kez çalışır"""
+    if not categories and not all_niches:
+        console.print(Panel("[bold red]Hata:[/bold red] En az bir kategori verin veya --all kullanın.", style="red",
+                            box=box.ROUNDED))
+        raise typer.Exit(1)
+    title = "Tüm Kategoriler" if all_niches else ", ".join(categories)
+    console.print(Panel(f"[bold]{title}[/bold] İçin Trend Kazıma", style="green", box=box.ROUNDED))
+    asyncio.run(_scrape(None if all_niches else categories, output_file, scrape_method, workers))
 
 
-async def _scrape(category, output_file, scrape_method):
+async def _scrape(categories, output_file, scrape_method, workers=1):
     try:
         # Konfigürasyon dosyasından anahtar kelimeleri ve kaynakları al
-        with open("config/config.yaml", "r") as f:
-            config = yaml.safe_load(f)
+        config = load_config()
 
-        if category not in config["niches"]:
-            console.print(
-                Panel(f"[bold red]Hata:[/bold red] '{category}' kategorisi bulunamadı.", style="red", box=box.ROUNDED))
-            return
+        for category in categories or []:
+            if category not in config["niches"]:
+                console.print(
+                    Panel(f"[bold red]Hata:[/bold red] '{category}' kategorisi bulunamadı.", style="red",
+                          box=box.ROUNDED))
+                return
 
-        niche_config = config["niches"][category]
-        keywords = niche_config["keywords"]
-        source_names = niche_config["sources"]
+        # Nişler arasında ortak (kaynak, anahtar kelime) işleri tekilleştir
+        plan = ScrapePlan.from_config(config, categories, scrape_method)
+        if plan.skipped:
+            console.print(f"[dim]{plan.requested} işten {plan.skipped} tanesi birden fazla kategoride ortak; "
+                          f"{len(plan)} iş çalıştırılacak.[/dim]")
 
         # Progress bar ekleyelim
         with Progress(
@@ -194,39 +245,16 @@ async def _scrape(category, output_file, scrape_method):
                 TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
                 TimeElapsedColumn(),
         ) as progress:
-            task = progress.add_task(f"[cyan]Kazıma işlemi: {len(source_names)} kaynak, {len(keywords)} anahtar kelime",
-                                     total=len(source_names) * len(keywords))
-
-            # Kaynakları yapılandır
-            sources = [{"name": name, "scrape_method": scrape_method} for name in source_names]
-
-            async with Database() as db:
-                all_results = []
-                completed = 0
-
-                for source in sources:
-                    scraper = get_scraper(source)
-                    async with scraper:
-                        results = await scraper.scrape(keywords)
-
-                        for result in results:
-                            await db.save_trends(
-                                category,
-                                result["keyword"],
-                                result["source"],
-                                result["data"]
-                            )
-                            all_results.append(result)
-                            completed += 1
-                            progress.update(task, completed=completed)
+            task = progress.add_task(f"[cyan]Kazıma işlemi: {len(plan)} iş", total=len(plan))
 
-            console.print(
-                Panel(f"[bold green]Kazıma tamamlandı! [/bold green]{len(all_results)} sonuç bulundu.", style="green",
-                      box=box.ROUNDED))
+            async with Database.from_config(config) as db:
+                count = await _stream_to_storage(config, db, plan, output_file,
+                                                 on_result=lambda: progress.advance(task), workers=workers)
 
-            # Sonuçları dosyaya kaydet
-            output = OutputManager(format="json")
-            output.save_to_file(all_results, output_file)
+        console.print(
+            Panel(f"[bold green]Kazıma tamamlandı! [/bold green]{count} sonuç bulundu.", style="green",
+                  box=box.ROUNDED))
+        console.print(f"[green]Sonuçlar {output_file} dosyasına kaydedildi![/green]")
 
     except Exception as e:
         console.print(Panel(f"[bold red]Hata:[/bold red] {str(e)}", style="red", box=box.ROUNDED))
@@ -234,5 +262,72 @@ async def _scrape(category, output_file, scrape_method):
         console.print(traceback.format_exc())
 
 
+@app.command()
+def serve(
+        categories: List[str] = typer.Argument(None, help="Yenilenecek kategoriler (boş: tümü)"),
+        output_file: str = typer.Option(None, help="Sonuçların ekleneceği NDJSON dosyası (isteğe bağlı)"),
+        scrape_method: str = typer.Option("playwright", help="Kazıma yöntemi (playwright, api, mock)")
+):
+    """Sürekli çalışır; (kaynak, anahtar kelime) işlerini config.yaml `scheduler` aralıklarıyla yeniler"""
+    title = ", ".join(categories) if categories else "Tüm Kategoriler"
+    console.print(Panel(f"[bold]{title}[/bold] İçin Sürekli Trend Toplama", style="green", box=box.ROUNDED))
+    asyncio.run(_serve(categories or None, output_file, scrape_method))
+
+
+async def _serve(categories, output_file, scrape_method):
+    # Yapılandırma bir kez okunur; HTTP havuzu, tarayıcı ve veritabanı süreç boyunca açık kalır
+    config = load_config()
+
+    for category in categories or []:
+        if category not in config["niches"]:
+            console.print(
+                Panel(f"[bold red]Hata:[/bold red] '{category}' kategorisi bulunamadı.", style="red",
+                      box=box.ROUNDED))
+            return
+
+    # Sonuçlar dosyanın sonuna eklenir; JSON dizisi eklemeli yazılamaz
+    if output_file and is_json_array(output_file):
+        console.print(
+            Panel(f"[bold red]Hata:[/bold red] '{output_file}' dosyasına eklenemez; .ndjson uzantısı kullanın.",
+                  style="red", box=box.ROUNDED))
+        return
+
+    plan = ScrapePlan.from_config(config, categories, scrape_method)
+
+    # Scraper yığını (playwright, pytrends...) yalnızca kazıma komutlarında yüklenir
+    from .engine import ScrapeEngine
+    from .scheduler import RefreshScheduler
+    engine = ScrapeEngine.from_config(config)
+    scheduler = RefreshScheduler.from_config(config, engine)
+
+    # SIGTERM/SIGINT ile yarım kalan turlar iptal edilir, tampondaki sonuçlar yazılır
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    try:
+        async with Database.from_config(config) as db, db.writer() as writer:
+            scheduler.seed(plan.jobs, await db.get_last_scraped())
+
+            with NdjsonWriter(output_file, append=True) if output_file else nullcontext() as output:
+                async def on_result(result, job):
+                    # Sonucu işi isteyen her nişe, o nişteki yazılışıyla kaydet
+                    for niche, keyword in job.targets:
+                        await writer.add(niche, keyword, result["source"], result.get("data"))
+                    if output:
+                        result["niches"] = job.niches
+                        output.write(result)
+
+                console.print(f"[cyan]{len(plan)} iş zamanlandı. Durdurmak için Ctrl+C.[/cyan]")
+                await scheduler.run_forever(plan.jobs, on_result, stop=stop)
+    finally:
+        await engine.close()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+
+    console.print(Panel("[green]Sürekli toplama durduruldu.[/green]", style="green", box=box.ROUNDED))
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
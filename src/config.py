@@ -0,0 +1,9 @@
+import yaml
+
+DEFAULT_CONFIG_PATH = "config/config.yaml"
+
+
+def load_config(path=DEFAULT_CONFIG_PATH):
+    """config.yaml dosyasını oku"""
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or {}
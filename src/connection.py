@@ -0,0 +1,99 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+import aiosqlite
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionManager:
+    """
+    SQLite bağlantı yöneticisi: tek bir yazıcı bağlantısı ve küçük bir
+    okuyucu havuzu tutar. WAL modu sayesinde okuyucular (analyze)
+    yazıcının (scrape) arkasında beklemez.
+    """
+
+    def __init__(self, path, read_connections=4, mmap_size=268435456, cache_size=-65536,
+                 busy_timeout=5000):
+        """
+        Args:
+            path: Veritabanı dosyası
+            read_connections: Havuzdaki en fazla okuyucu bağlantı sayısı
+            mmap_size: PRAGMA mmap_size (bayt)
+            cache_size: PRAGMA cache_size (negatif değer KiB cinsinden)
+            busy_timeout: Kilit beklerken vazgeçmeden önceki süre (ms)
+        """
+        self.path = path
+        self.read_connections = max(1, read_connections)
+        self.mmap_size = mmap_size
+        self.cache_size = cache_size
+        self.busy_timeout = busy_timeout
+        self.writer = None
+        self._readers = asyncio.Queue()
+        self._reader_count = 0
+        self._reader_lock = asyncio.Lock()
+
+    @property
+    def in_memory(self):
+        return self.path == ":memory:" or str(self.path).startswith("file::memory:")
+
+    async def open(self):
+        """Yazıcı bağlantısını aç ve WAL modunu etkinleştir"""
+        if self.writer is None:
+            self.writer = await aiosqlite.connect(self.path)
+            if not self.in_memory:
+                await self.writer.execute("PRAGMA journal_mode = WAL")
+            await self._apply_pragmas(self.writer)
+        return self.writer
+
+    async def _apply_pragmas(self, connection):
+        # PRAGMA parametre kabul etmez; değerler tamsayıya çevrilerek eklenir
+        await connection.execute("PRAGMA synchronous = NORMAL")
+        await connection.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        await connection.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        await connection.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        await connection.execute("PRAGMA temp_store = MEMORY")
+
+    async def _acquire_reader(self):
+        if self._readers.empty():
+            async with self._reader_lock:
+                if self._reader_count < self.read_connections:
+                    self._reader_count += 1
+                    try:
+                        connection = await aiosqlite.connect(self.path)
+                        await self._apply_pragmas(connection)
+                        await connection.execute("PRAGMA query_only = ON")
+                    except Exception:
+                        self._reader_count -= 1
+                        raise
+                    return connection
+        return await self._readers.get()
+
+    @asynccontextmanager
+    async def reader(self):
+        """Havuzdan bir okuyucu bağlantı ödünç al"""
+        # Bellek içi veritabanı bağlantılar arasında paylaşılamaz
+        if self.in_memory:
+            yield await self.open()
+            return
+
+        connection = await self._acquire_reader()
+        try:
+            yield connection
+        finally:
+            self._readers.put_nowait(connection)
+
+    async def close(self):
+        """Tüm bağlantıları kapat"""
+        while not self._readers.empty():
+            connection = self._readers.get_nowait()
+            try:
+                await connection.close()
+            except Exception as e:
+                logger.error(f"Error closing read connection: {str(e)}")
+        self._reader_count = 0
+
+        if self.writer:
+            await self.writer.close()
+            self.writer = None
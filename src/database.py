@@ -1,9 +1,56 @@
-import aiosqlite
 import json
 import asyncio
+import logging
+import os
+
+import numpy as np
+
+from .aggregates import UPSERT_AGGREGATES, aggregate_params
+from .connection import ConnectionManager
+from .migrations import ensure_keyword_search, migrate
+from .timeseries import series_points
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DB_PATH = "keyword_trends.db"
+
+# Ham kayıtların zaman penceresi: şu andan N gün öncesinden itibaren
+WINDOW_START = "datetime('now', '-' || ? || ' days')"
+# Günlük özetler gün bazında tutulduğundan pencere başlangıcı o günün başına yuvarlanır
+DAY_WINDOW_START = "date('now', '-' || ? || ' days')"
 
 
 class Database:
+    def __init__(self, path=None, read_connections=4, mmap_size=268435456, cache_size=-65536):
+        """
+        Args:
+            path: Veritabanı dosyası (varsayılan: KEYWORD_TRENDS_DB ortam değişkeni,
+                o da yoksa keyword_trends.db)
+            read_connections: Okuyucu havuzundaki en fazla bağlantı
+            mmap_size: PRAGMA mmap_size (bayt)
+            cache_size: PRAGMA cache_size (negatif değer KiB cinsinden)
+        """
+        self.path = path or os.getenv("KEYWORD_TRENDS_DB") or DEFAULT_DB_PATH
+        self.connections = ConnectionManager(
+            self.path,
+            read_connections=read_connections,
+            mmap_size=mmap_size,
+            cache_size=cache_size
+        )
+        self.db = None
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `database` bölümünden veritabanı oluştur (KEYWORD_TRENDS_DB `path`'i geçersiz kılar)"""
+        options = (config or {}).get("database", {}) or {}
+        return cls(
+            path=os.getenv("KEYWORD_TRENDS_DB") or options.get("path"),
+            read_connections=options.get("read_connections", 4),
+            mmap_size=options.get("mmap_size", 268435456),
+            cache_size=options.get("cache_size", -65536)
+        )
+
     async def __aenter__(self):
         await self.init()
         return self
@@ -12,89 +59,341 @@ class Database:
         await self.close()
 
     async def init(self):
-        self.db = await aiosqlite.connect("keyword_trends.db")
+        # Yazma işlemleri tek bağlantıdan, okumalar havuzdan yapılır
+        self.db = await self.connections.open()
+        self._keyword_ids = {}
+        self._source_ids = {}
         await self._create_tables()
 
     async def _create_tables(self):
-        await self.db.execute("""
-        CREATE TABLE IF NOT EXISTS keyword_trends (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            niche TEXT,
-            keyword TEXT,
-            source TEXT,
-            data TEXT,
-            region TEXT,
-            city TEXT,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-        """)
-
-        await self.db.execute("""
-        CREATE TABLE IF NOT EXISTS data_sources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            category TEXT,
-            source_name TEXT,
-            source_url TEXT,
-            source_type TEXT,
-            auth_type TEXT,
-            auth_credentials TEXT,
-            scrape_method TEXT,
-            extra_params TEXT
-        )
-        """)
-        await self.db.commit()
+        await migrate(self.db)
+
+        # Trigram indeksi (eksikse yeniden denenir) yoksa anahtar kelime filtresi LIKE ile çalışır
+        self.has_keyword_search = await ensure_keyword_search(self.db)
+
+    async def _lookup_ids(self, table, column, names, cache):
+        """Anahtar kelime/kaynak adlarını lookup tablosundaki tamsayı id'lere çevir"""
+        missing = sorted({name for name in names if name is not None and name not in cache})
+        if missing:
+            await self.db.executemany(
+                f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)",
+                [(name,) for name in missing]
+            )
+            placeholders = ", ".join("?" for _ in missing)
+            async with self.db.execute(
+                    f"SELECT {column}, id FROM {table} WHERE {column} IN ({placeholders})",
+                    missing
+            ) as cursor:
+                for name, row_id in await cursor.fetchall():
+                    cache[name] = row_id
+        return cache
 
     async def save_trends(self, niche, keyword, source, data, region=None, city=None):
-        await self.db.execute(
-            """INSERT INTO keyword_trends (niche, keyword, source, data, region, city) 
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (niche, keyword, source, json.dumps(data), region, city)
-        )
-        await self.db.commit()
+        await self.save_trends_many([(niche, keyword, source, data, region, city)])
+
+    async def save_trends_many(self, rows):
+        """
+        Birden fazla sonucu tek bir transaction içinde kaydet.
 
-    async def get_trends(self, niche=None, keyword=None, days=7):
-        query = "SELECT keyword, source, data, timestamp FROM keyword_trends WHERE 1=1"
+        Args:
+            rows: (niche, keyword, source, data[, region[, city]]) demetleri
+        """
+        rows = [tuple(row) + (None,) * (6 - len(row)) for row in rows]
+        if not rows:
+            return
+
+        try:
+            keyword_ids = await self._lookup_ids(
+                "keywords", "keyword", [row[1] for row in rows], self._keyword_ids)
+            source_ids = await self._lookup_ids(
+                "sources", "name", [row[2] for row in rows], self._source_ids)
+
+            params = []
+            series = []
+            for niche, keyword, source, data, region, city in rows:
+                # Sayısal zaman serileri JSON yerine trend_points tablosuna yazılır
+                points = series_points(data)
+                series.append(points)
+                params.append((niche, keyword, source, keyword_ids.get(keyword), source_ids.get(source),
+                               None if points is not None else json.dumps(data, default=str), region, city))
+
+            insert = """INSERT INTO keyword_trends
+                   (niche, keyword, source, keyword_id, source_id, data, region, city) 
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+            await self.db.executemany(insert, [row for row, points in zip(params, series) if points is None])
+
+            # Zaman serisi kayıtları tek tek eklenir; noktalar gerçek id'ye bağlanır
+            point_rows = []
+            for row, points in zip(params, series):
+                if points is None:
+                    continue
+                async with self.db.execute(insert, row) as cursor:
+                    trend_id = cursor.lastrowid
+                point_rows.extend(
+                    (trend_id, seq, row[3], row[4], ts, value) for seq, (ts, value) in enumerate(points))
+            if point_rows:
+                await self.db.executemany(
+                    """INSERT INTO trend_points (trend_id, seq, keyword_id, source_id, ts, value)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    point_rows
+                )
+
+            # Günlük özetler aynı transaction'da güncellenir
+            try:
+                aggregates = aggregate_params([
+                    (niche, keyword_ids.get(keyword), source_ids.get(source), source, data, None)
+                    for niche, keyword, source, data, region, city in rows
+                ])
+            except Exception as e:
+                logger.error(f"Error building trend aggregates: {str(e)}")
+                aggregates = []
+            if aggregates:
+                await self.db.executemany(UPSERT_AGGREGATES, aggregates)
+
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            # Geri alınan id'ler önbellekte kalmasın
+            self._keyword_ids.clear()
+            self._source_ids.clear()
+            raise
+
+    def writer(self, batch_size=500, flush_interval=2.0):
+        """Sonuçları tamponlayıp toplu halde yazan bir TrendWriter döndür"""
+        return TrendWriter(self, batch_size=batch_size, flush_interval=flush_interval)
+
+    def _keyword_filter(self, alias):
+        """Anahtar kelime alt dize filtresi; parametre olarak f"%{keyword}%" alır"""
+        if self.has_keyword_search:
+            # Trigram indeksi LIKE '%x%' sorgularını tam tarama yapmadan yanıtlar
+            return f" AND {alias}.keyword_id IN (SELECT rowid FROM keywords_fts WHERE keyword LIKE ?)"
+        return f" AND {alias}.keyword_id IN (SELECT id FROM keywords WHERE keyword LIKE ?)"
+
+    def _trend_filters(self, niche=None, keyword=None, days=7, source=None, alias="keyword_trends"):
+        """get_trends ve get_trend_arrays için ortak WHERE koşulunu oluştur"""
+        query = " WHERE 1=1"
         params = []
 
         if niche:
-            query += " AND niche = ?"
+            query += f" AND {alias}.niche = ?"
             params.append(niche)
 
+        if source:
+            query += f" AND {alias}.source_id = (SELECT id FROM sources WHERE name = ?)"
+            params.append(source)
+
         if keyword:
-            query += " AND keyword LIKE ?"
+            query += self._keyword_filter(alias)
             params.append(f"%{keyword}%")
 
-        query += " AND timestamp >= datetime('now', '-' || ? || ' days')"
+        query += f" AND {alias}.timestamp >= {WINDOW_START}"
         params.append(days)
 
-        query += " ORDER BY timestamp DESC"
+        return query, params
 
-        async with self.db.execute(query, params) as cursor:
-            rows = await cursor.fetchall()
-            return [
+    async def get_trends(self, niche=None, keyword=None, days=7, expand_points=True):
+        """
+        Kayıtlı sonuçları en yeniden eskiye döndür.
+
+        Args:
+            expand_points: False ise trend_points'teki seriler sözlüğe çevrilmez,
+                bu kayıtların "data" alanı None olur (get_trend_arrays ile okunur)
+        """
+        where, params = self._trend_filters(niche, keyword, days)
+        query = ("SELECT id, keyword, source, data, timestamp FROM keyword_trends"
+                 + where + " ORDER BY timestamp DESC, id DESC")
+
+        async with self.connections.reader() as reader:
+            async with reader.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+
+            results = [
                 {
-                    "keyword": row[0],
-                    "source": row[1],
-                    "data": json.loads(row[2]),
-                    "timestamp": row[3]
+                    "id": row[0],
+                    "keyword": row[1],
+                    "source": row[2],
+                    "data": json.loads(row[3]) if row[3] is not None else None,
+                    "timestamp": row[4]
                 }
                 for row in rows
             ]
 
+            if expand_points:
+                series_ids = [row[0] for row in rows if row[3] is None]
+                series = await self._read_points(reader, series_ids)
+                for result in results:
+                    if result["data"] is None and result["id"] in series:
+                        result["data"] = series[result["id"]]
+
+        return results
+
+    async def _read_points(self, reader, trend_ids, chunk_size=500):
+        """Verilen kayıtların zaman serilerini ts -> value sözlüğü olarak oku"""
+        series = {}
+        for start in range(0, len(trend_ids), chunk_size):
+            chunk = trend_ids[start:start + chunk_size]
+            placeholders = ", ".join("?" for _ in chunk)
+            async with reader.execute(
+                    f"""SELECT trend_id, ts, value FROM trend_points
+                        WHERE trend_id IN ({placeholders}) ORDER BY trend_id, seq""",
+                    chunk
+            ) as cursor:
+                for trend_id, ts, value in await cursor.fetchall():
+                    series.setdefault(trend_id, {})[ts] = value
+        return series
+
+    async def get_trend_arrays(self, niche=None, keyword=None, days=7, source="google_trends", latest=False):
+        """
+        Zaman serilerini JSON/sözlük dönüşümü olmadan NumPy dizileri olarak oku.
+        Seriler get_trends ile aynı sırada, uç uca eklenmiş tek dizilerde döner:
+        i. serinin noktaları values[offsets[i]:offsets[i + 1]] aralığındadır.
+
+        Args:
+            latest: True ise her anahtar kelime/kaynak için yalnızca son kayıt okunur
+
+        Returns:
+            dict: trend_ids, keywords, timestamps, offsets, ts, values
+        """
+        where, params = self._trend_filters(niche, keyword, days, source=source, alias="t")
+        if latest:
+            where += self._latest_filter("t")
+        query = ("SELECT t.id, t.keyword, t.timestamp, p.ts, p.value"
+                 " FROM keyword_trends t JOIN trend_points p ON p.trend_id = t.id"
+                 + where + " ORDER BY t.timestamp DESC, t.id DESC, p.seq")
+
+        async with self.connections.reader() as reader, reader.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
+
+        count = len(rows)
+        row_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=count)
+        values = np.fromiter((row[4] for row in rows), dtype=np.float64, count=count)
+        ts = np.array([row[3] for row in rows], dtype=str)
+
+        # Seri sınırları: trend id'nin değiştiği konumlar
+        starts = np.flatnonzero(np.r_[True, row_ids[1:] != row_ids[:-1]]) if count else np.array([], dtype=np.int64)
+        offsets = np.append(starts, count).astype(np.int64)
+
+        return {
+            "trend_ids": row_ids[starts],
+            "keywords": [rows[i][1] for i in starts],
+            "timestamps": [rows[i][2] for i in starts],
+            "offsets": offsets,
+            "ts": ts,
+            "values": values
+        }
+
+    def _latest_filter(self, alias):
+        """Anahtar kelime/kaynak/niş başına en son kaydı seçen koşul"""
+        return (f" AND {alias}.id = (SELECT MAX(l.id) FROM keyword_trends l"
+                f" WHERE l.keyword_id = {alias}.keyword_id AND l.source_id = {alias}.source_id"
+                f" AND l.niche IS {alias}.niche)")
+
+    async def get_aggregates(self, niche=None, keyword=None, days=7):
+        """
+        Günlük özetleri pencere boyunca anahtar kelime/kaynak/metrik başına birleştir.
+        Kayıtlar ilk kazıma zamanına, eşitlikte son kaydın id'sine göre yeniden eskiye
+        sıralanır (get_trends ile aynı sıra).
+
+        Returns:
+            list: {"id", "keyword", "source", "data", "metrics", "timestamp", "first_timestamp"} sözlükleri;
+                "id" pencere içindeki son kaydın id'sidir ve get_trend_arrays(latest=True) serisiyle eşleşir,
+                "metrics" metrik -> (count, sum, sum_sq, min, max, first, last)
+        """
+        where = f" WHERE a.day >= {DAY_WINDOW_START}"
+        params = [days]
+        if niche:
+            where += " AND a.niche = ?"
+            params.append(niche)
+        if keyword:
+            where += self._keyword_filter("a")
+            params.append(f"%{keyword}%")
+        # Son kayıt id'si get_trend_arrays(latest=True) ile aynı ham pencereyle sınırlanır
+        params.append(days)
+
+        # İlk/son değerler günlere göre sıralı pencere fonksiyonlarıyla seçilir
+        query = f"""
+        SELECT g.keyword_id, g.source_id, k.keyword, s.name, g.metric,
+               SUM(g.value_count), SUM(g.value_sum), SUM(g.value_sum_sq),
+               MIN(g.value_min), MAX(g.value_max), MAX(g.period_first), MAX(g.period_last),
+               MIN(g.first_ts), MAX(g.last_ts), g.niche, MAX(r.last_id)
+        FROM (
+            SELECT a.*,
+                   FIRST_VALUE(a.value_first) OVER w AS period_first,
+                   LAST_VALUE(a.value_last) OVER w AS period_last
+            FROM trend_aggregates a{where}
+            WINDOW w AS (PARTITION BY a.niche, a.keyword_id, a.source_id, a.metric ORDER BY a.day
+                         ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING)
+        ) g
+        JOIN keywords k ON k.id = g.keyword_id
+        JOIN sources s ON s.id = g.source_id
+        LEFT JOIN (
+            SELECT COALESCE(t.niche, '') AS niche, t.keyword_id, t.source_id, MAX(t.id) AS last_id
+            FROM keyword_trends t
+            WHERE t.timestamp >= {WINDOW_START}
+            GROUP BY COALESCE(t.niche, ''), t.keyword_id, t.source_id
+        ) r ON r.niche = g.niche AND r.keyword_id = g.keyword_id AND r.source_id = g.source_id
+        GROUP BY g.niche, g.keyword_id, g.source_id, g.metric
+        """
+
+        async with self.connections.reader() as reader:
+            async with reader.execute(query, params) as cursor:
+                rows = await cursor.fetchall()
+
+        groups = {}
+        for keyword_id, source_id, name, source, metric, *summary, first_ts, last_ts, group_niche, last_id in rows:
+            group = groups.setdefault((group_niche, keyword_id, source_id), {
+                "id": last_id,
+                "keyword": name,
+                "source": source,
+                "data": None,
+                "metrics": {},
+                "timestamp": last_ts,
+                "first_timestamp": first_ts
+            })
+            group["metrics"][metric] = tuple(summary)
+            group["timestamp"] = max(group["timestamp"], last_ts)
+            group["first_timestamp"] = min(group["first_timestamp"], first_ts)
+
+        # Ham kayıtlarda olduğu gibi (timestamp DESC, id DESC) en eski veri sırada en sonda kalır
+        return sorted(groups.values(), key=lambda group: (group["first_timestamp"], group["id"] or 0), reverse=True)
+
+    async def get_last_scraped(self):
+        """
+        Her (niş, anahtar kelime, kaynak) için son başarılı kazıma zamanı. Hata
+        sonuçları (data = null veya {"error": ...}) sayılmaz; hata veren işler
+        yeniden başlatmada hemen denenir.
+
+        Returns:
+            dict: (niş, anahtar kelime, kaynak) -> Unix zaman damgası (UTC)
+        """
+        async with self.connections.reader() as reader, reader.execute(
+                """SELECT t.niche, k.keyword, s.name, CAST(strftime('%s', MAX(t.timestamp)) AS INTEGER)
+                   FROM keyword_trends t
+                   JOIN keywords k ON k.id = t.keyword_id
+                   JOIN sources s ON s.id = t.source_id
+                   WHERE t.data IS NULL
+                      OR (t.data <> 'null' AND json_type(t.data, '$.error') IS NULL)
+                   GROUP BY t.niche, t.keyword_id, t.source_id"""
+        ) as cursor:
+            return {(row[0], row[1], row[2]): row[3] for row in await cursor.fetchall()}
+
     async def add_source(self, category, name, url, source_type="api", auth_type=None,
-                         auth_credentials=None, scrape_method="simple"):
+                         auth_credentials=None, scrape_method="simple", extra_params=None):
         await self.db.execute(
             """INSERT INTO data_sources 
-               (category, source_name, source_url, source_type, auth_type, auth_credentials, scrape_method) 
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+               (category, source_name, source_url, source_type, auth_type, auth_credentials, scrape_method,
+                extra_params) 
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             (category, name, url, source_type, auth_type,
-             json.dumps(auth_credentials) if auth_credentials else None, scrape_method)
+             json.dumps(auth_credentials) if auth_credentials else None, scrape_method,
+             json.dumps(extra_params) if extra_params else None)
         )
         await self.db.commit()
 
     async def get_sources_by_category(self, category):
-        async with self.db.execute(
-                """SELECT source_name, source_url, source_type, auth_type, auth_credentials, scrape_method 
+        async with self.connections.reader() as reader, reader.execute(
+                """SELECT source_name, source_url, source_type, auth_type, auth_credentials, scrape_method,
+                          extra_params
                    FROM data_sources WHERE category = ?""",
                 (category,)
         ) as cursor:
@@ -106,10 +405,82 @@ class Database:
                     "type": row[2],
                     "auth_type": row[3],
                     "auth_credentials": json.loads(row[4]) if row[4] else None,
-                    "scrape_method": row[5]
+                    "scrape_method": row[5],
+                    # Scraper'a özgü ayarlar (örn. api_url, wait_selector)
+                    "extra_params": json.loads(row[6]) if row[6] else {}
                 }
                 for row in rows
             ]
 
     async def close(self):
-        await self.db.close()
\ No newline at end of file
+        await self.connections.close()
+        self.db = None
+
+
+class TrendWriter:
+    """
+    Sonuçları bellekte biriktirip satır sayısı veya süre dolduğunda
+    Database.save_trends_many ile tek transaction'da yazan tampon.
+    """
+
+    def __init__(self, database, batch_size=500, flush_interval=2.0):
+        """
+        Args:
+            database: Açık Database örneği
+            batch_size: Bu kadar satır birikince hemen yaz
+            flush_interval: En fazla bu kadar saniye bekleyip yaz
+        """
+        self.database = database
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.lock = asyncio.Lock()
+        self._flusher = None
+
+    async def __aenter__(self):
+        if self.flush_interval and self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def add(self, niche, keyword, source, data, region=None, city=None):
+        """Bir sonucu tampona ekle, tampon dolduysa yaz"""
+        self.buffer.append((niche, keyword, source, data, region, city))
+        if len(self.buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Tampondaki tüm satırları yaz"""
+        async with self.lock:
+            if not self.buffer:
+                return
+            rows, self.buffer = self.buffer, []
+            try:
+                await self.database.save_trends_many(rows)
+            except Exception:
+                # Transaction geri alındı; satırlar bir sonraki yazmada yeniden denenir
+                self.buffer[:0] = rows
+                raise
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing trend buffer, {len(self.buffer)} rows kept for retry: {str(e)}")
+
+    async def close(self):
+        """Zamanlayıcıyı durdur ve kalan satırları yaz"""
+        if self._flusher:
+            # Yazma sürerken iptal edilmez; satırların yazılıp yazılmadığı belirsiz kalırdı
+            async with self.lock:
+                self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+
+from .planner import ScrapeJob, keyword_key, source_key
+from .scraper import get_scraper
+from .scraper.google import configure_trends, get_trends_client
+from .scraper.http import get_http_client
+from .scraper.ratelimit import configure_rate_limits
+from .scraper.playwright.pool import get_browser_pool
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapeEngine:
+    """
+    Kaynak × anahtar kelime işlerini eşzamanlı çalıştıran zamanlayıcı.
+    Genel bir eşzamanlılık sınırı ve kaynak başına sınırlar uygular,
+    sonuçları tamamlandıkça geri çağırma fonksiyonuna aktarır.
+    """
+
+    def __init__(self, concurrency=8, source_concurrency=None, default_source_concurrency=4, http_client=None,
+                 browser_pool=None):
+        """
+        Args:
+            concurrency: Aynı anda çalışabilecek toplam iş sayısı
+            source_concurrency: Kaynak adı -> o kaynak için eşzamanlı iş sınırı
+            default_source_concurrency: Sözlükte olmayan kaynaklar için varsayılan sınır
+            http_client: Scraper'lara verilecek HttpClientManager (varsayılan: süreç geneli)
+            browser_pool: Playwright scraper'larının BrowserPool'u (varsayılan: süreç geneli)
+        """
+        self.concurrency = max(1, concurrency)
+        self.source_concurrency = source_concurrency or {}
+        self.default_source_concurrency = max(1, default_source_concurrency)
+        self.http_client = http_client or get_http_client()
+        self.browser_pool = browser_pool or get_browser_pool()
+        self._loop = None
+        self._global_semaphore = None
+        self._source_semaphores = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `scraping` bölümünden motor oluştur"""
+        scraping = (config or {}).get("scraping", {}) or {}
+        # Scraper'lar süreç genelindeki hız sınırlarını ve pytrends istemcisini kullanır
+        configure_rate_limits(config)
+        configure_trends(config)
+        return cls(
+            concurrency=scraping.get("concurrency", 8),
+            source_concurrency=scraping.get("source_concurrency", {}),
+            default_source_concurrency=scraping.get("default_source_concurrency", 4),
+            http_client=get_http_client(config),
+            browser_pool=get_browser_pool(config)
+        )
+
+    def source_limit(self, source_name, scraper):
+        """Bir kaynak için eşzamanlı iş sınırını belirle"""
+        limit = self.source_concurrency.get(source_name, self.default_source_concurrency)
+        # Scraper tek bir sayfa/oturum ile çalışıyorsa kendi sınırını uygula
+        scraper_limit = getattr(scraper, "max_concurrency", None)
+        if scraper_limit:
+            limit = min(limit, scraper_limit)
+        return max(1, limit)
+
+    async def run(self, sources, keywords, limit=10, on_result=None):
+        """
+        Tüm (kaynak, anahtar kelime) işlerini çalıştır.
+
+        Args:
+            sources: get_scraper'a verilecek kaynak yapılandırmaları
+            keywords: Anahtar kelime listesi
+            limit: Her iş için sonuç limiti
+            on_result: Her sonuç için çağrılacak async fonksiyon
+
+        Returns:
+            list: Tamamlanma sırasına göre tüm sonuçlar
+        """
+        jobs = [ScrapeJob(source, keyword) for source in sources for keyword in keywords]
+
+        async def forward(result, job):
+            await on_result(result)
+
+        return await self.run_jobs(jobs, limit=limit, on_result=forward if on_result else None)
+
+    async def run_jobs(self, jobs, limit=10, on_result=None):
+        """
+        ScrapeJob listesini çalıştır; aynı kaynak yapılandırmasına sahip işler
+        tek bir scraper örneğini paylaşır.
+
+        Args:
+            jobs: ScrapeJob listesi (örn. ScrapePlan.jobs)
+            limit: Her iş için sonuç limiti
+            on_result: Her sonuç için (sonuç, iş) ile çağrılacak async fonksiyon
+
+        Returns:
+            list: Tamamlanma sırasına göre tüm sonuçlar
+        """
+        results = []
+
+        async def emit(result, job):
+            results.append(result)
+            if on_result:
+                await on_result(result, job)
+
+        await self._run(jobs, limit, emit)
+        return results
+
+    async def stream_jobs(self, jobs, limit=10, buffer=100):
+        """
+        ScrapeJob listesini çalıştır ve her sonucu hazır olur olmaz (sonuç, iş)
+        olarak üret (async generator). Sonuçlar bellekte biriktirilmez; tüketici
+        yavaş kalırsa en fazla `buffer` sonuç bekletilir ve kazıma yavaşlar.
+        """
+        queue = asyncio.Queue(maxsize=buffer)
+        done = object()
+
+        async def produce():
+            error = None
+            try:
+                await self._run(jobs, limit, lambda result, job: queue.put((result, job)))
+            except Exception as e:
+                error = e
+            # İptal edildiyse (tüketici erken bıraktı) bitiş işaretini bekleyen yoktur
+            await queue.put(done)
+            if error:
+                raise error
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+            # Üretici hata ile bittiyse hatayı tüketiciye ilet
+            await producer
+        finally:
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            # Aynı anda çalışan run/stream çağrıları (örn. serve modu, işçi parçaları) toplam ve
+            # kaynak başına sınırları paylaşır
+            self._global_semaphore = asyncio.Semaphore(self.concurrency)
+            self._source_semaphores = {}
+
+    async def _run(self, jobs, limit, emit):
+        self._bind_loop()
+        global_semaphore = self._global_semaphore
+
+        by_source = {}
+        for job in jobs:
+            by_source.setdefault(source_key(job.source), []).append(job)
+
+        async def run_source(source_jobs):
+            source = source_jobs[0].source
+            source_name = source.get("name", "")
+            scraper = get_scraper(source, http_client=self.http_client, browser_pool=self.browser_pool)
+            async with scraper:
+                key = source_key(source)
+                source_semaphore = self._source_semaphores.get(key)
+                if source_semaphore is None:
+                    source_semaphore = self._source_semaphores[key] = asyncio.Semaphore(
+                        self.source_limit(source_name, scraper))
+                # Tek istekte birden fazla anahtar kelime sorgulayabilen scraper'lara (batch_size)
+                # işler gruplar halinde verilir
+                size = max(1, getattr(scraper, "batch_size", 1))
+                batches = [source_jobs[i:i + size] for i in range(0, len(source_jobs), size)]
+                await asyncio.gather(*(run_batch(scraper, batch, source_semaphore) for batch in batches))
+
+        async def run_batch(scraper, batch, source_semaphore):
+            jobs = {keyword_key(job.keyword): job for job in batch}
+            async with source_semaphore:
+                async with global_semaphore:
+                    # Hatalar scrape_stream içinde "error" alanlı sonuca çevrilir
+                    async for result in scraper.scrape_stream([job.keyword for job in batch], limit=limit):
+                        await emit(result, jobs.get(keyword_key(result.get("keyword", "")), batch[0]))
+
+        await asyncio.gather(*(run_source(source_jobs) for source_jobs in by_source.values()))
+
+    async def close(self):
+        """Paylaşılan HTTP oturumunu, tarayıcıyı ve pytrends havuzunu kapat (event loop kapanmadan önce çağrılmalı)"""
+        await self.http_client.close()
+        await self.browser_pool.close()
+        get_trends_client().close()
@@ -11,6 +11,9 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 from src.scraper.hybrid_manager import HybridScrapingManager, close_all_browsers
+from src.scraper.playwright.pacing import PacingPolicy
+from src.scraper.playwright.profile import BrowserProfile
+from src.scraper.playwright.screenshots import ScreenshotPipeline
 
 app = typer.Typer(help="Hibrit Anahtar Kelime Trend Analiz Aracı")
 console = Console()
@@ -28,8 +31,9 @@ def login(
 
 async def _login(service, browser_type="chromium"):
     try:
-        # Tarayıcıyı manuel başlat - browser tipini seç
-        manager = HybridScrapingManager(keep_open=True, browser_type=browser_type)
+        # Tarayıcıyı manuel başlat - browser tipini seç; giriş için pencere görünür olmalı
+        manager = HybridScrapingManager(keep_open=True, browser_type=browser_type,
+                                        profile=BrowserProfile.named("debug"))
         await manager.init_browser()
 
         if service.lower() == "twitter":
@@ -136,43 +140,51 @@ async def _scrape(category, output_file, limit, browser_type="chromium"):
                 total=len(hybrid_sources) * len(keywords))
 
             all_results = []
-            completed = 0
 
             # HybridScrapingManager'ı oluşturup, tarayıcıyı aç
-            manager = HybridScrapingManager(keep_open=True, browser_type=browser_type)
-
-            # Google Trends verileri
+            pacing = PacingPolicy.from_config(config.get("playwright", {}).get("pacing"))
+            profile = BrowserProfile.from_config(config.get("playwright", {}))
+            screenshots = ScreenshotPipeline.from_config(config.get("playwright", {}).get("screenshots"))
+            manager = HybridScrapingManager(keep_open=True, browser_type=browser_type, pacing=pacing,
+                                            profile=profile, screenshots=screenshots,
+                                            pages_per_context=config.get("playwright", {}).get("pages_per_context", 2))
+
+            async def google_trends(keyword, page):
+                trends_data, screenshot = await manager.get_google_trends_data(keyword, page=page)
+                return {
+                    "keyword": keyword,
+                    "source": "google_trends",
+                    "data": trends_data["trends"] if trends_data else {},
+                    "related_queries": trends_data["related_queries"] if trends_data else [],
+                    "screenshot": screenshot
+                }
+
+            async def twitter(keyword, page):
+                tweets, screenshot = await manager.get_twitter_data(keyword, limit, page=page)
+                return {
+                    "keyword": keyword,
+                    "source": "twitter",
+                    "data": tweets,
+                    "screenshot": screenshot
+                }
+
+            def on_result(result):
+                all_results.append(result)
+                progress.advance(task)
+
+            # Her kaynak kendi oturumlu context'inde, aynı tarayıcıda eşzamanlı çalışır
+            lanes = []
             if "google_trends" in hybrid_sources:
-                await manager.init_browser(session_name="google_session")
-                for keyword in keywords:
-                    trends_data, screenshot = await manager.get_google_trends_data(keyword)
-                    result = {
-                        "keyword": keyword,
-                        "source": "google_trends",
-                        "data": trends_data["trends"] if trends_data else {},
-                        "related_queries": trends_data["related_queries"] if trends_data else [],
-                        "screenshot": screenshot
-                    }
-                    all_results.append(result)
-                    completed += 1
-                    progress.update(task, completed=completed)
-                await manager.close_context()  # Sadece context'i kapat
-
-            # Twitter verileri
+                lanes.append(_run_lane(manager, "google", keywords, google_trends, on_result))
             if "twitter" in hybrid_sources:
-                await manager.init_browser(session_name="twitter_session")
-                for keyword in keywords:
-                    tweets, screenshot = await manager.get_twitter_data(keyword, limit)
-                    result = {
-                        "keyword": keyword,
-                        "source": "twitter",
-                        "data": tweets,
-                        "screenshot": screenshot
-                    }
-                    all_results.append(result)
-                    completed += 1
-                    progress.update(task, completed=completed)
-                await manager.close_context()  # Sadece context'i kapat
+                lanes.append(_run_lane(manager, "twitter", keywords, twitter, on_result))
+            try:
+                await asyncio.gather(*lanes)
+            finally:
+                await manager.close_context()  # Sadece context'leri kapat
+
+            # Kuyruktaki ekran görüntülerinin yazılmasını bekle
+            await manager.screenshots.close()
 
         console.print(Panel(f"[green]Kazıma tamamlandı![/green] {len(all_results)} sonuç bulundu.", style="green",
                             box=box.ROUNDED))
@@ -198,6 +210,25 @@ async def _scrape(category, output_file, limit, browser_type="chromium"):
         console.print(traceback.format_exc())
 
 
+async def _run_lane(manager, name, keywords, fetch, on_result):
+    """
+    Bir kaynağın anahtar kelimelerini, browser_sessions/<name>_session oturumuyla
+    açılan context'in sekme havuzunda eşzamanlı kazı.
+
+    Args:
+        fetch: (anahtar kelime, sayfa) alıp sonuç sözlüğü döndüren async fonksiyon
+        on_result: Her sonuç için çağrılacak fonksiyon
+    """
+    await manager.open_context(name, session_name=f"{name}_session")
+
+    async def scrape_keyword(keyword):
+        async with manager.pooled_page(name) as page:
+            result = await fetch(keyword, page)
+        on_result(result)
+
+    await asyncio.gather(*(scrape_keyword(keyword) for keyword in keywords))
+
+
 @app.command()
 def close(
         browser: str = typer.Option("chromium", help="Kapatılacak tarayıcı (chromium, firefox, webkit)")
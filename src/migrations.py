@@ -0,0 +1,270 @@
+import json
+import logging
+import sqlite3
+
+from .aggregates import UPSERT_AGGREGATES, aggregate_params
+from .timeseries import series_points
+
+logger = logging.getLogger(__name__)
+
+
+async def _create_keyword_search(db):
+    """
+    Alt dize anahtar kelime araması için trigram FTS5 indeksi oluştur.
+
+    Returns:
+        bool: İndeks oluşturulabildiyse True
+    """
+    try:
+        await db.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS keywords_fts USING fts5(
+            keyword,
+            content='keywords',
+            content_rowid='id',
+            tokenize='trigram'
+        )
+        """)
+    except sqlite3.OperationalError as e:
+        # Eski SQLite sürümlerinde trigram tokenizer yok; LIKE taramasına düşülür
+        logger.warning(f"Trigram FTS5 index not available, falling back to LIKE search: {str(e)}")
+        return False
+
+    await db.execute("""
+    CREATE TRIGGER IF NOT EXISTS keywords_fts_insert AFTER INSERT ON keywords BEGIN
+        INSERT INTO keywords_fts(rowid, keyword) VALUES (new.id, new.keyword);
+    END
+    """)
+    await db.execute("""
+    CREATE TRIGGER IF NOT EXISTS keywords_fts_delete AFTER DELETE ON keywords BEGIN
+        INSERT INTO keywords_fts(keywords_fts, rowid, keyword) VALUES ('delete', old.id, old.keyword);
+    END
+    """)
+    await db.execute("INSERT INTO keywords_fts(keywords_fts) VALUES ('rebuild')")
+    return True
+
+
+async def _move_series_to_points(db):
+    """JSON olarak saklanmış zaman serilerini trend_points tablosuna taşı"""
+    async with db.execute(
+            "SELECT id, keyword_id, source_id, data FROM keyword_trends WHERE data IS NOT NULL"
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    moved = []
+    points = []
+    for trend_id, keyword_id, source_id, data in rows:
+        try:
+            series = series_points(json.loads(data))
+        except (TypeError, ValueError):
+            continue
+        if series is None:
+            continue
+        moved.append((trend_id,))
+        points.extend(
+            (trend_id, seq, keyword_id, source_id, ts, value)
+            for seq, (ts, value) in enumerate(series)
+        )
+
+    await db.executemany(
+        """INSERT INTO trend_points (trend_id, seq, keyword_id, source_id, ts, value)
+           VALUES (?, ?, ?, ?, ?, ?)""",
+        points
+    )
+    await db.executemany("UPDATE keyword_trends SET data = NULL WHERE id = ?", moved)
+
+
+async def _backfill_aggregates(db):
+    """Mevcut kayıtların günlük özetlerini kayıt tarihlerine göre oluştur"""
+    async with db.execute(
+            """SELECT id, niche, keyword_id, source_id, source, data, timestamp
+               FROM keyword_trends ORDER BY id"""
+    ) as cursor:
+        rows = await cursor.fetchall()
+
+    series = {}
+    async with db.execute("SELECT trend_id, ts, value FROM trend_points ORDER BY trend_id, seq") as cursor:
+        async for trend_id, ts, value in cursor:
+            series.setdefault(trend_id, {})[ts] = value
+
+    entries = []
+    for trend_id, niche, keyword_id, source_id, source, data, timestamp in rows:
+        if data is None:
+            data = series.get(trend_id)
+        else:
+            try:
+                data = json.loads(data)
+            except (TypeError, ValueError):
+                continue
+        entries.append((niche, keyword_id, source_id, source, data, timestamp))
+
+    await db.executemany(UPSERT_AGGREGATES, aggregate_params(entries))
+
+
+# Şema göçleri: (sürüm, açıklama, adımlar). Adımlar SQL metni veya
+# bağlantıyı alan async fonksiyonlardır. Uygulanan son sürüm
+# PRAGMA user_version içinde tutulur; yeni göçler yalnızca listenin sonuna eklenir.
+MIGRATIONS = [
+    (1, "base tables", [
+        """
+        CREATE TABLE IF NOT EXISTS keyword_trends (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            niche TEXT,
+            keyword TEXT,
+            source TEXT,
+            data TEXT,
+            region TEXT,
+            city TEXT,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS data_sources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            category TEXT,
+            source_name TEXT,
+            source_url TEXT,
+            source_type TEXT,
+            auth_type TEXT,
+            auth_credentials TEXT,
+            scrape_method TEXT,
+            extra_params TEXT
+        )
+        """,
+    ]),
+    (2, "keyword/source lookup tables", [
+        """
+        CREATE TABLE IF NOT EXISTS keywords (
+            id INTEGER PRIMARY KEY,
+            keyword TEXT NOT NULL UNIQUE
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS sources (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+        """,
+        "ALTER TABLE keyword_trends ADD COLUMN keyword_id INTEGER REFERENCES keywords(id)",
+        "ALTER TABLE keyword_trends ADD COLUMN source_id INTEGER REFERENCES sources(id)",
+        """
+        INSERT OR IGNORE INTO keywords (keyword)
+        SELECT DISTINCT keyword FROM keyword_trends WHERE keyword IS NOT NULL
+        """,
+        """
+        INSERT OR IGNORE INTO sources (name)
+        SELECT DISTINCT source FROM keyword_trends WHERE source IS NOT NULL
+        """,
+        """
+        UPDATE keyword_trends SET
+            keyword_id = (SELECT id FROM keywords WHERE keywords.keyword = keyword_trends.keyword),
+            source_id = (SELECT id FROM sources WHERE sources.name = keyword_trends.source)
+        """,
+    ]),
+    (3, "trend indexes", [
+        "CREATE INDEX IF NOT EXISTS idx_trends_niche_ts ON keyword_trends (niche, timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_trends_keyword_source_ts ON keyword_trends (keyword_id, source_id, timestamp)",
+    ]),
+    (4, "keyword substring search", [
+        _create_keyword_search,
+    ]),
+    (5, "time series points", [
+        # seq sözlükteki sırayı korur; ts metni her zaman sıralanabilir değildir
+        """
+        CREATE TABLE IF NOT EXISTS trend_points (
+            trend_id INTEGER NOT NULL REFERENCES keyword_trends(id),
+            seq INTEGER NOT NULL,
+            keyword_id INTEGER,
+            source_id INTEGER,
+            ts TEXT NOT NULL,
+            value REAL NOT NULL,
+            PRIMARY KEY (trend_id, seq)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_points_keyword_source_ts ON trend_points (keyword_id, source_id, ts)",
+        _move_series_to_points,
+    ]),
+    (6, "daily trend aggregates", [
+        # Metrik başına birleştirilebilir özet; analyze ham kayıtları yeniden okumaz
+        """
+        CREATE TABLE IF NOT EXISTS trend_aggregates (
+            niche TEXT NOT NULL,
+            keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+            source_id INTEGER NOT NULL REFERENCES sources(id),
+            day TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value_count INTEGER NOT NULL,
+            value_sum REAL NOT NULL,
+            value_sum_sq REAL NOT NULL,
+            value_min REAL,
+            value_max REAL,
+            value_first REAL,
+            value_last REAL,
+            first_ts TEXT NOT NULL,
+            last_ts TEXT NOT NULL,
+            PRIMARY KEY (niche, keyword_id, source_id, day, metric)
+        ) WITHOUT ROWID
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_aggregates_niche_day ON trend_aggregates (niche, day)",
+        _backfill_aggregates,
+    ]),
+]
+
+
+async def migrate(db):
+    """
+    Bekleyen göçleri sırayla uygula. Her göç kendi transaction'ında çalışır.
+
+    Returns:
+        int: Göçlerden sonraki şema sürümü
+    """
+    async with db.execute("PRAGMA user_version") as cursor:
+        row = await cursor.fetchone()
+    current = row[0] if row else 0
+
+    for version, description, steps in MIGRATIONS:
+        if version <= current:
+            continue
+
+        logger.info(f"Applying schema migration {version}: {description}")
+        await db.execute("BEGIN")
+        try:
+            for step in steps:
+                if callable(step):
+                    await step(db)
+                else:
+                    await db.execute(step)
+            # PRAGMA parametre kabul etmez; sürüm bir tamsayı sabitidir
+            await db.execute(f"PRAGMA user_version = {int(version)}")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        current = version
+
+    return current
+
+
+async def ensure_keyword_search(db):
+    """
+    Trigram indeksi yoksa oluşturmayı yeniden dene. Göç 4 eski bir SQLite ile
+    uygulandıysa indeks atlanmıştır; SQLite güncellendiğinde açılışta oluşturulur.
+
+    Returns:
+        bool: İndeks kullanılabiliyorsa True
+    """
+    async with db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'keywords_fts'"
+    ) as cursor:
+        if await cursor.fetchone() is not None:
+            return True
+
+    await db.execute("BEGIN")
+    try:
+        created = await _create_keyword_search(db)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    if created:
+        logger.info("Created trigram keyword search index")
+    return created
@@ -45,6 +45,13 @@ class OutputManager:
                         "Trend",
                         stat["trend"]
                     )
+                    if "forecast_model" in stat:
+                        stats_table.add_row(
+                            keyword,
+                            "Google Trends",
+                            "Tahmin Modeli",
+                            stat["forecast_model"]
+                        )
                 elif "tweet_count" in stat:  # Twitter istatistikleri
                     stats_table.add_row(
                         keyword,
@@ -129,10 +136,16 @@ class OutputManager:
             # Tahminleme tablosu
             pred_table = Table(title="Tahminler")
             pred_table.add_column("Anahtar Kelime", style="cyan")
-            pred_table.add_column("3 Adımlık Tahmin", style="green")
+            pred_table.add_column("Tahmin", style="green")
+            pred_table.add_column("Güven Aralığı", style="yellow")
 
             for keyword, pred in results["predictions"].items():
-                pred_table.add_row(keyword, ", ".join([f"{p:.2f}" for p in pred]))
+                stat = results.get("stats", {}).get(keyword, {})
+                interval = ", ".join(
+                    f"{low:.2f}-{high:.2f}"
+                    for low, high in zip(stat.get("forecast_lower", []), stat.get("forecast_upper", []))
+                )
+                pred_table.add_row(keyword, ", ".join([f"{p:.2f}" for p in pred]), interval)
 
             self.console.print(pred_table)
 
@@ -143,4 +156,56 @@ class OutputManager:
         with open(filename, "w", encoding="utf-8") as f:
             json.dump(results, f, ensure_ascii=False, indent=2)
 
-        self.console.print(f"[green]Sonuçlar {filename} dosyasına kaydedildi![/green]")
\ No newline at end of file
+        self.console.print(f"[green]Sonuçlar {filename} dosyasına kaydedildi![/green]")
+
+def is_json_array(filename):
+    """Dosya NDJSON yerine JSON dizisi olarak mı yazılmalı (`.json` uzantısı)"""
+    return str(filename).lower().endswith(".json")
+
+
+class NdjsonWriter:
+    """
+    Sonuçları geldikçe satır başına bir JSON nesnesi (NDJSON) olarak dosyaya yazar.
+    Her satır hemen işletim sistemine aktarılır; süreç çökse de yazılanlar kalır.
+    `.json` uzantılı dosyalar eski çıktılarla uyumlu olarak JSON dizisi biçiminde yazılır
+    (dizi dosya kapanınca tamamlanır; eklemeli yazılamaz).
+    """
+
+    def __init__(self, filename, append=False):
+        """
+        Args:
+            append: Dosyanın sonuna ekle (varsayılan: üzerine yaz)
+        """
+        self.filename = filename
+        self.append = append
+        self.array = is_json_array(filename)
+        if self.array and append:
+            raise ValueError(f"Cannot append to a JSON array file: {filename} (use .ndjson)")
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.filename, "a" if self.append else "w", encoding="utf-8")
+        if self.array:
+            self._file.write("[")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def write(self, result):
+        line = json.dumps(result, ensure_ascii=False, default=str)
+        if self.array:
+            line = ("\n" if not self.count else ",\n") + line
+        else:
+            line += "\n"
+        self._file.write(line)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file:
+            if self.array:
+                self._file.write("\n]\n" if self.count else "]\n")
+            self._file.close()
+            self._file = None
@@ -0,0 +1,87 @@
+import json
+
+
+def source_key(source):
+    """Aynı yapılandırmaya sahip kaynaklar için ortak anahtar"""
+    return json.dumps(source, sort_keys=True, default=str)
+
+
+def keyword_key(keyword):
+    """Büyük/küçük harf ve boşluk farklarını yok sayan anahtar kelime anahtarı"""
+    return " ".join(keyword.split()).casefold()
+
+
+class ScrapeJob:
+    """Tek bir (kaynak, anahtar kelime) kazıma işi ve sonucunu bekleyen nişler"""
+
+    def __init__(self, source, keyword):
+        """
+        Args:
+            source: get_scraper'a verilecek kaynak yapılandırması
+            keyword: Kazınacak anahtar kelime (ilk isteyen nişteki yazılışıyla)
+        """
+        self.source = source
+        self.keyword = keyword
+        # (niş, o nişte yazıldığı haliyle anahtar kelime)
+        self.targets = []
+
+    @property
+    def source_name(self):
+        return self.source.get("name", "")
+
+    @property
+    def niches(self):
+        return [niche for niche, _ in self.targets]
+
+
+class ScrapePlan:
+    """
+    Birden fazla nişin (kaynak, anahtar kelime) işlerini tekilleştirir. Aynı
+    kaynak yapılandırması ve anahtar kelimeye sahip işler bir kez çalıştırılır,
+    sonuç kaydedilirken isteyen tüm nişlere dağıtılır.
+    """
+
+    def __init__(self):
+        self._jobs = {}
+        self.requested = 0
+
+    @classmethod
+    def from_config(cls, config, niches=None, scrape_method="playwright"):
+        """
+        config.yaml `niches` bölümünden plan oluştur.
+
+        Args:
+            niches: Niş adları (None: tümü)
+            scrape_method: Tüm kaynaklar için kazıma yöntemi
+        """
+        niche_configs = config.get("niches", {}) or {}
+        plan = cls()
+        for niche in niches or list(niche_configs):
+            niche_config = niche_configs[niche]
+            sources = [{"name": name, "scrape_method": scrape_method} for name in niche_config.get("sources", [])]
+            plan.add(niche, sources, niche_config.get("keywords", []))
+        return plan
+
+    def add(self, niche, sources, keywords):
+        """Bir nişin kaynak × anahtar kelime işlerini plana ekle"""
+        for source in sources:
+            for keyword in keywords:
+                self.requested += 1
+                key = (source_key(source), keyword_key(keyword))
+                job = self._jobs.get(key)
+                if job is None:
+                    job = self._jobs[key] = ScrapeJob(source, keyword)
+                if (niche, keyword) not in job.targets:
+                    job.targets.append((niche, keyword))
+
+    @property
+    def jobs(self):
+        return list(self._jobs.values())
+
+    @property
+    def skipped(self):
+        """Tekilleştirme sayesinde çalıştırılmayacak iş sayısı"""
+        return self.requested - len(self._jobs)
+
+    def __len__(self):
+        return len(self._jobs)
@@ -0,0 +1,151 @@
+import asyncio
+import logging
+import random
+import time
+
+from .planner import keyword_key, source_key
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshScheduler:
+    """
+    Plandaki (kaynak, anahtar kelime) işlerini sürekli çalıştırır. Her iş,
+    kaynağının yenileme aralığı (± jitter) dolunca yeniden kazınır; verisi hâlâ
+    taze olan işler atlanır. Motor (HTTP havuzu, tarayıcı) çalıştırmalar
+    arasında açık kalır.
+    """
+
+    def __init__(self, engine, intervals=None, default_interval=3600, jitter=0.1, retry_interval=300, limit=10):
+        """
+        Args:
+            engine: İşleri çalıştıracak ScrapeEngine
+            intervals: Kaynak adı -> yenileme aralığı (sn)
+            default_interval: Sözlükte olmayan kaynakların yenileme aralığı (sn)
+            jitter: Aralığa uygulanacak rastgele sapma oranı (0.1: ±%10); işlerin aynı anda yığılmasını önler
+            retry_interval: Hata veren işin yeniden deneneceği süre (sn)
+            limit: Her iş için sonuç limiti
+        """
+        self.engine = engine
+        self.intervals = intervals or {}
+        self.default_interval = default_interval
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.limit = limit
+        # İş anahtarı -> bir sonraki çalışma zamanı (Unix)
+        self.next_run = {}
+        self._running = {}
+
+    @classmethod
+    def from_config(cls, config, engine):
+        """config.yaml içindeki `scheduler` bölümünden zamanlayıcı oluştur"""
+        options = (config or {}).get("scheduler", {}) or {}
+        return cls(
+            engine,
+            intervals=options.get("intervals"),
+            default_interval=options.get("default_interval", 3600),
+            jitter=options.get("jitter", 0.1),
+            retry_interval=options.get("retry_interval", 300),
+            limit=options.get("limit", 10)
+        )
+
+    @staticmethod
+    def key(job):
+        return source_key(job.source), keyword_key(job.keyword)
+
+    def interval_for(self, source_name):
+        interval = self.intervals.get(source_name, self.default_interval)
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def seed(self, jobs, last_scraped):
+        """
+        İlk çalışma zamanlarını veritabanındaki son kazıma zamanlarından belirle.
+
+        Args:
+            last_scraped: (niş, anahtar kelime, kaynak) -> Unix zamanı (Database.get_last_scraped)
+        """
+        now = time.time()
+        fresh = 0
+        for job in jobs:
+            # İş, isteyen tüm nişlerde taze ise atlanır
+            times = [last_scraped.get((niche, keyword, job.source_name)) for niche, keyword in job.targets]
+            if times and all(times):
+                due = min(times) + self.interval_for(job.source_name)
+            else:
+                due = now
+            if due > now:
+                fresh += 1
+            self.next_run[self.key(job)] = due
+        logger.info(f"{fresh} of {len(jobs)} jobs are still fresh and will be skipped until due")
+
+    def due(self, jobs, now=None):
+        """Zamanı gelmiş ve kaynağı şu anda çalışmayan işler (kaynak anahtarına göre gruplu)"""
+        now = now if now is not None else time.time()
+        groups = {}
+        for job in jobs:
+            key = self.key(job)
+            if key[0] in self._running or self.next_run.get(key, now) > now:
+                continue
+            groups.setdefault(key[0], []).append(job)
+        return groups
+
+    async def _run_group(self, jobs, on_result):
+        failed = set()
+        try:
+            async for result, job in self.engine.stream_jobs(jobs, limit=self.limit):
+                # Bazı scraper'lar (örn. Google Trends) hatayı data içinde döndürür
+                data = result.get("data")
+                if "error" in result or (isinstance(data, dict) and data.get("error")):
+                    failed.add(self.key(job))
+                await on_result(result, job)
+        except Exception as e:
+            logger.error(f"Scheduled run of {jobs[0].source_name} failed: {str(e)}")
+            failed.update(self.key(job) for job in jobs)
+        finally:
+            now = time.time()
+            for job in jobs:
+                key = self.key(job)
+                if key in failed:
+                    self.next_run[key] = now + self.retry_interval
+                else:
+                    self.next_run[key] = now + self.interval_for(job.source_name)
+
+    def _finished(self, group_key, event):
+        self._running.pop(group_key, None)
+        event.set()
+
+    async def run_forever(self, jobs, on_result, stop=None, tick=30.0):
+        """
+        stop ayarlanana kadar zamanı gelen işleri çalıştır. Aynı kaynağın yeni
+        turu, önceki turu bitmeden başlamaz; farklı kaynaklar eşzamanlı çalışır.
+
+        Args:
+            jobs: ScrapeJob listesi (örn. ScrapePlan.jobs)
+            on_result: Her sonuç için (sonuç, iş) ile çağrılacak async fonksiyon
+            stop: Ayarlanınca döngüyü bitiren asyncio.Event
+            tick: Zamanı gelen iş olmasa da en fazla bu kadar saniyede bir kontrol et
+        """
+        stop = stop or asyncio.Event()
+        # Bir tur bitince yeni çalışma zamanları hesaplanır; döngü beklemeden uyanır
+        finished = asyncio.Event()
+        try:
+            while not stop.is_set():
+                for group_key, group in self.due(jobs).items():
+                    logger.info(f"Refreshing {len(group)} {group[0].source_name} jobs")
+                    task = asyncio.create_task(self._run_group(group, on_result))
+                    self._running[group_key] = task
+                    task.add_done_callback(lambda _, group_key=group_key: self._finished(group_key, finished))
+
+                upcoming = [due for key, due in self.next_run.items() if key[0] not in self._running]
+                wait = min(upcoming, default=time.time() + tick) - time.time()
+                finished.clear()
+                waiters = [asyncio.ensure_future(stop.wait()), asyncio.ensure_future(finished.wait())]
+                await asyncio.wait(waiters, timeout=max(0.1, min(wait, tick)), return_when=asyncio.FIRST_COMPLETED)
+                for waiter in waiters:
+                    waiter.cancel()
+        finally:
+            # Yarım kalan turlar iptal edilir; bir sonraki başlatmada tazelik veritabanından okunur
+            tasks = list(self._running.values())
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -20,78 +20,84 @@ from .playwright.google import GoogleTrendsPlaywrightScraper
 from .playwright.twitter import TwitterPlaywrightScraper
 
 
-def get_scraper(source_config):
+def get_scraper(source_config, http_client=None, browser_pool=None):
+    """
+    Args:
+        source_config: Kaynak yapılandırması (name, scrape_method, ...)
+        http_client: Scraper'lara verilecek paylaşılan HttpClientManager
+        browser_pool: Playwright scraper'larının sekme alacağı BrowserPool
+    """
     source_type = source_config.get("name", "").lower()
     scrape_method = source_config.get("scrape_method", "playwright").lower()
 
     # Playwright tabanlı scraperlar (varsayılan)
     if scrape_method == "playwright":
         if source_type == "google_trends":
-            return GoogleTrendsPlaywrightScraper(source_config)
+            return GoogleTrendsPlaywrightScraper(source_config, http_client=http_client, browser_pool=browser_pool)
         elif source_type == "twitter":
-            return TwitterPlaywrightScraper(source_config)
+            return TwitterPlaywrightScraper(source_config, http_client=http_client, browser_pool=browser_pool)
         # Diğer Playwright scraperlar eklendikçe buraya eklenecek
         else:
             # Varsayılan olarak Twitter playwright scraper kullanın
             # Diğer scraperlar eklendikçe kademeli olarak genişletin
-            return TwitterPlaywrightScraper(source_config)
+            return TwitterPlaywrightScraper(source_config, http_client=http_client, browser_pool=browser_pool)
 
     # API tabanlı scraperlar
     elif scrape_method == "api":
         if source_type == "google_trends":
-            return GoogleTrendsScraper(source_config)
+            return GoogleTrendsScraper(source_config, http_client=http_client)
         elif source_type == "twitter":
-            return TwitterScraper(source_config)
+            return TwitterScraper(source_config, http_client=http_client)
         elif source_type == "reddit":
-            return RedditScraper(source_config)
+            return RedditScraper(source_config, http_client=http_client)
         elif source_type == "hackernews":
-            return HackerNewsScraper(source_config)
+            return HackerNewsScraper(source_config, http_client=http_client)
         elif source_type == "instagram":
-            return InstagramScraper(source_config)
+            return InstagramScraper(source_config, http_client=http_client)
         elif source_type == "youtube":
-            return YouTubeScraper(source_config)
+            return YouTubeScraper(source_config, http_client=http_client)
         elif source_type == "news":
-            return NewsScraper(source_config)
+            return NewsScraper(source_config, http_client=http_client)
         elif source_type == "pinterest":
-            return PinterestScraper(source_config)
+            return PinterestScraper(source_config, http_client=http_client)
         elif source_type == "linkedin":
-            return LinkedInScraper(source_config)
+            return LinkedInScraper(source_config, http_client=http_client)
         elif source_type == "amazon":
-            return AmazonScraper(source_config)
+            return AmazonScraper(source_config, http_client=http_client)
         elif source_type == "ebay":
-            return EbayScraper(source_config)
+            return EbayScraper(source_config, http_client=http_client)
         elif source_type == "otto":
-            return OttoScraper(source_config)
+            return OttoScraper(source_config, http_client=http_client)
         else:
             # Varsayılan olarak Twitter scraper kullanın
-            return TwitterScraper(source_config)
+            return TwitterScraper(source_config, http_client=http_client)
 
     # Mock veri için API scraperlarını kullanın
     else:  # mock veya diğer seçenekler
         if source_type == "google_trends":
-            return GoogleTrendsScraper(source_config)
+            return GoogleTrendsScraper(source_config, http_client=http_client)
         elif source_type == "twitter":
-            return TwitterScraper(source_config)
+            return TwitterScraper(source_config, http_client=http_client)
         elif source_type == "reddit":
-            return RedditScraper(source_config)
+            return RedditScraper(source_config, http_client=http_client)
         elif source_type == "hackernews":
-            return HackerNewsScraper(source_config)
+            return HackerNewsScraper(source_config, http_client=http_client)
         elif source_type == "instagram":
-            return InstagramScraper(source_config)
+            return InstagramScraper(source_config, http_client=http_client)
         elif source_type == "youtube":
-            return YouTubeScraper(source_config)
+            return YouTubeScraper(source_config, http_client=http_client)
         elif source_type == "news":
-            return NewsScraper(source_config)
+            return NewsScraper(source_config, http_client=http_client)
         elif source_type == "pinterest":
-            return PinterestScraper(source_config)
+            return PinterestScraper(source_config, http_client=http_client)
         elif source_type == "linkedin":
-            return LinkedInScraper(source_config)
+            return LinkedInScraper(source_config, http_client=http_client)
         elif source_type == "amazon":
-            return AmazonScraper(source_config)
+            return AmazonScraper(source_config, http_client=http_client)
         elif source_type == "ebay":
-            return EbayScraper(source_config)
+            return EbayScraper(source_config, http_client=http_client)
         elif source_type == "otto":
-            return OttoScraper(source_config)
+            return OttoScraper(source_config, http_client=http_client)
         else:
             # Varsayılan olarak Twitter scraper kullanın
-            return TwitterScraper(source_config)
\ No newline at end of file
+            return TwitterScraper(source_config, http_client=http_client)
\ No newline at end of file
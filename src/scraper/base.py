@@ -1,11 +1,58 @@
+import asyncio
+import logging
+
 import aiohttp
 from abc import ABC, abstractmethod
 
+from .cache import CachedResponse
+from .ratelimit import get_rate_limits
+
+logger = logging.getLogger(__name__)
+
+
+async def stream_keywords(scraper, keywords, limit=10):
+    """
+    scraper.scrape'i her anahtar kelime için ayrı çağırır ve sonuçları tamamlanma
+    sırasıyla üretir (async generator). Aynı anda en fazla scraper.max_concurrency
+    çağrı çalışır; hata veren anahtar kelime için "error" alanlı sonuç üretilir.
+    """
+    semaphore = asyncio.Semaphore(scraper.max_concurrency or max(1, len(keywords)))
+
+    async def scrape_one(keyword):
+        async with semaphore:
+            try:
+                return await scraper.scrape([keyword], limit=limit)
+            except Exception as e:
+                source = scraper.config.get("name", "")
+                logger.error(f"Scraping error ({source}, {keyword}): {str(e)}")
+                return [{"keyword": keyword, "source": source, "error": str(e)}]
+
+    tasks = [asyncio.ensure_future(scrape_one(keyword)) for keyword in keywords]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for result in await next_done:
+                yield result
+    finally:
+        # Tüketici erken bırakırsa kalan istekler iptal edilir
+        for task in tasks:
+            task.cancel()
+
 
 class BaseScraper(ABC):
-    def __init__(self, source_config):
+    # Aynı örnek üzerinde eşzamanlı çalışabilecek scrape çağrısı sınırı (None: sınırsız)
+    max_concurrency = None
+
+    def __init__(self, source_config, http_client=None):
+        """
+        Args:
+            source_config: Kaynak yapılandırması
+            http_client: Paylaşılan HttpClientManager; verilmezse scraper kendi oturumunu açar
+        """
         self.config = source_config
+        self.http_client = http_client
+        self.rate_limits = get_rate_limits()
         self.session = None
+        self._owns_session = False
 
     async def __aenter__(self):
         await self.init_session()
@@ -15,14 +62,87 @@ class BaseScraper(ABC):
         await self.close()
 
     async def init_session(self):
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
+        if self.session is None or self.session.closed:
+            if self.http_client:
+                self.session = await self.http_client.get_session()
+                self._owns_session = False
+            else:
+                self.session = aiohttp.ClientSession()
+                self._owns_session = True
 
     @abstractmethod
     async def scrape(self, keywords, limit=10):
         pass
 
+    def scrape_stream(self, keywords, limit=10):
+        """Her anahtar kelimenin sonucunu hazır olur olmaz üret (async for ile kullanılır)"""
+        return stream_keywords(self, keywords, limit)
+
+    @property
+    def cache(self):
+        return self.http_client.cache if self.http_client else None
+
+    async def fetch(self, url, params=None, headers=None, limiter=None):
+        """
+        GET isteği gönder ve gövdeyi oku. HttpClientManager'da yanıt önbelleği
+        varsa taze kayıt ağa çıkmadan döner; süresi dolmuş kayıt ETag /
+        Last-Modified ile yeniden doğrulanır, ağ hatasında eski kayıt kullanılır.
+
+        Args:
+            limiter: Ağa çıkan her istekten önce acquire(), yanıttan sonra
+                update(headers) çağrılacak hız sınırlayıcı
+
+        Returns:
+            CachedResponse
+        """
+        await self.init_session()
+        cache = self.cache
+        if cache is None:
+            return await self._get(url, params, headers, limiter)
+
+        key = cache.key("GET", url, params)
+        ttl = cache.ttl_for(self.config.get("name"))
+        cached = await cache.get(key)
+        if cached and cached.fresh:
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached:
+            request_headers.update(cached.validators())
+        try:
+            response = await self._get(url, params, request_headers, limiter)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if cached is None:
+                raise
+            logger.warning(f"Request to {url} failed ({str(e)}), using stale cached response")
+            return cached
+
+        if response.status == 304 and cached:
+            await cache.refresh(key, cached, ttl)
+            return cached
+        if response.status == 200:
+            await cache.put(key, response, ttl)
+        return response
+
+    async def _get(self, url, params=None, headers=None, limiter=None):
+        async def send():
+            if limiter:
+                await limiter.acquire()
+            result = None
+            try:
+                async with self.session.get(url, params=params, headers=headers) as response:
+                    body = await response.read()
+                    result = CachedResponse(str(response.url), response.status, response.headers, body)
+            finally:
+                if limiter:
+                    limiter.update(result.headers if result else {})
+            return result.status, result.headers, result
+
+        # Kaynak/host kovası, 429 uyarlaması ve 429/5xx/ağ hatası yeniden denemesi
+        return await self.rate_limits.run(self.config.get("name", ""), url, send)
+
     async def close(self):
-        if self.session:
+        # Paylaşılan oturum HttpClientManager tarafından kapatılır
+        if self.session and self._owns_session:
             await self.session.close()
-            self.session = None
\ No newline at end of file
+        self.session = None
@@ -0,0 +1,184 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from yarl import URL
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used);
+"""
+
+# En son kullanılanlardan geriye doğru toplam boyut sınırı aşan kayıtları sil (LRU)
+EVICT = """
+DELETE FROM responses WHERE key IN (
+    SELECT key FROM (
+        SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS kept FROM responses
+    ) WHERE kept > ?
+)
+"""
+
+
+class CachedResponse:
+    """
+    Gövdesi tamamen okunmuş HTTP yanıtı; ağdan veya önbellekten gelebilir.
+    Başlık adları küçük harfle tutulur.
+    """
+
+    def __init__(self, url, status, headers, body, expires_at=0.0, from_cache=False):
+        self.url = url
+        self.status = status
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self.body = body
+        self.expires_at = expires_at
+        self.from_cache = from_cache
+
+    @property
+    def fresh(self):
+        return self.expires_at > time.time()
+
+    def validators(self):
+        """Yeniden doğrulama (304) için koşullu istek başlıkları"""
+        headers = {}
+        if self.headers.get("etag"):
+            headers["If-None-Match"] = self.headers["etag"]
+        if self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+    def text(self):
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """
+    API yanıtları için SQLite tabanlı kalıcı önbellek. Anahtar, normalize
+    edilmiş URL ve sorgu parametreleridir. Süresi dolan kayıtlar ETag /
+    Last-Modified ile yeniden doğrulanır; toplam boyut sınırı aşılınca en
+    uzun süredir kullanılmayanlar silinir.
+    """
+
+    def __init__(self, path="http_cache.db", default_ttl=3600, ttls=None, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            path: Önbellek veritabanı dosyası
+            default_ttl: Kaynak için ayrıca belirtilmemişse kaydın taze kalma süresi (sn)
+            ttls: Kaynak adı -> taze kalma süresi (sn)
+            max_bytes: Gövdelerin toplam boyut sınırı
+        """
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._bytes = 0
+        # sqlite3 bağlantısı iş parçacıkları arasında paylaşılır, erişim sıralanır
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, options):
+        """config.yaml içindeki `http.cache` sözlüğünden önbellek oluştur"""
+        options = options or {}
+        return cls(
+            path=options.get("path", "http_cache.db"),
+            default_ttl=options.get("default_ttl", 3600),
+            ttls=options.get("ttl"),
+            max_bytes=int(options.get("max_mb", 64) * 1024 * 1024)
+        )
+
+    def ttl_for(self, source):
+        return self.ttls.get(source, self.default_ttl)
+
+    @staticmethod
+    def key(method, url, params=None):
+        """Yöntem + host'u küçük harfli, sorgu parametreleri sıralı URL'nin özeti"""
+        url = URL(url)
+        if params:
+            url = url.update_query({k: str(v) for k, v in params.items()})
+        url = url.with_query(sorted(url.query.items())).with_fragment(None)
+        return hashlib.sha256(f"{method.upper()} {url}".encode()).hexdigest()
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        return self._conn
+
+    def _get(self, key):
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT url, status, headers, body, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        return CachedResponse(row[0], row[1], json.loads(row[2]), row[3], row[4], from_cache=True)
+
+    def _put(self, key, response, ttl):
+        now = time.time()
+        expires_at = now + ttl
+        with self._lock:
+            conn = self._connection()
+            old = conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            conn.execute(
+                """INSERT OR REPLACE INTO responses
+                   (key, url, status, headers, body, expires_at, last_used, size)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (key, response.url, response.status, json.dumps(response.headers), response.body,
+                 expires_at, now, len(response.body))
+            )
+            self._bytes += len(response.body) - (old[0] if old else 0)
+            if self._bytes > self.max_bytes:
+                conn.execute(EVICT, (self.max_bytes,))
+                self._bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            conn.commit()
+        response.expires_at = expires_at
+
+    def _refresh(self, key, ttl):
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("UPDATE responses SET expires_at = ?, last_used = ? WHERE key = ?", (now + ttl, now, key))
+            conn.commit()
+        return now + ttl
+
+    async def get(self, key):
+        """Kaydı döndür (süresi dolmuş olabilir, bkz. CachedResponse.fresh) veya None"""
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(self, key, response, ttl):
+        """Yanıtı ttl saniye taze kalacak şekilde kaydet"""
+        await asyncio.to_thread(self._put, key, response, ttl)
+
+    async def refresh(self, key, response, ttl):
+        """304 sonrası: kaydı yeniden ttl saniye taze say"""
+        response.expires_at = await asyncio.to_thread(self._refresh, key, ttl)
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,41 +1,185 @@
-import aiohttp
-import json
-from pytrends.request import TrendReq
-import pandas as pd
 import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pytrends.exceptions import ResponseError
+from pytrends.request import TrendReq
 from .base import BaseScraper
 
+logger = logging.getLogger(__name__)
+
+TRENDS_URL = "https://trends.google.com/trends/api/widgetdata/multiline"
+
+# Google Trends tek istekte en fazla beş terimi karşılaştırır
+MAX_TERMS = 5
+
+
+class TrendsClient:
+    """
+    pytrends isteklerini sınırlı bir iş parçacığı havuzunda çalıştırır. Her iş
+    parçacığı kendi TrendReq nesnesini (Google çerezleri) bir kez oluşturup
+    yeniden kullanır; TrendReq payload'u nesne üzerinde tuttuğu için iş
+    parçacıkları arasında paylaşılmaz.
+    """
+
+    def __init__(self, hl="tr-TR", tz=180, timeframe="today 3-m", anchor=None, max_workers=2):
+        """
+        Args:
+            timeframe: pytrends zaman aralığı
+            anchor: Her karşılaştırma grubuna eklenen ortak terim; değerler bu
+                terimin ortalamasına (=100) göre ölçeklenir ve gruplar arası karşılaştırılabilir olur
+            max_workers: Aynı anda çalışabilecek pytrends isteği
+        """
+        self.hl = hl
+        self.tz = tz
+        self.timeframe = timeframe
+        self.anchor = anchor
+        self.max_workers = max(1, max_workers)
+        self._executor = None
+        self._local = threading.local()
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `google_trends` bölümünden oluştur"""
+        options = (config or {}).get("google_trends", {}) or {}
+        return cls(
+            hl=options.get("hl", "tr-TR"),
+            tz=options.get("tz", 180),
+            timeframe=options.get("timeframe", "today 3-m"),
+            anchor=options.get("anchor"),
+            max_workers=options.get("max_workers", 2)
+        )
+
+    def _trendreq(self):
+        trendreq = getattr(self._local, "trendreq", None)
+        if trendreq is None:
+            trendreq = self._local.trendreq = TrendReq(hl=self.hl, tz=self.tz)
+        return trendreq
+
+    def _interest_over_time(self, terms):
+        trendreq = self._trendreq()
+        trendreq.build_payload(terms, cat=0, timeframe=self.timeframe)
+        return trendreq.interest_over_time()
+
+    async def interest_over_time(self, terms):
+        """En fazla beş terimin ilgi zaman serisini (DataFrame) havuzda al"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pytrends")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._interest_over_time, list(terms))
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_default = None
+
+
+def configure_trends(config):
+    """pytrends istemcisini config.yaml'dan oluştur"""
+    global _default
+    if _default is not None:
+        _default.close()
+    _default = TrendsClient.from_config(config)
+    return _default
+
+
+def get_trends_client():
+    """Süreç genelindeki pytrends istemcisini döndür"""
+    global _default
+    if _default is None:
+        _default = TrendsClient()
+    return _default
+
 
 class GoogleTrendsScraper(BaseScraper):
-    async def scrape(self, keywords, limit=10):
-        results = []
+    """
+    Çapa terimi verilmişse anahtar kelimeleri çapa + dörtlü gruplarda sorgular
+    (her grup tek bir Google Trends isteği) ve değerleri çapaya göre ölçekler.
+    Çapa yoksa her anahtar kelime kendi 0-100 serisiyle ayrı istekte sorgulanır;
+    aynı isteğe konan ilgisiz kelimeler birbirine göre ölçeklenip karşılaştırılamaz olurdu.
+    """
 
-        # Google Trends için eş zamanlı olmayan bir yaklaşım kullanıyoruz
-        # pytrends kütüphanesi doğrudan asenkron değil
-        for keyword in keywords:
-            # Senkron kodu asyncio.to_thread ile çalıştırıyoruz
-            data = await asyncio.to_thread(self._get_trend_data, keyword)
+    def __init__(self, source_config, http_client=None):
+        super().__init__(source_config, http_client=http_client)
+        self.client = get_trends_client()
+        self.anchor = (source_config.get("extra_params") or {}).get("anchor", self.client.anchor)
 
-            results.append({
-                "keyword": keyword,
-                "source": "google_trends",
-                "data": data
-            })
+    @property
+    def batch_size(self):
+        """Tek istekte sorgulanan anahtar kelime sayısı (çapa terimi bir yer kaplar; çapasız tek kelime)"""
+        return MAX_TERMS - 1 if self.anchor else 1
 
-        return results
+    def batches(self, keywords):
+        keywords = [keyword for keyword in dict.fromkeys(keywords)]
+        return [keywords[i:i + self.batch_size] for i in range(0, len(keywords), self.batch_size)]
 
-    def _get_trend_data(self, keyword):
-        # Google Trends API'si için pytrends
-        pytrends = TrendReq(hl='tr-TR', tz=180)
-        pytrends.build_payload([keyword], cat=0, timeframe='today 3-m')
+    async def scrape(self, keywords, limit=10):
+        return [result async for result in self.scrape_stream(keywords, limit)]
 
+    async def scrape_stream(self, keywords, limit=10):
+        """Grupları havuzda eşzamanlı sorgula, her grubun sonuçlarını hazır olunca üret"""
+        tasks = [asyncio.ensure_future(self._scrape_batch(batch)) for batch in self.batches(keywords)]
         try:
-            interest_over_time_df = pytrends.interest_over_time()
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
 
-            if not interest_over_time_df.empty:
-                # DataFrame'i dictionary'e çeviriyoruz
-                return interest_over_time_df[keyword].to_dict()
-            else:
-                return {"error": "No data found for this keyword"}
+    async def _scrape_batch(self, batch):
+        terms = list(batch)
+        if self.anchor and self.anchor not in terms:
+            terms.insert(0, self.anchor)
+
+        async def send():
+            try:
+                return 200, {}, await self.client.interest_over_time(terms)
+            except ResponseError as e:
+                # pytrends HTTP hatalarını istisna olarak yükseltir; 429'da hız
+                # sınırlayıcının yavaşlayıp yeniden denemesi için durum kodu döndürülür
+                return e.response.status_code, e.response.headers, e
+
+        try:
+            frame = await self.rate_limits.run(self.config.get("name", "google_trends"), TRENDS_URL, send)
+            if isinstance(frame, Exception):
+                raise frame
         except Exception as e:
-            return {"error": str(e)}
\ No newline at end of file
+            return [self._result(keyword, {"error": str(e)}) for keyword in batch]
+
+        if frame.empty:
+            return [self._result(keyword, {"error": "No data found for this keyword"}) for keyword in batch]
+
+        scale = None
+        if self.anchor:
+            anchor_mean = frame[self.anchor].mean() if self.anchor in frame else 0
+            if anchor_mean > 0:
+                scale = 100.0 / anchor_mean
+            else:
+                logger.warning(f"Anchor term '{self.anchor}' has no interest; values of {batch} are not normalized")
+
+        results = []
+        for keyword in batch:
+            try:
+                series = frame[keyword]
+                if scale is not None:
+                    series = (series * scale).round(2)
+                # DataFrame'i dictionary'e çeviriyoruz
+                results.append(self._result(keyword, series.to_dict()))
+            except Exception as e:
+                # Eksik sütun yalnızca o anahtar kelimeyi etkiler
+                logger.warning(f"No Google Trends column for '{keyword}': {str(e)}")
+                results.append(self._result(keyword, {"error": f"No data found for this keyword ({str(e)})"}))
+        return results
+
+    @staticmethod
+    def _result(keyword, data):
+        return {
+            "keyword": keyword,
+            "source": "google_trends",
+            "data": data
+        }
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+
+import aiohttp
+
+from .cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientManager:
+    """
+    Tüm API scraper'larının paylaştığı tek aiohttp oturumu. Bağlantılar
+    (keep-alive), TLS oturumları ve DNS sonuçları kaynaklar ve çalıştırmalar
+    arasında yeniden kullanılır.
+    """
+
+    def __init__(self, limit=100, limit_per_host=10, dns_cache_ttl=300, keepalive_timeout=30,
+                 total_timeout=60, connect_timeout=10, read_timeout=30, cache=None):
+        """
+        Args:
+            limit: Toplam açık bağlantı sınırı
+            limit_per_host: Aynı host'a açık bağlantı sınırı
+            dns_cache_ttl: DNS sonuçlarının önbellekte tutulma süresi (sn)
+            keepalive_timeout: Boştaki bağlantının açık tutulma süresi (sn)
+            total_timeout: Bir isteğin toplam süre sınırı (sn)
+            connect_timeout: Bağlantı kurma süre sınırı (sn)
+            read_timeout: Yanıttan okuma süre sınırı (sn)
+            cache: BaseScraper.fetch'in kullanacağı ResponseCache (None: önbellek yok)
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = aiohttp.ClientTimeout(
+            total=total_timeout, connect=connect_timeout, sock_read=read_timeout)
+        self.cache = cache
+        self.session = None
+        self._loop = None
+        self._lock = None
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `http` bölümünden yönetici oluştur"""
+        options = (config or {}).get("http", {}) or {}
+        cache_options = options.get("cache") or {}
+        return cls(
+            limit=options.get("limit", 100),
+            limit_per_host=options.get("limit_per_host", 10),
+            dns_cache_ttl=options.get("dns_cache_ttl", 300),
+            keepalive_timeout=options.get("keepalive_timeout", 30),
+            total_timeout=options.get("total_timeout", 60),
+            connect_timeout=options.get("connect_timeout", 10),
+            read_timeout=options.get("read_timeout", 30),
+            cache=ResponseCache.from_config(cache_options) if cache_options.get("enabled") else None
+        )
+
+    async def get_session(self):
+        """Paylaşılan oturumu döndür; kapalıysa veya başka bir event loop'a aitse yeniden aç"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Oturum önceki asyncio.run çağrısının loop'una bağlıdır, orada kapanmış olmalıdır
+            self.session = None
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if self.session is None or self.session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout
+                )
+                self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+        return self.session
+
+    async def close(self):
+        """Oturumu, tüm bağlantıları ve önbellek dosyasını kapat"""
+        if self.session and not self.session.closed:
+            try:
+                await self.session.close()
+            except Exception as e:
+                logger.error(f"Error closing HTTP session: {str(e)}")
+        self.session = None
+        if self.cache:
+            self.cache.close()
+
+
+_default = None
+
+
+def get_http_client(config=None):
+    """
+    Süreç genelindeki HTTP istemcisini döndür. İlk çağrıda verilen
+    yapılandırmanın `http` bölümüyle oluşturulur.
+    """
+    global _default
+    if _default is None:
+        _default = HttpClientManager.from_config(config)
+    return _default
@@ -3,13 +3,71 @@ import json
 import time
 import logging
 import asyncio
+from contextlib import asynccontextmanager
+
 from playwright.async_api import async_playwright
 
+from .playwright.pacing import PacingPolicy
+from .playwright.profile import BrowserProfile
+from .playwright.screenshots import ScreenshotPipeline
+from .playwright.twitter import SEARCH_TIMELINE, TweetHarvester
+from .playwright.readiness import FunctionSignal, Readiness, ResponseSignal, SelectorSignal
+
 logger = logging.getLogger(__name__)
 
+# Otomasyon izlerini gizleyen, her sayfada çalışan betik
+STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => false,
+});
+
+// Chrome detectionlarını bypass et
+window.chrome = {
+    runtime: {},
+};
+
+// Navigator parametrelerini ekleme
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['tr-TR', 'tr', 'en-US', 'en'],
+});
+
+// Automation flags'i gizle
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [
+        {
+            0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+            description: "Portable Document Format",
+            filename: "internal-pdf-viewer",
+            length: 1,
+            name: "Chrome PDF Plugin"
+        },
+        {
+            0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+            description: "Portable Document Format",
+            filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+            length: 1,
+            name: "Chrome PDF Viewer"
+        }
+    ],
+});
+"""
+
 # Global değişkenler - persistent browser instance
 _playwright = None
 _browser = None
+# Eşzamanlı açılan context'lerin (örn. hibrit kulvarlar) tek tarayıcı başlatması için
+_launch_lock = None
+_launch_loop = None
+
+
+def _get_launch_lock():
+    """Çalışan event loop'a bağlı tarayıcı başlatma kilidi"""
+    global _launch_lock, _launch_loop
+    loop = asyncio.get_running_loop()
+    if _launch_loop is not loop:
+        _launch_loop = loop
+        _launch_lock = asyncio.Lock()
+    return _launch_lock
 
 
 class HybridScrapingManager:
@@ -18,16 +76,30 @@ class HybridScrapingManager:
     Otomatik tarama ve kullanıcı müdahalesi kombinasyonuyla çalışır.
     """
 
-    def __init__(self, session_dir="browser_sessions", keep_open=True, browser_type="chromium"):
+    def __init__(self, session_dir="browser_sessions", keep_open=True, browser_type="chromium", pacing=None,
+                 profile=None, screenshots=None, pages_per_context=2):
         """
         Args:
             session_dir: Oturumların kaydedileceği dizin
             keep_open: Tarayıcı penceresini açık tutma
             browser_type: Kullanılacak tarayıcı türü ('firefox', 'chromium', 'webkit')
+            pacing: Adımlar arası gecikmeler (PacingPolicy)
+            profile: BrowserProfile; elle giriş için görünür "debug" profili gerekir
+            screenshots: Ekran görüntüsü politikası ve yazıcısı (ScreenshotPipeline)
+            pages_per_context: Adlandırılmış her context'te aynı anda açık olabilecek en fazla sekme
         """
         self.session_dir = session_dir
+        self.pacing = pacing or PacingPolicy()
+        self.profile = profile or BrowserProfile()
+        self.screenshots = screenshots or ScreenshotPipeline()
+        # Giriş akışının kullandığı varsayılan context ve sayfa
         self.context = None
         self.page = None
+        # Adlandırılmış context'ler (örn. "google", "twitter") ve sekme havuzları
+        self.pages_per_context = max(1, pages_per_context)
+        self.contexts = {}
+        self._idle = {}
+        self._slots = {}
         self.keep_open = keep_open
         self.browser_type = browser_type.lower()
 
@@ -42,7 +114,41 @@ class HybridScrapingManager:
         await self.close_context()  # Sadece context'i kapat, tarayıcıyı değil
 
     async def init_browser(self, session_name=None):
-        """Tarayıcıyı başlat ve (varsa) oturum bilgilerini yükle"""
+        """Tarayıcıyı başlat ve (varsa) oturum bilgileriyle varsayılan context'i ve sayfayı aç"""
+        global _playwright, _browser
+
+        await self._launch_browser()
+        self.context = await self._new_context(session_name)
+
+        try:
+            self.page = await self.context.new_page()
+        except Exception as e:
+            logger.error(f"Error creating new page: {str(e)}")
+            print(f"\n[bold red]❌ Yeni sayfa oluşturulamadı: {str(e)}[/bold red]")
+
+            # Browser'ı temizle ve yeniden dene
+            if _browser:
+                await _browser.close()
+                _browser = None
+
+            # Chromium'u dene
+            _browser = await _playwright.chromium.launch(**self.profile.launch_options())
+            print("\n[bold green]✓ Chromium tarayıcı yeniden başlatıldı.[/bold green]")
+
+            self.contexts = {}
+            self._idle = {}
+            self._slots = {}
+            self.context = await self._new_context(session_name)
+            self.page = await self.context.new_page()
+            self.browser_type = "chromium"
+
+    async def _launch_browser(self):
+        """Süreç genelindeki tarayıcıyı (yoksa) başlat"""
+        # Kilidi bekleyen ikinci çağrı, ilkinin başlattığı tarayıcıyı kullanır
+        async with _get_launch_lock():
+            await self._start_browser()
+
+    async def _start_browser(self):
         global _playwright, _browser
 
         # Eğer global tarayıcı yoksa, başlat
@@ -51,11 +157,9 @@ class HybridScrapingManager:
 
         # Browser varsa ve açıksa, mevcut browseri kullan
         if _browser is None:
-            # Tarayıcı başlatma ayarları
-            launch_args = {
-                "headless": False,  # Kesinlikle görünür mod
-                "slow_mo": 50,  # İşlemleri biraz yavaşlat (daha stabil)
-            }
+            # Tarayıcı başlatma ayarları (profile göre görünür/görünmez, slow_mo)
+            launch_args = self.profile.launch_options()
+            mode = "görünmez" if self.profile.headless else "görünür"
 
             # Varsayılan tarayıcıyı Chromium yap - Firefox'ta çoklu sekme sorunu var
             browser_launched = False
@@ -66,12 +170,12 @@ class HybridScrapingManager:
                     # Firefox için özel argümanlar ekle
                     firefox_args = ["--new-instance", "--private-window"]
                     _browser = await _playwright.firefox.launch(args=firefox_args, **launch_args)
-                    print("\n[bold green]✓ Firefox tarayıcı görünür modda başlatıldı.[/bold green]")
+                    print(f"\n[bold green]✓ Firefox tarayıcı {mode} modda başlatıldı.[/bold green]")
                     browser_launched = True
 
                 elif self.browser_type == "webkit":  # Safari engine
                     _browser = await _playwright.webkit.launch(**launch_args)
-                    print("\n[bold green]✓ WebKit (Safari) tarayıcı görünür modda başlatıldı.[/bold green]")
+                    print(f"\n[bold green]✓ WebKit (Safari) tarayıcı {mode} modda başlatıldı.[/bold green]")
                     browser_launched = True
 
                 else:  # Varsayılan olarak Chromium
@@ -87,7 +191,7 @@ class HybridScrapingManager:
                         '--window-size=1280,800'
                     ]
                     _browser = await _playwright.chromium.launch(**launch_args)
-                    print("\n[bold green]✓ Chromium tarayıcı görünür modda başlatıldı.[/bold green]")
+                    print(f"\n[bold green]✓ Chromium tarayıcı {mode} modda başlatıldı.[/bold green]")
                     browser_launched = True
 
             except Exception as e:
@@ -110,7 +214,7 @@ class HybridScrapingManager:
                         '--window-size=1280,800'
                     ]
                     _browser = await _playwright.chromium.launch(**launch_args)
-                    print("\n[bold green]✓ Chromium tarayıcı görünür modda başlatıldı (yedek plan).[/bold green]")
+                    print(f"\n[bold green]✓ Chromium tarayıcı {mode} modda başlatıldı (yedek plan).[/bold green]")
                     browser_launched = True
                     self.browser_type = "chromium"  # Browser tipini güncelle
                 except Exception as e:
@@ -118,85 +222,76 @@ class HybridScrapingManager:
                     print(f"\n[bold red]❌ Hiçbir tarayıcı başlatılamadı. Lütfen sisteminizi kontrol edin.[/bold red]")
                     raise e
 
-        # Mevcut oturumu yükle veya yeni oluştur
+
+    async def _new_context(self, session_name=None):
+        """Oturum dosyası (storage_state) varsa onunla yeni bir context oluştur"""
+        session_path = f"{self.session_dir}/{session_name}" if session_name else None
         try:
             context_options = {
-                "viewport": {"width": 1280, "height": 800},
+                "viewport": self.profile.viewport,
                 "locale": "tr-TR"
             }
 
-            if session_name and os.path.exists(f"{self.session_dir}/{session_name}"):
-                context_options["storage_state"] = f"{self.session_dir}/{session_name}"
+            if session_path and os.path.exists(session_path):
+                context_options["storage_state"] = session_path
 
-            self.context = await _browser.new_context(**context_options)
+            context = await _browser.new_context(**context_options)
 
-            if session_name and os.path.exists(f"{self.session_dir}/{session_name}"):
+            if "storage_state" in context_options:
                 logger.info(f"Loaded session: {session_name}")
         except Exception as e:
             logger.error(f"Error creating context: {str(e)}")
             # Basit context oluştur
-            self.context = await _browser.new_context()
+            context = await _browser.new_context()
 
-        try:
-            self.page = await self.context.new_page()
+        # Profil (örn. throughput) görsel/medya/analitik isteklerini engeller
+        await self.profile.apply(context)
+        # Context'te açılan her sayfaya uygulanır
+        await context.add_init_script(STEALTH_SCRIPT)
+        return context
 
-            # Sayfa yüklendikten sonra ekstra tanımlamalar ekle
-            await self.page.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false,
-                });
-
-                // Chrome detectionlarını bypass et
-                window.chrome = {
-                    runtime: {},
-                };
-
-                // Navigator parametrelerini ekleme
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['tr-TR', 'tr', 'en-US', 'en'],
-                });
-
-                // Automation flags'i gizle
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        {
-                            0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                            description: "Portable Document Format",
-                            filename: "internal-pdf-viewer",
-                            length: 1,
-                            name: "Chrome PDF Plugin"
-                        },
-                        {
-                            0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-                            description: "Portable Document Format",
-                            filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                            length: 1,
-                            name: "Chrome PDF Viewer"
-                        }
-                    ],
-                });
-            """)
-        except Exception as e:
-            logger.error(f"Error creating new page: {str(e)}")
-            print(f"\n[bold red]❌ Yeni sayfa oluşturulamadı: {str(e)}[/bold red]")
-
-            # Browser'ı temizle ve yeniden dene
-            if _browser:
-                await _browser.close()
-                _browser = None
-
-            # Chromium'u dene
-            launch_args = {
-                "headless": False,
-                "slow_mo": 100
-            }
+    async def open_context(self, name, session_name=None):
+        """
+        Adlandırılmış bir context aç (zaten açıksa onu döndür). Her context kendi
+        oturum dosyasını yükler ve en fazla pages_per_context sekmelik havuz kullanır.
 
-            _browser = await _playwright.chromium.launch(**launch_args)
-            print("\n[bold green]✓ Chromium tarayıcı yeniden başlatıldı.[/bold green]")
+        Args:
+            name: Context adı (örn. "google", "twitter")
+            session_name: session_dir altındaki storage_state dosyası (örn. "google_session")
+        """
+        if name not in self.contexts:
+            await self._launch_browser()
+            context = await self._new_context(session_name)
+            if name in self.contexts:
+                # Aynı ad için eşzamanlı bir çağrı context'i önce açtı
+                await context.close()
+                return self.contexts[name]
+            self.contexts[name] = context
+            self._idle[name] = []
+            self._slots[name] = asyncio.Semaphore(self.pages_per_context)
+        return self.contexts[name]
+
+    @asynccontextmanager
+    async def pooled_page(self, name):
+        """Adlandırılmış context'in havuzundan bir sekme ödünç al (async with)"""
+        async with self._slots[name]:
+            idle = self._idle[name]
+            page = None
+            while idle and page is None:
+                candidate = idle.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await self.contexts[name].new_page()
 
-            self.context = await _browser.new_context()
-            self.page = await self.context.new_page()
-            self.browser_type = "chromium"
+            try:
+                yield page
+            except BaseException:
+                # Hata sonrası sayfanın durumu belirsiz; yeniden kullanılmaz
+                await page.close()
+                raise
+            if not page.is_closed():
+                idle.append(page)
 
     async def wait_for_user_login(self, url, message, wait_selector, timeout=300000):
         """
@@ -230,10 +325,11 @@ class HybridScrapingManager:
             print(f"\n❌ Giriş beklenirken hata: {str(e)}")
             return False
 
-    async def save_session(self, session_name):
-        """Mevcut tarayıcı oturumunu kaydet"""
-        if self.context:
-            await self.context.storage_state(path=f"{self.session_dir}/{session_name}")
+    async def save_session(self, session_name, name=None):
+        """Varsayılan (veya adlandırılmış) context'in oturumunu kaydet"""
+        context = self.contexts.get(name) if name else self.context
+        if context:
+            await context.storage_state(path=f"{self.session_dir}/{session_name}")
             logger.info(f"Session saved: {session_name}")
 
     async def twitter_login(self, credentials=None):
@@ -262,8 +358,9 @@ class HybridScrapingManager:
 
         return success
 
-    async def get_google_trends_data(self, keyword, country="TR", timeframe="today 3-m"):
-        """Google Trends verilerini çek"""
+    async def get_google_trends_data(self, keyword, country="TR", timeframe="today 3-m", page=None):
+        """Google Trends verilerini çek (page verilmezse varsayılan sayfada)"""
+        page = page or self.page
         try:
             # Encoded URI
             encoded_keyword = keyword.replace(" ", "+")
@@ -271,16 +368,23 @@ class HybridScrapingManager:
 
             logger.info(f"Getting Google Trends data for: {keyword}")
 
-            # Sayfaya git
-            await self.page.goto(url)
-            await self.page.wait_for_timeout(5000)
-
-            # Ekran görüntüsü al
-            screenshot_path = f"google_trends_{keyword.replace(' ', '_')}.png"
-            await self.page.screenshot(path=screenshot_path)
+            # Sayfaya git; grafik verisi gelince veya window.trends hazır olunca devam et
+            readiness = Readiness(page, [
+                ResponseSignal("/trends/api/widgetdata/multiline"),
+                FunctionSignal("() => window.trends !== undefined")
+            ]).arm()
+            await self.pacing.wait("navigation")
+            await page.goto(url, wait_until="domcontentloaded")
+            signal, _ = await readiness.wait()
+            if signal is None:
+                logger.warning(f"Google Trends page not ready for: {keyword}")
+
+            # Ekran görüntüsü (politika izin veriyorsa, arka planda yazılır)
+            screenshot_path = await self.screenshots.capture(page, f"google_trends_{keyword}",
+                                                             error=signal is None)
 
             # Veriyi çıkarmaya çalış
-            data = await self.page.evaluate("""() => {
+            data = await page.evaluate("""() => {
                 try {
                     // Doğrudan console'dan al
                     const dataFromConsole = window.trends?.data?.workspaces?.[0]?.widgets;
@@ -342,10 +446,13 @@ class HybridScrapingManager:
 
         except Exception as e:
             logger.error(f"Error getting Google Trends data: {str(e)}")
-            return None, None
+            return None, await self.screenshots.capture(page, f"google_trends_{keyword}", error=True)
 
-    async def get_twitter_data(self, keyword, result_count=10):
-        """Twitter'dan veri çek"""
+    async def get_twitter_data(self, keyword, result_count=10, page=None):
+        """Twitter'dan veri çek (page verilmezse varsayılan sayfada)"""
+        page = page or self.page
+        # SearchTimeline yanıtları gezinmeden önce dinlenmeye başlanır
+        harvester = TweetHarvester(page, result_count)
         try:
             # URL hazırla
             encoded_keyword = keyword.replace(" ", "%20")
@@ -353,116 +460,137 @@ class HybridScrapingManager:
 
             logger.info(f"Getting Twitter data for: {keyword}")
 
-            # Sayfaya git
-            await self.page.goto(url)
-            await self.page.wait_for_timeout(3000)
-
-            # Sayfayı biraz kaydır
-            for _ in range(3):
-                await self.page.keyboard.press("PageDown")
-                await self.page.wait_for_timeout(1000)
-
-            # Ekran görüntüsü al
-            screenshot_path = f"twitter_{keyword.replace(' ', '_')}.png"
-            await self.page.screenshot(path=screenshot_path)
-
-            # Tweet verilerini çıkar
-            tweets = await self.page.evaluate("""(resultCount) => {
-                const tweets = [];
-                const tweetElements = document.querySelectorAll('article[data-testid="tweet"]');
-
-                for (let i = 0; i < Math.min(tweetElements.length, resultCount); i++) {
-                    try {
-                        const tweet = tweetElements[i];
-
-                        // Kullanıcı adı
-                        let username = "";
-                        const usernameElement = tweet.querySelector('[data-testid="User-Name"]');
-                        if (usernameElement) {
-                            const usernameSpan = usernameElement.querySelector('span span');
-                            if (usernameSpan) {
-                                username = usernameSpan.textContent;
+            # Sayfaya git; arama sonuçları veya ilk tweet gelince devam et
+            readiness = Readiness(page, [
+                ResponseSignal(SEARCH_TIMELINE),
+                SelectorSignal('article[data-testid="tweet"]')
+            ]).arm()
+            await self.pacing.wait("navigation")
+            await page.goto(url, wait_until="domcontentloaded")
+            signal, _ = await readiness.wait()
+            if signal is None:
+                logger.warning(f"Twitter search page not ready for: {keyword}")
+
+            # Limit dolana veya akış durana kadar kaydırarak topla
+            tweets = await harvester.harvest(pause=lambda: self.pacing.wait("scroll"))
+
+            # Ekran görüntüsü (politika izin veriyorsa, arka planda yazılır)
+            screenshot_path = await self.screenshots.capture(page, f"twitter_{keyword}",
+                                                             error=signal is None)
+
+            # Hiçbir şey toplanamadıysa görünen tweet'leri DOM'dan çıkar
+            if not tweets:
+                tweets = await page.evaluate("""(resultCount) => {
+                    const tweets = [];
+                    const tweetElements = document.querySelectorAll('article[data-testid="tweet"]');
+
+                    for (let i = 0; i < Math.min(tweetElements.length, resultCount); i++) {
+                        try {
+                            const tweet = tweetElements[i];
+
+                            // Kullanıcı adı
+                            let username = "";
+                            const usernameElement = tweet.querySelector('[data-testid="User-Name"]');
+                            if (usernameElement) {
+                                const usernameSpan = usernameElement.querySelector('span span');
+                                if (usernameSpan) {
+                                    username = usernameSpan.textContent;
+                                }
                             }
-                        }
 
-                        // Tweet metni
-                        let text = "";
-                        const textElement = tweet.querySelector('[data-testid="tweetText"]');
-                        if (textElement) {
-                            text = textElement.textContent;
-                        }
-
-                        // Tarih
-                        let timestamp = new Date().toISOString();
-                        const timeElement = tweet.querySelector('time');
-                        if (timeElement) {
-                            timestamp = timeElement.getAttribute('datetime') || timestamp;
-                        }
+                            // Tweet metni
+                            let text = "";
+                            const textElement = tweet.querySelector('[data-testid="tweetText"]');
+                            if (textElement) {
+                                text = textElement.textContent;
+                            }
 
-                        // Metrikler
-                        const metrics = {
-                            reply_count: 0,
-                            retweet_count: 0,
-                            like_count: 0,
-                            view_count: 0
-                        };
+                            // Tarih
+                            let timestamp = new Date().toISOString();
+                            const timeElement = tweet.querySelector('time');
+                            if (timeElement) {
+                                timestamp = timeElement.getAttribute('datetime') || timestamp;
+                            }
 
-                        // Etkileşimleri bul
-                        const engagementGroups = tweet.querySelectorAll('[role="group"]');
-                        if (engagementGroups.length > 0) {
-                            // Cevaplar
-                            const replyElement = engagementGroups[0].querySelector('[data-testid="reply"]');
-                            if (replyElement) {
-                                const countElement = replyElement.querySelector('span span span');
-                                if (countElement && countElement.textContent) {
-                                    const count = parseInt(countElement.textContent.replace(/,/g, ''));
-                                    if (!isNaN(count)) metrics.reply_count = count;
+                            // Metrikler
+                            const metrics = {
+                                reply_count: 0,
+                                retweet_count: 0,
+                                like_count: 0,
+                                view_count: 0
+                            };
+
+                            // Etkileşimleri bul
+                            const engagementGroups = tweet.querySelectorAll('[role="group"]');
+                            if (engagementGroups.length > 0) {
+                                // Cevaplar
+                                const replyElement = engagementGroups[0].querySelector('[data-testid="reply"]');
+                                if (replyElement) {
+                                    const countElement = replyElement.querySelector('span span span');
+                                    if (countElement && countElement.textContent) {
+                                        const count = parseInt(countElement.textContent.replace(/,/g, ''));
+                                        if (!isNaN(count)) metrics.reply_count = count;
+                                    }
                                 }
-                            }
 
-                            // Retweetler
-                            const retweetElement = engagementGroups[0].querySelector('[data-testid="retweet"]');
-                            if (retweetElement) {
-                                const countElement = retweetElement.querySelector('span span span');
-                                if (countElement && countElement.textContent) {
-                                    const count = parseInt(countElement.textContent.replace(/,/g, ''));
-                                    if (!isNaN(count)) metrics.retweet_count = count;
+                                // Retweetler
+                                const retweetElement = engagementGroups[0].querySelector('[data-testid="retweet"]');
+                                if (retweetElement) {
+                                    const countElement = retweetElement.querySelector('span span span');
+                                    if (countElement && countElement.textContent) {
+                                        const count = parseInt(countElement.textContent.replace(/,/g, ''));
+                                        if (!isNaN(count)) metrics.retweet_count = count;
+                                    }
                                 }
-                            }
 
-                            // Beğeniler
-                            const likeElement = engagementGroups[0].querySelector('[data-testid="like"]');
-                            if (likeElement) {
-                                const countElement = likeElement.querySelector('span span span');
-                                if (countElement && countElement.textContent) {
-                                    const count = parseInt(countElement.textContent.replace(/,/g, ''));
-                                    if (!isNaN(count)) metrics.like_count = count;
+                                // Beğeniler
+                                const likeElement = engagementGroups[0].querySelector('[data-testid="like"]');
+                                if (likeElement) {
+                                    const countElement = likeElement.querySelector('span span span');
+                                    if (countElement && countElement.textContent) {
+                                        const count = parseInt(countElement.textContent.replace(/,/g, ''));
+                                        if (!isNaN(count)) metrics.like_count = count;
+                                    }
                                 }
                             }
-                        }
 
-                        tweets.push({
-                            username,
-                            text,
-                            timestamp,
-                            metrics
-                        });
-                    } catch (e) {
-                        console.error("Error extracting tweet:", e);
+                            tweets.push({
+                                username,
+                                text,
+                                timestamp,
+                                metrics
+                            });
+                        } catch (e) {
+                            console.error("Error extracting tweet:", e);
+                        }
                     }
-                }
 
-                return tweets;
-            }""", result_count)
+                    return tweets;
+                }""", result_count)
 
             return tweets, screenshot_path
 
         except Exception as e:
             logger.error(f"Error getting Twitter data: {str(e)}")
-            return [], None
+            return [], await self.screenshots.capture(page, f"twitter_{keyword}", error=True)
+        finally:
+            harvester.detach()
+
+    async def close_context(self, name=None):
+        """
+        Context'leri kapat, tarayıcıyı açık tut.
+
+        Args:
+            name: Yalnızca bu adlandırılmış context'i kapat (None: varsayılan ve tüm adlandırılmış context'ler)
+        """
+        if name is not None:
+            context = self.contexts.pop(name, None)
+            self._idle.pop(name, None)
+            self._slots.pop(name, None)
+            if context:
+                await context.close()
+            return
 
-    async def close_context(self):
-        """Sadece mevcut context'i kapat, tarayıcıyı açık tut"""
         if self.page:
             await self.page.close()
             self.page = None
@@ -471,11 +599,15 @@ class HybridScrapingManager:
             await self.context.close()
             self.context = None
 
+        for name in list(self.contexts):
+            await self.close_context(name)
+
     async def close(self):
         """Tüm kaynakları temizle (kullanıcı isterse)"""
         global _playwright, _browser
 
-        # Önce context ve page kapat
+        # Bekleyen ekran görüntülerini yaz, sonra context ve page kapat
+        await self.screenshots.close()
         await self.close_context()
 
         # Eğer açık tutulması istenmemişse tarayıcıyı ve playwright'i de kapat
@@ -1,25 +1,37 @@
 # src/scraper/playwright/base.py içindeki değişiklikler
 
-from playwright.async_api import async_playwright
 import aiohttp
 import json
 import logging
 import random
 from abc import ABC, abstractmethod
 
+from ..base import stream_keywords
+from ..ratelimit import get_rate_limits
+from .pool import get_browser_pool
+from .readiness import Readiness, SelectorSignal
+
 logger = logging.getLogger(__name__)
 
 
 class PlaywrightBaseScraper(ABC):
-    def __init__(self, source_config):
+    def __init__(self, source_config, http_client=None, browser_pool=None):
+        """
+        Args:
+            source_config: Kaynak yapılandırması
+            http_client: Paylaşılan HttpClientManager
+            browser_pool: Sekmelerin alınacağı BrowserPool (varsayılan: süreç geneli)
+        """
         self.config = source_config
+        self.http_client = http_client
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.rate_limits = get_rate_limits()
         self.session = None
-        self.playwright = None
-        self.browser = None
-        self.context = None
+        self._owns_session = False
+        # Yardımcı metodlara sayfa verilmezse kullanılan varsayılan sekme
         self.page = None
-        self.wait_selector = source_config.get("extra_params", {}).get("wait_selector", "body")
-        self.timeout = source_config.get("extra_params", {}).get("timeout", 60000)  # 60 saniye (artırıldı)
+        self.wait_selector = (source_config.get("extra_params") or {}).get("wait_selector", "body")
+        self.timeout = (source_config.get("extra_params") or {}).get("timeout", 60000)  # 60 saniye (artırıldı)
         # Farklı user-agent'lar
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -28,7 +40,26 @@ class PlaywrightBaseScraper(ABC):
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.107 Safari/537.36"
         ]
         self.user_agent = random.choice(self.user_agents)
-        self.headless = False  # Görünür mod aktif edildi
+
+    @property
+    def max_concurrency(self):
+        # Her scrape çağrısı havuzdan kendi sekmesini alır
+        return self.browser_pool.max_pages
+
+    @property
+    def pacing(self):
+        """Adımlar arası gecikmeler (config.yaml: playwright.pacing)"""
+        return self.browser_pool.pacing
+
+    @property
+    def screenshots(self):
+        """Ekran görüntüsü politikası ve yazıcısı (config.yaml: playwright.screenshots)"""
+        return self.browser_pool.screenshots
+
+    @property
+    def context_key(self):
+        """Aynı türdeki scraper'lar bir context'i (çerezler, user-agent) paylaşır"""
+        return type(self).__name__
 
     async def __aenter__(self):
         await self.init_session()
@@ -38,145 +69,150 @@ class PlaywrightBaseScraper(ABC):
         await self.close()
 
     async def init_session(self):
-        """Playwright ve HTTP oturumlarını başlat"""
-        if self.session is None:
-            self.session = aiohttp.ClientSession()
-
-        if self.playwright is None:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=self.headless,  # Görünür mod
-                args=[
-                    '--disable-blink-features=AutomationControlled',  # Automation algılamasını devre dışı bırak
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-accelerated-2d-canvas',
-                    '--disable-gpu'
-                ]
-            )
-            self.context = await self.browser.new_context(
-                user_agent=self.user_agent,
-                viewport={"width": 1920, "height": 1080},
-                java_script_enabled=True,
-                bypass_csp=True,  # Content Security Policy bypass
-                ignore_https_errors=True,
-                extra_http_headers={
-                    "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7"
-                }
-            )
-
-            # Bot algılamasını atlatmak için navigator.webdriver'ı sahte bir değerle değiştir
-            await self.context.add_init_script("""
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false,
-                });
-
-                // Chrome detectionlarını bypass et
-                window.chrome = {
-                    runtime: {},
-                };
-
-                // Navigator parametrelerini ekleme
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['tr-TR', 'tr', 'en-US', 'en'],
-                });
-
-                // Automation flags'i gizle
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        {
-                            0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
-                            description: "Portable Document Format",
-                            filename: "internal-pdf-viewer",
-                            length: 1,
-                            name: "Chrome PDF Plugin"
-                        },
-                        {
-                            0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
-                            description: "Portable Document Format",
-                            filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
-                            length: 1,
-                            name: "Chrome PDF Viewer"
-                        }
-                    ],
-                });
-            """)
-
-            self.page = await self.context.new_page()
-
-            # Hata yakalama
-            await self.page.add_init_script("""
-                window.addEventListener('error', (event) => {
-                    console.error('Page JavaScript error:', event.message, event.error);
-                });
-            """)
+        """HTTP oturumunu başlat; tarayıcı ilk sekme istendiğinde havuzda açılır"""
+        if self.session is None or self.session.closed:
+            if self.http_client:
+                self.session = await self.http_client.get_session()
+            else:
+                self.session = aiohttp.ClientSession()
+                self._owns_session = True
+
+    def new_page(self):
+        """Havuzdan bu scraper türünün context'inde bir sekme ödünç al (async with)"""
+        return self.browser_pool.page(self.context_key, self.create_context)
+
+    async def create_context(self, browser):
+        """Bot algılamasını zorlaştıran ayarlarla yeni bir context oluştur"""
+        context = await browser.new_context(
+            user_agent=self.user_agent,
+            viewport=self.browser_pool.profile.viewport,
+            java_script_enabled=True,
+            bypass_csp=True,  # Content Security Policy bypass
+            ignore_https_errors=True,
+            extra_http_headers={
+                "Accept-Language": "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7"
+            }
+        )
+
+        # Bot algılamasını atlatmak için navigator.webdriver'ı sahte bir değerle değiştir
+        await context.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => false,
+            });
+
+            // Chrome detectionlarını bypass et
+            window.chrome = {
+                runtime: {},
+            };
+
+            // Navigator parametrelerini ekleme
+            Object.defineProperty(navigator, 'languages', {
+                get: () => ['tr-TR', 'tr', 'en-US', 'en'],
+            });
+
+            // Automation flags'i gizle
+            Object.defineProperty(navigator, 'plugins', {
+                get: () => [
+                    {
+                        0: {type: "application/x-google-chrome-pdf", suffixes: "pdf", description: "Portable Document Format"},
+                        description: "Portable Document Format",
+                        filename: "internal-pdf-viewer",
+                        length: 1,
+                        name: "Chrome PDF Plugin"
+                    },
+                    {
+                        0: {type: "application/pdf", suffixes: "pdf", description: "Portable Document Format"},
+                        description: "Portable Document Format",
+                        filename: "mhjfbmdgcfjbbpaeojofohoefgiehjai",
+                        length: 1,
+                        name: "Chrome PDF Viewer"
+                    }
+                ],
+            });
+        """)
+
+        # Hata yakalama
+        await context.add_init_script("""
+            window.addEventListener('error', (event) => {
+                console.error('Page JavaScript error:', event.message, event.error);
+            });
+        """)
+
+        # Profil (örn. throughput) görsel/medya/analitik isteklerini engeller
+        await self.browser_pool.profile.apply(context)
+        return context
 
     @abstractmethod
     async def scrape(self, keywords, limit=10):
         """Her scraper tarafından uygulanacak ana scraping metodu"""
         pass
 
-    async def navigate(self, url, wait_selector=None, timeout=None):
-        """Bir URL'ye git ve belirli bir seçicinin yüklenmesini bekle"""
+    def scrape_stream(self, keywords, limit=10):
+        """Her anahtar kelimenin sonucunu hazır olur olmaz üret; her çağrı havuzdan kendi sekmesini alır"""
+        return stream_keywords(self, keywords, limit)
+
+    async def navigate(self, url, wait_selector=None, timeout=None, page=None, ready=None):
+        """
+        Bir URL'ye git ve sayfanın hazır olduğunu gösteren ilk sinyali bekle.
+
+        Args:
+            wait_selector: Görünmesi beklenecek seçici (ready yoksa varsayılan: extra_params.wait_selector)
+            ready: Ek hazır olma sinyalleri (örn. ResponseSignal("api/widgetdata/multiline"));
+                seçiciyle birlikte hangisi önce gerçekleşirse yeterlidir
+        """
+        page = page or self.page
+        timeout = timeout or self.timeout
+        # Ek sinyal verildiyse varsayılan seçici ("body") beklemeyi anında bitirmesin
+        selector = wait_selector or (None if ready else self.wait_selector)
+        signals = list(ready or [])
+        if selector:
+            signals.append(SelectorSignal(selector))
+
+        readiness = Readiness(page, signals, timeout=timeout)
         try:
-            # İnsan benzeri gecikme ekle
-            await self.page.wait_for_timeout(random.randint(1000, 3000))
-
-            # Sayfaya git
-            response = await self.page.goto(
-                url,
-                timeout=timeout or self.timeout,
-                wait_until="domcontentloaded"  # Değiştirildi: networkidle yerine domcontentloaded
-            )
-
-            # Sayfanın tamamen yüklenmesi için ek bekleme
-            await self.page.wait_for_timeout(random.randint(2000, 5000))
-
-            # İnsan benzeri davranış - rastgele sayfa kaydırma
-            await self.page.evaluate("""
-                const scrollHeight = Math.floor(Math.random() * 500);
-                window.scrollBy(0, scrollHeight);
-            """)
-
-            await self.page.wait_for_timeout(random.randint(500, 1500))
-
-            # Seçici için bekle
-            if wait_selector or self.wait_selector:
-                try:
-                    await self.page.wait_for_selector(
-                        wait_selector or self.wait_selector,
-                        state="visible",
-                        timeout=timeout or self.timeout
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Selector not found: {wait_selector or self.wait_selector}, but continuing. {str(e)}")
-                    # Ekran görüntüsü al
-                    screenshot = await self.take_screenshot()
-                    logger.debug(f"Current page content when selector not found: {await self.page.content()[:1000]}")
-
-            # İnsan benzeri davranış - sayfada biraz daha bekle
-            await self.page.wait_for_timeout(random.randint(1000, 3000))
+            await self.pacing.wait("navigation")
+
+            # Ağ yanıtları gezinmeden önce dinlenmeye başlanır
+            readiness.arm()
+            async def send():
+                response = await page.goto(
+                    url,
+                    timeout=timeout,
+                    wait_until="domcontentloaded"  # Değiştirildi: networkidle yerine domcontentloaded
+                )
+                if response is None:
+                    return 200, {}, None
+                return response.status, response.headers, response
+
+            # Gezinmeler de API istekleri gibi kaynak/host kovasından geçer; 429'da yavaşlayıp yeniden dener
+            response = await self.rate_limits.run(self.config.get("name", ""), url, send, retry_on=())
+
+            if signals:
+                signal, _ = await readiness.wait()
+                if signal is None:
+                    logger.warning(f"Page not ready after {timeout} ms: {url}, but continuing.")
+                    await self.take_screenshot("not_ready", page=page, error=True)
+                else:
+                    logger.debug(f"Page ready ({signal.name}): {url}")
 
             return response
         except Exception as e:
+            readiness.cancel()
             logger.error(f"Navigation error to {url}: {str(e)}")
-            # Ekran görüntüsü al
-            screenshot = await self.take_screenshot()
+            await self.take_screenshot("navigation", page=page, error=True)
             return None
 
-    async def extract_text(self, selector, multiple=False):
+    async def extract_text(self, selector, multiple=False, page=None):
         """Seçiciden metin içeriği çıkar"""
+        page = page or self.page
         try:
-            # İnsan benzeri gecikme
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await self.pacing.wait("action")
 
             if multiple:
-                elements = await self.page.query_selector_all(selector)
+                elements = await page.query_selector_all(selector)
                 return [await element.text_content() for element in elements]
             else:
-                element = await self.page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     return await element.text_content()
                 return None
@@ -184,17 +220,17 @@ class PlaywrightBaseScraper(ABC):
             logger.error(f"Error extracting text from {selector}: {str(e)}")
             return None if not multiple else []
 
-    async def extract_attribute(self, selector, attribute, multiple=False):
+    async def extract_attribute(self, selector, attribute, multiple=False, page=None):
         """Seçiciden bir özniteliği çıkar"""
+        page = page or self.page
         try:
-            # İnsan benzeri gecikme
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await self.pacing.wait("action")
 
             if multiple:
-                elements = await self.page.query_selector_all(selector)
+                elements = await page.query_selector_all(selector)
                 return [await element.get_attribute(attribute) for element in elements]
             else:
-                element = await self.page.query_selector(selector)
+                element = await page.query_selector(selector)
                 if element:
                     return await element.get_attribute(attribute)
                 return None
@@ -202,49 +238,34 @@ class PlaywrightBaseScraper(ABC):
             logger.error(f"Error extracting attribute {attribute} from {selector}: {str(e)}")
             return None if not multiple else []
 
-    async def evaluate(self, script, arg=None):
+    async def evaluate(self, script, arg=None, page=None):
         """Sayfada JavaScript çalıştır"""
+        page = page or self.page
         try:
-            # İnsan benzeri gecikme
-            await self.page.wait_for_timeout(random.randint(500, 1500))
+            await self.pacing.wait("action")
 
-            return await self.page.evaluate(script, arg)
+            return await page.evaluate(script, arg)
         except Exception as e:
             logger.error(f"Error evaluating script: {str(e)}")
             return None
 
-    async def take_screenshot(self, path=None):
-        """Hata ayıklama için ekran görüntüsü al"""
-        try:
-            if path:
-                await self.page.screenshot(path=path)
-            else:
-                return await self.page.screenshot()
-        except Exception as e:
-            logger.error(f"Error taking screenshot: {str(e)}")
-            return None
+    async def take_screenshot(self, name, page=None, error=False):
+        """
+        Politika (off/on_error/sampled/always) izin veriyorsa ekran görüntüsü al.
+        Dosya arka planda çalıştırma dizinine yazılır.
+
+        Returns:
+            str: Görüntünün dosya yolu veya alınmadıysa None
+        """
+        page = page or self.page
+        return await self.screenshots.capture(page, f"{self.context_key}_{name}", error=error)
 
     async def close(self):
-        """Kaynakları temizle"""
+        """Kaynakları temizle; tarayıcı ve sekmeler havuza aittir"""
         try:
-            if self.page:
-                await self.page.close()
-                self.page = None
-
-            if self.context:
-                await self.context.close()
-                self.context = None
-
-            if self.browser:
-                await self.browser.close()
-                self.browser = None
-
-            if self.playwright:
-                await self.playwright.stop()
-                self.playwright = None
-
-            if self.session:
+            # Paylaşılan oturum HttpClientManager tarafından kapatılır
+            if self.session and self._owns_session:
                 await self.session.close()
-                self.session = None
+            self.session = None
         except Exception as e:
-            logger.error(f"Error closing resources: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error closing resources: {str(e)}")
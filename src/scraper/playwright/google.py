@@ -1,23 +1,157 @@
-# src/scraper/playwright/google.py içindeki değişiklikler
-
-
+import asyncio
 import json
 import logging
 import time
 import random
 import math  # Eksik math modülü eklendi
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from ..playwright.base import PlaywrightBaseScraper
+from .readiness import FunctionSignal, ResponseSignal
 
 logger = logging.getLogger(__name__)
 
 
+WIDGET_PATH = "/trends/api/widgetdata/"
+
+
+def parse_widget_json(text):
+    """widgetdata yanıtını çöz; Google gövdenin başına )]}', ekler"""
+    return json.loads(text[text.index("{"):])
+
+
+def parse_timeline(payload):
+    """multiline yanıtındaki timelineData'yı {YYYY-MM-DD: değer} sözlüğüne çevir"""
+    trend_data = {}
+    for point in payload.get("default", {}).get("timelineData", []):
+        if not point.get("value"):
+            continue
+        date = datetime.fromtimestamp(int(point["time"]), tz=timezone.utc)
+        trend_data[date.strftime("%Y-%m-%d")] = point["value"][0]
+    return trend_data
+
+
+def parse_related(payload):
+    """
+    relatedsearches yanıtını çöz.
+
+    Returns:
+        tuple: ("query" veya "topic", [{"keyword", "value", "rising"}, ...]);
+            rankedList'in ilk listesi en popüler, ikincisi yükselen aramalardır
+    """
+    kind = "query"
+    items = []
+    for position, ranked in enumerate(payload.get("default", {}).get("rankedList", [])):
+        for entry in ranked.get("rankedKeyword", []):
+            if "topic" in entry:
+                kind = "topic"
+                keyword = entry["topic"].get("title")
+            else:
+                keyword = entry.get("query")
+            if keyword:
+                items.append({"keyword": keyword, "value": entry.get("value"), "rising": position == 1})
+    return kind, items
+
+
+class WidgetCapture:
+    """
+    Trends sayfasının widgetdata XHR yanıtlarını dinler. Grafik (multiline) ve
+    ilgili aramalar (relatedsearches) JSON olarak okunur; DOM'a dokunulmaz.
+    """
+
+    KINDS = ("multiline", "relatedsearches")
+
+    def __init__(self, page):
+        self.page = page
+        self.responses = {kind: [] for kind in self.KINDS}
+        # Tür -> ilk yanıtın geldiği an (event loop zamanı)
+        self.first_at = {}
+        self._arrived = asyncio.Event()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        for kind, responses in self.responses.items():
+            if f"{WIDGET_PATH}{kind}" in response.url and response.ok:
+                responses.append(response)
+                self.first_at.setdefault(kind, asyncio.get_running_loop().time())
+                self._arrived.set()
+
+    def detach(self):
+        """Dinleyiciyi kaldır; sekme havuza döndükten sonra başka anahtar kelimede kullanılır"""
+        self.page.remove_listener("response", self._on_response)
+
+    async def wait_for(self, kind, count, timeout, since=None):
+        """
+        En az `count` adet `kind` yanıtı gelene kadar (en çok timeout ms) bekle.
+
+        Args:
+            since: Sürenin başladığı event loop zamanı (varsayılan: şimdi)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = (since if since is not None else loop.time()) + timeout / 1000
+        while len(self.responses[kind]) < count:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            self._arrived.clear()
+            try:
+                await asyncio.wait_for(self._arrived.wait(), remaining)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def payloads(self, kind):
+        payloads = []
+        for response in self.responses[kind]:
+            try:
+                payloads.append(parse_widget_json(await response.text()))
+            except Exception as e:
+                logger.warning(f"Could not parse {kind} response {response.url}: {str(e)}")
+        return payloads
+
+    async def collect(self, related_timeout=2000):
+        """
+        Yakalanan yanıtlardan sonuçları oluştur.
+
+        Args:
+            related_timeout: İlgili arama yanıtları için grafik (multiline) yanıtından
+                itibaren beklenecek en uzun süre (ms); gelmeyenler DOM'dan okunur
+
+        Returns:
+            tuple: (trend_data, related_queries, related_topics); yakalanamayan parça None
+        """
+        trend_data = {}
+        for payload in await self.payloads("multiline"):
+            trend_data.update(parse_timeline(payload))
+
+        # İlgili konular ve sorgular için iki ayrı istek gönderilir; widget'lar grafikle
+        # birlikte yüklendiğinden süre grafik yanıtından başlar
+        await self.wait_for("relatedsearches", 2, related_timeout, since=self.first_at.get("multiline"))
+        related = {"query": None, "topic": None}
+        for payload in await self.payloads("relatedsearches"):
+            kind, items = parse_related(payload)
+            if items or related[kind] is None:
+                related[kind] = items
+
+        return trend_data or None, related["query"], related["topic"]
+
+
 class GoogleTrendsPlaywrightScraper(PlaywrightBaseScraper):
+    def __init__(self, source_config, http_client=None, browser_pool=None):
+        super().__init__(source_config, http_client, browser_pool)
+        extra_params = source_config.get("extra_params") or {}
+        # "network": widgetdata XHR'larını yakala, "dom": sayfa metnini ayrıştır
+        self.capture = extra_params.get("capture", "network")
+        # İlgili arama yanıtları (grafik yanıtından itibaren) ve DOM yedeğindeki seçiciler için bekleme (ms)
+        self.related_timeout = extra_params.get("related_timeout", 2000)
+        self.selector_timeout = extra_params.get("selector_timeout", 1000)
+
     async def scrape(self, keywords, limit=10):
         await self.init_session()
-        results = []
+        # Her anahtar kelime havuzdan aldığı ayrı bir sekmede, paralel işlenir
+        return list(await asyncio.gather(*(self.scrape_keyword(keyword, limit) for keyword in keywords)))
 
-        for keyword in keywords:
+    async def scrape_keyword(self, keyword, limit=10):
+        async with self.new_page() as page:
             try:
                 # Google Trends URL'sini oluştur
                 # Türkçe dostu URL encode
@@ -27,138 +161,53 @@ class GoogleTrendsPlaywrightScraper(PlaywrightBaseScraper):
 
                 logger.info(f"Scraping Google Trends for keyword: {keyword}")
 
-                # Sayfaya git ve yüklenmeyi bekle
-                await self.navigate(url, wait_selector="body", timeout=90000)  # 90 saniye timeout
-
-                # Sayfanın tamamen yüklenmesi için biraz bekle
-                await self.page.wait_for_timeout(5000)
-
-                # Sayfayı kaydırarak daha fazla içerik yüklemesini sağla
-                await self.page.evaluate("""
-                    window.scrollBy(0, 300);
-                    // Rastgele birkaç fare hareketi simüle et
-                    for (let i = 0; i < 5; i++) {
-                        const x = Math.floor(Math.random() * window.innerWidth);
-                        const y = Math.floor(Math.random() * window.innerHeight);
-                        const event = new MouseEvent('mousemove', {
-                            'view': window,
-                            'bubbles': true,
-                            'cancelable': true,
-                            'clientX': x,
-                            'clientY': y
-                        });
-                        document.dispatchEvent(event);
-                    }
-                """)
-
-                # Birkaç saniye daha bekle
-                await self.page.wait_for_timeout(3000)
-
-                # Ekran görüntüsü al (debug için)
-                screenshot_path = f"google_trends_{keyword.replace(' ', '_')}.png"
-                await self.take_screenshot(screenshot_path)
-                logger.info(f"Screenshot saved to {screenshot_path}")
-
-                # Sayfadan HTML içeriği al
-                html_content = await self.page.content()
-                logger.debug(f"Page content length: {len(html_content)}")
-
-                # Farklı bir seçici stratejisi dene
-                trend_data = await self.page.evaluate("""() => {
-                    try {
-                        // Veri noktalarını taşıyan tüm muhtemel elementleri tara
-                        const dataPoints = {};
-                        const today = new Date();
-
-                        // Grafik elementlerini kontrol et
-                        const charts = document.querySelectorAll('svg');
-                        if (charts.length > 0) {
-                            const paths = document.querySelectorAll('svg path');
-                            console.log("Found " + paths.length + " paths in SVG");
-
-                            // Tarih aralığı oluştur
-                            for (let i = 90; i >= 0; i--) {
-                                const date = new Date();
-                                date.setDate(date.getDate() - i);
-                                const dateString = date.toISOString().split('T')[0];
-                                dataPoints[dateString] = 0;
-                            }
-
-                            // Veri noktaları için HTML içeriği kontrol et
-                            const allText = document.body.innerText;
-                            const rows = allText.split('\\n');
-
-                            // Olası tarih-değer çiftlerini ara
-                            const dateValuePattern = /(\\d{4}-\\d{2}-\\d{2}|\\d{1,2} [A-Za-z]{3})\\s+(\\d{1,3})/;
-                            const months = ['Oca', 'Şub', 'Mar', 'Nis', 'May', 'Haz', 'Tem', 'Ağu', 'Eyl', 'Eki', 'Kas', 'Ara'];
-
-                            for (const row of rows) {
-                                const match = row.match(dateValuePattern);
-                                if (match) {
-                                    let dateStr = match[1];
-                                    const value = parseInt(match[2], 10);
-
-                                    // Tarih formatını kontrol et ve normalleştir
-                                    if (dateStr.includes('-')) {
-                                        // YYYY-MM-DD format
-                                        // Doğrudan kullan
-                                    } else {
-                                        // DD Aaa format (örn: "1 Oca")
-                                        const parts = dateStr.split(' ');
-                                        const day = parseInt(parts[0], 10);
-                                        const monthIdx = months.findIndex(m => parts[1].startsWith(m));
-
-                                        if (monthIdx >= 0) {
-                                            const year = today.getFullYear();
-                                            dateStr = `${year}-${String(monthIdx + 1).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
-                                        }
-                                    }
-
-                                    // Değeri kaydet
-                                    if (dateStr in dataPoints) {
-                                        dataPoints[dateStr] = value;
-                                    }
-                                }
-                            }
-
-                            // Dolgulu trend verileri oluştur
-                            const dates = Object.keys(dataPoints).sort();
-                            let prevValue = 0;
-
-                            for (const date of dates) {
-                                if (dataPoints[date] === 0 && prevValue !== 0) {
-                                    dataPoints[date] = prevValue;
-                                } else if (dataPoints[date] !== 0) {
-                                    prevValue = dataPoints[date];
-                                }
-                            }
-
-                            // En az bir değer içerdiğinden emin ol
-                            if (Object.values(dataPoints).some(v => v > 0)) {
-                                return dataPoints;
-                            }
+                # Yanıtlar gezinmeden önce dinlenmeye başlanmalı
+                capture = WidgetCapture(page) if self.capture == "network" else None
+                try:
+                    # Sayfaya git; grafik verisi (multiline) gelince veya window.trends hazır olunca devam et
+                    await self.navigate(url, page=page, timeout=90000, ready=[  # 90 saniye timeout
+                        ResponseSignal("/trends/api/widgetdata/multiline"),
+                        FunctionSignal("() => window.trends !== undefined")
+                    ])
+
+                    # Sayfayı kaydırarak daha fazla içerik yüklemesini sağla
+                    await page.evaluate("""
+                        window.scrollBy(0, 300);
+                        // Rastgele birkaç fare hareketi simüle et
+                        for (let i = 0; i < 5; i++) {
+                            const x = Math.floor(Math.random() * window.innerWidth);
+                            const y = Math.floor(Math.random() * window.innerHeight);
+                            const event = new MouseEvent('mousemove', {
+                                'view': window,
+                                'bubbles': true,
+                                'cancelable': true,
+                                'clientX': x,
+                                'clientY': y
+                            });
+                            document.dispatchEvent(event);
                         }
+                    """)
+                    await self.pacing.wait("scroll")
 
-                        // Alternatif: Rastgele veri oluştur
-                        const mockData = {};
-                        for (let i = 90; i >= 0; i--) {
-                            const date = new Date();
-                            date.setDate(date.getDate() - i);
-                            const dateString = date.toISOString().split('T')[0];
-                            // Rastgele bir trend paterni oluştur
-                            const trendValue = 50 + Math.sin(i / 15) * 30 + Math.random() * 20;
-                            mockData[dateString] = Math.round(Math.max(0, Math.min(100, trendValue)));
-                        }
-                        return mockData;
-                    } catch (e) {
-                        console.error("Error parsing Google Trends data:", e);
-                        return null;
-                    }
-                }""")
+                    # Ekran görüntüsü (politika izin veriyorsa, arka planda yazılır)
+                    screenshot_path = await self.take_screenshot(keyword, page=page)
 
-                # İlgili konular ve sorgular için daha güvenilir bir yaklaşım
-                related_queries = await self.extract_related_keywords("QUERIES")
-                related_topics = await self.extract_related_keywords("TOPICS")
+                    trend_data, related_queries, related_topics = None, None, None
+                    if capture:
+                        trend_data, related_queries, related_topics = await capture.collect(self.related_timeout)
+                finally:
+                    if capture:
+                        capture.detach()
+
+                # Yanıt yakalanamadıysa sayfa metnine geri dön
+                if not trend_data:
+                    if capture:
+                        logger.info(f"No widgetdata captured for {keyword}, parsing page text")
+                    trend_data = await self.extract_trend_data_from_dom(page)
+                if related_queries is None:
+                    related_queries = await self.extract_related_keywords("QUERIES", page=page)
+                if related_topics is None:
+                    related_topics = await self.extract_related_keywords("TOPICS", page=page)
 
                 # Eğer hiç trend verisi yoksa manuel oluştur
                 if not trend_data:
@@ -176,29 +225,124 @@ class GoogleTrendsPlaywrightScraper(PlaywrightBaseScraper):
                         trend_data[date_str] = round(max(0, min(100, base + seasonal + weekly + noise)))
 
                 # Sonuçları biraraya getir
-                results.append({
+                return {
                     "keyword": keyword,
                     "source": "google_trends",
                     "data": trend_data,
                     "related_queries": related_queries,
                     "related_topics": related_topics,
                     "screenshot": screenshot_path
-                })
+                }
 
             except Exception as e:
                 logger.error(f"Error scraping Google Trends for keyword {keyword}: {str(e)}")
                 # Hata durumunda daha anlamlı mock veri dön
-                results.append({
+                return {
                     "keyword": keyword,
                     "source": "google_trends",
                     "error": f"Scraping error: {str(e)}",
-                    "data": self.generate_mock_trend_data(keyword)
-                })
+                    "data": self.generate_mock_trend_data(keyword),
+                    "screenshot": await self.take_screenshot(keyword, page=page, error=True)
+                }
+
+    async def extract_trend_data_from_dom(self, page):
+        """Grafik verisini sayfa metnindeki tarih-değer çiftlerinden çıkar (yedek yol)"""
+        # Farklı bir seçici stratejisi dene
+        return await page.evaluate("""() => {
+            try {
+                // Veri noktalarını taşıyan tüm muhtemel elementleri tara
+                const dataPoints = {};
+                const today = new Date();
+
+                // Grafik elementlerini kontrol et
+                const charts = document.querySelectorAll('svg');
+                if (charts.length > 0) {
+                    const paths = document.querySelectorAll('svg path');
+                    console.log("Found " + paths.length + " paths in SVG");
+
+                    // Tarih aralığı oluştur
+                    for (let i = 90; i >= 0; i--) {
+                        const date = new Date();
+                        date.setDate(date.getDate() - i);
+                        const dateString = date.toISOString().split('T')[0];
+                        dataPoints[dateString] = 0;
+                    }
 
-        return results
+                    // Veri noktaları için HTML içeriği kontrol et
+                    const allText = document.body.innerText;
+                    const rows = allText.split('\\n');
+
+                    // Olası tarih-değer çiftlerini ara
+                    const dateValuePattern = /(\\d{4}-\\d{2}-\\d{2}|\\d{1,2} [A-Za-z]{3})\\s+(\\d{1,3})/;
+                    const months = ['Oca', 'Şub', 'Mar', 'Nis', 'May', 'Haz', 'Tem', 'Ağu', 'Eyl', 'Eki', 'Kas', 'Ara'];
+
+                    for (const row of rows) {
+                        const match = row.match(dateValuePattern);
+                        if (match) {
+                            let dateStr = match[1];
+                            const value = parseInt(match[2], 10);
+
+                            // Tarih formatını kontrol et ve normalleştir
+                            if (dateStr.includes('-')) {
+                                // YYYY-MM-DD format
+                                // Doğrudan kullan
+                            } else {
+                                // DD Aaa format (örn: "1 Oca")
+                                const parts = dateStr.split(' ');
+                                const day = parseInt(parts[0], 10);
+                                const monthIdx = months.findIndex(m => parts[1].startsWith(m));
+
+                                if (monthIdx >= 0) {
+                                    const year = today.getFullYear();
+                                    dateStr = `${year}-${String(monthIdx + 1).padStart(2, '0')}-${String(day).padStart(2, '0')}`;
+                                }
+                            }
 
-    async def extract_related_keywords(self, keyword_type):
+                            // Değeri kaydet
+                            if (dateStr in dataPoints) {
+                                dataPoints[dateStr] = value;
+                            }
+                        }
+                    }
+
+                    // Dolgulu trend verileri oluştur
+                    const dates = Object.keys(dataPoints).sort();
+                    let prevValue = 0;
+
+                    for (const date of dates) {
+                        if (dataPoints[date] === 0 && prevValue !== 0) {
+                            dataPoints[date] = prevValue;
+                        } else if (dataPoints[date] !== 0) {
+                            prevValue = dataPoints[date];
+                        }
+                    }
+
+                    // En az bir değer içerdiğinden emin ol
+                    if (Object.values(dataPoints).some(v => v > 0)) {
+                        return dataPoints;
+                    }
+                }
+
+                // Alternatif: Rastgele veri oluştur
+                const mockData = {};
+                for (let i = 90; i >= 0; i--) {
+                    const date = new Date();
+                    date.setDate(date.getDate() - i);
+                    const dateString = date.toISOString().split('T')[0];
+                    // Rastgele bir trend paterni oluştur
+                    const trendValue = 50 + Math.sin(i / 15) * 30 + Math.random() * 20;
+                    mockData[dateString] = Math.round(Math.max(0, Math.min(100, trendValue)));
+                }
+                return mockData;
+            } catch (e) {
+                console.error("Error parsing Google Trends data:", e);
+                return null;
+            }
+        }""")
+
+    async def extract_related_keywords(self, keyword_type, page=None):
         """İlgili sorgular veya konuları çıkar"""
+        page = page or self.page
         try:
             # İlgili anahtar kelimeler bölümünün seçicisini tanımla
             selector = f"div[title='Related {keyword_type.lower()}'] + div"
@@ -214,12 +358,19 @@ class GoogleTrendsPlaywrightScraper(PlaywrightBaseScraper):
 
             results = []
 
-            # Seçicileri dene
+            # Seçicilerden herhangi biri için tek, kısa bir bekleme; ardından sırayla beklemeden dene
+            try:
+                await page.wait_for_selector(", ".join(sel for sel in selectors if ":contains" not in sel),
+                                             timeout=self.selector_timeout)
+            except Exception:
+                return []
+
             for sel in selectors:
                 try:
-                    await self.page.wait_for_selector(sel, timeout=5000)
+                    if await page.query_selector(sel) is None:
+                        continue
                     # İlgili metinleri çıkar
-                    items = await self.page.evaluate(f"""(selector) => {{
+                    items = await page.evaluate(f"""(selector) => {{
                         const items = [];
                         const elements = document.querySelectorAll(selector + " div[role='listitem'], " + selector + " li");
 
@@ -0,0 +1,40 @@
+import asyncio
+import random
+
+# Adım adı -> (en az, en çok) saniye. Sayfa hazır olma beklemesinden bağımsızdır;
+# yalnızca insan benzeri tempo ve site nezaketi içindir.
+DEFAULT_DELAYS = {
+    "navigation": (0.5, 1.5),  # goto öncesi
+    "scroll": (0.3, 0.8),  # kaydırmalar arası
+    "action": (0.0, 0.0),  # metin/öznitelik çıkarma, script çalıştırma öncesi
+}
+
+
+class PacingPolicy:
+    """Scraper adımları arasındaki rastgele gecikmeleri tek yerden yönetir"""
+
+    def __init__(self, delays=None):
+        """
+        Args:
+            delays: Adım adı -> (en az, en çok) saniye; verilmeyen adımlar varsayılanı kullanır
+        """
+        self.delays = dict(DEFAULT_DELAYS)
+        for step, bounds in (delays or {}).items():
+            low, high = bounds if isinstance(bounds, (list, tuple)) else (bounds, bounds)
+            self.delays[step] = (float(low), float(max(low, high)))
+
+    @classmethod
+    def from_config(cls, options):
+        """config.yaml içindeki `playwright.pacing` sözlüğünden politika oluştur"""
+        return cls(delays=options or {})
+
+    def delay(self, step):
+        """Bir adım için rastgele gecikme süresi (sn)"""
+        low, high = self.delays.get(step, (0.0, 0.0))
+        return random.uniform(low, high) if high > 0 else 0.0
+
+    async def wait(self, step):
+        """Adımın gecikmesi kadar bekle"""
+        seconds = self.delay(step)
+        if seconds > 0:
+            await asyncio.sleep(seconds)
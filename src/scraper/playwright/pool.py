@@ -0,0 +1,166 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
+from playwright.async_api import async_playwright
+
+from .pacing import PacingPolicy
+from .profile import BrowserProfile
+from .screenshots import ScreenshotPipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',  # Automation algılamasını devre dışı bırak
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-accelerated-2d-canvas',
+    '--disable-gpu'
+]
+
+
+class BrowserPool:
+    """
+    Süreç başına tek bir tarayıcı. Scraper türü başına bir context açılır,
+    sayfalar (sekmeler) sınırlı bir havuzdan verilir ve iş bitince yeniden
+    kullanılmak üzere geri alınır.
+    """
+
+    def __init__(self, max_pages=4, profile=None, browser_type="chromium", launch_args=None, pacing=None,
+                 screenshots=None):
+        """
+        Args:
+            max_pages: Aynı anda açık olabilecek en fazla sekme
+            profile: BrowserProfile (varsayılan: headless "throughput" profili)
+            browser_type: 'chromium', 'firefox' veya 'webkit'
+            launch_args: Tarayıcı komut satırı argümanları
+            pacing: Sekmeleri kullanan scraper'ların PacingPolicy'si
+            screenshots: Sekmeleri kullanan scraper'ların ScreenshotPipeline'ı
+        """
+        self.max_pages = max(1, max_pages)
+        self.pacing = pacing or PacingPolicy()
+        self.screenshots = screenshots or ScreenshotPipeline()
+        self.profile = profile or BrowserProfile()
+        self.browser_type = browser_type
+        self.launch_args = DEFAULT_LAUNCH_ARGS if launch_args is None else launch_args
+        self.playwright = None
+        self.browser = None
+        self._contexts = {}
+        self._idle = {}
+        self._loop = None
+        self._lock = None
+        self._slots = None
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `playwright` bölümünden havuz oluştur"""
+        options = (config or {}).get("playwright", {}) or {}
+        return cls(
+            max_pages=options.get("max_pages", 4),
+            profile=BrowserProfile.from_config(options),
+            browser_type=options.get("browser_type", "chromium"),
+            pacing=PacingPolicy.from_config(options.get("pacing")),
+            screenshots=ScreenshotPipeline.from_config(options.get("screenshots"))
+        )
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Önceki event loop'ta açılmış tarayıcı bu loop'tan kullanılamaz
+            self.playwright = None
+            self.browser = None
+            self._contexts = {}
+            self._idle = {}
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_pages)
+
+    async def _launch(self):
+        if self.browser is None:
+            logger.info(f"Launching shared {self.browser_type} browser "
+                        f"(profile={self.profile.name}, headless={self.profile.headless})")
+            self.playwright = await async_playwright().start()
+            self.browser = await getattr(self.playwright, self.browser_type).launch(
+                args=self.launch_args,
+                **self.profile.launch_options()
+            )
+
+    async def context(self, key, factory):
+        """
+        Anahtara ait context'i döndür, yoksa factory(browser) ile oluştur.
+
+        Args:
+            key: Context'i paylaşacak kullanıcıların ortak anahtarı (örn. scraper sınıfı)
+            factory: Tarayıcıyı alıp yeni bir context döndüren async fonksiyon
+        """
+        self._bind_loop()
+        async with self._lock:
+            await self._launch()
+            if key not in self._contexts:
+                self._contexts[key] = await factory(self.browser)
+                self._idle[key] = []
+            return self._contexts[key]
+
+    @asynccontextmanager
+    async def page(self, key, factory):
+        """Havuzdan bir sekme ödünç al; sekme sayısı max_pages ile sınırlıdır"""
+        self._bind_loop()
+        async with self._slots:
+            context = await self.context(key, factory)
+            idle = self._idle[key]
+            page = None
+            while idle and page is None:
+                candidate = idle.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await context.new_page()
+
+            try:
+                yield page
+            except BaseException:
+                # Hata sonrası sayfanın durumu belirsiz; yeniden kullanılmaz
+                await self._close_page(page)
+                raise
+            if page.is_closed():
+                return
+            idle.append(page)
+
+    async def _close_page(self, page):
+        try:
+            await page.close()
+        except Exception as e:
+            logger.error(f"Error closing page: {str(e)}")
+
+    async def close(self):
+        """Bekleyen ekran görüntülerini yaz; tüm context'leri, tarayıcıyı ve Playwright'ı kapat"""
+        try:
+            await self.screenshots.close()
+            for context in self._contexts.values():
+                await context.close()
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.error(f"Error closing browser pool: {str(e)}")
+        finally:
+            self._contexts = {}
+            self._idle = {}
+            self.browser = None
+            self.playwright = None
+
+
+_default = None
+
+
+def get_browser_pool(config=None):
+    """
+    Süreç genelindeki tarayıcı havuzunu döndür. İlk çağrıda verilen
+    yapılandırmanın `playwright` bölümüyle oluşturulur.
+    """
+    global _default
+    if _default is None:
+        _default = BrowserPool.from_config(config)
+    return _default
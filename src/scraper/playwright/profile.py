@@ -0,0 +1,76 @@
+import logging
+
+from .routing import ANALYTICS_HOSTS, HEAVY_RESOURCE_TYPES, block_resources
+
+logger = logging.getLogger(__name__)
+
+# Profil adı -> varsayılan ayarlar.
+# throughput: ekransız sunucular için; sayfa ağırlığı en aza indirilir.
+# debug: görünür pencere, tüm kaynaklar yüklenir, işlemler yavaşlatılır.
+PROFILES = {
+    "throughput": {
+        "headless": True,
+        "slow_mo": 0,
+        "viewport": {"width": 1280, "height": 720},
+        "block_resources": list(HEAVY_RESOURCE_TYPES),
+        "block_hosts": list(ANALYTICS_HOSTS),
+    },
+    "debug": {
+        "headless": False,
+        "slow_mo": 50,
+        "viewport": {"width": 1920, "height": 1080},
+        "block_resources": [],
+        "block_hosts": [],
+    },
+}
+
+
+class BrowserProfile:
+    """Tarayıcının nasıl başlatılacağını ve context'lerde nelerin yükleneceğini belirler"""
+
+    def __init__(self, name="throughput", headless=True, slow_mo=0, viewport=None,
+                 block_resources=HEAVY_RESOURCE_TYPES, block_hosts=ANALYTICS_HOSTS):
+        """
+        Args:
+            name: Profil adı (günlükler için)
+            headless: Tarayıcıyı görünmez modda başlat
+            slow_mo: Her Playwright işlemi arasına eklenen gecikme (ms)
+            viewport: {"width", "height"}
+            block_resources: İptal edilecek request.resource_type değerleri
+            block_hosts: İstekleri iptal edilecek alan adları (alt alan adları dahil)
+        """
+        self.name = name
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.viewport = viewport or {"width": 1280, "height": 720}
+        self.block_resources = list(block_resources or [])
+        self.block_hosts = list(block_hosts or [])
+
+    @classmethod
+    def from_config(cls, options):
+        """
+        config.yaml içindeki `playwright` bölümünden profil oluştur. `profile`
+        adıyla seçilen profilin ayarlarını bölümdeki aynı adlı anahtarlar ezer.
+        """
+        options = options or {}
+        name = options.get("profile", "throughput")
+        if name not in PROFILES:
+            logger.warning(f"Unknown browser profile '{name}', using 'throughput'")
+            name = "throughput"
+        settings = dict(PROFILES[name])
+        settings.update({key: options[key] for key in settings if key in options})
+        return cls(name=name, **settings)
+
+    @classmethod
+    def named(cls, name):
+        """Yapılandırmadan bağımsız, adı verilen hazır profil"""
+        return cls(name=name, **PROFILES[name])
+
+    def launch_options(self):
+        """browser_type.launch() için headless/slow_mo argümanları"""
+        return {"headless": self.headless, "slow_mo": self.slow_mo}
+
+    async def apply(self, context):
+        """Profilin engelleme kurallarını context'e uygula"""
+        if self.block_resources or self.block_hosts:
+            await block_resources(context, self.block_resources, self.block_hosts)
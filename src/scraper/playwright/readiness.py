@@ -0,0 +1,123 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseSignal:
+    """URL'si belirli bir parçayı içeren başarılı bir ağ yanıtı"""
+
+    # Yanıt, sayfaya gitmeden önce dinlenmeye başlanmalı
+    early = True
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.name = f"response:{pattern}"
+
+    def wait(self, page, timeout):
+        return page.wait_for_event(
+            "response",
+            predicate=lambda response: self.pattern in response.url and response.ok,
+            timeout=timeout
+        )
+
+
+class SelectorSignal:
+    """DOM'da bir seçicinin belirli durumda görünmesi"""
+
+    early = False
+
+    def __init__(self, selector, state="visible"):
+        self.selector = selector
+        self.state = state
+        self.name = f"selector:{selector}"
+
+    def wait(self, page, timeout):
+        return page.wait_for_selector(self.selector, state=self.state, timeout=timeout)
+
+
+class FunctionSignal:
+    """Sayfada bir JavaScript ifadesinin doğru olması (örn. window.trends yüklendi)"""
+
+    early = False
+
+    def __init__(self, expression):
+        self.expression = expression
+        self.name = f"function:{expression}"
+
+    def wait(self, page, timeout):
+        return page.wait_for_function(self.expression, timeout=timeout)
+
+
+class Readiness:
+    """
+    Sabit beklemeler yerine sayfanın hazır olduğunu gösteren ilk sinyali bekler.
+    Ağ yanıtı sinyalleri goto'dan önce arm() ile, DOM sinyalleri goto'dan
+    sonra wait() içinde başlatılır.
+
+    Kullanım:
+        readiness = Readiness(page, [ResponseSignal("widgetdata/multiline")], timeout=30000)
+        readiness.arm()
+        await page.goto(url)
+        signal, value = await readiness.wait()
+    """
+
+    def __init__(self, page, signals, timeout=30000):
+        """
+        Args:
+            page: Playwright sayfası
+            signals: Response/Selector/FunctionSignal listesi; ilk gerçekleşen yeterlidir
+            timeout: Sinyal başına en fazla bekleme (ms)
+        """
+        self.page = page
+        self.signals = list(signals)
+        self.timeout = timeout
+        self._tasks = {}
+
+    def arm(self):
+        """Gezinmeden önce dinlenmesi gereken sinyalleri başlat"""
+        for signal in self.signals:
+            if signal.early and signal not in self._tasks:
+                self._tasks[signal] = asyncio.ensure_future(signal.wait(self.page, self.timeout))
+        return self
+
+    async def wait(self):
+        """
+        İlk gerçekleşen sinyali bekle.
+
+        Returns:
+            tuple: (sinyal, sonuç) veya hiçbiri gerçekleşmediyse (None, None)
+        """
+        for signal in self.signals:
+            if signal not in self._tasks:
+                self._tasks[signal] = asyncio.ensure_future(signal.wait(self.page, self.timeout))
+
+        pending = set(self._tasks.values())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        signal = next(s for s, t in self._tasks.items() if t is task)
+                        return signal, task.result()
+            return None, None
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        """Bekleyen sinyalleri iptal et"""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Zaman aşımı hataları "never retrieved" uyarısı vermesin
+                task.exception()
+        self._tasks = {}
+
+
+async def wait_ready(page, signals, timeout=30000):
+    """Gezinme gerektirmeyen durumlar için: verilen sinyallerden ilkini bekle"""
+    signal, value = await Readiness(page, signals, timeout).wait()
+    if signal is None:
+        logger.warning(f"No readiness signal fired within {timeout} ms: {[s.name for s in signals]}")
+    return signal, value
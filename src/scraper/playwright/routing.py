@@ -0,0 +1,49 @@
+import logging
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Veri çıkarmak için gerekmeyen, sayfa ağırlığının çoğunu oluşturan kaynaklar
+HEAVY_RESOURCE_TYPES = ("image", "font", "media")
+
+# Analitik ve reklam alan adları; sayfanın çalışması için gerekmez
+ANALYTICS_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "analytics.twitter.com",
+    "ads-twitter.com",
+    "ads-api.twitter.com",
+    "connect.facebook.net",
+    "scorecardresearch.com",
+)
+
+
+def _matches_host(url, hosts):
+    host = urlsplit(url).hostname or ""
+    return any(host == blocked or host.endswith("." + blocked) for blocked in hosts)
+
+
+async def block_resources(context, resource_types=HEAVY_RESOURCE_TYPES, hosts=()):
+    """
+    Context'teki tüm sayfalarda verilen türdeki veya alan adındaki istekleri iptal et.
+
+    Args:
+        context: Playwright browser context
+        resource_types: request.resource_type değerleri (örn. "image", "font", "media")
+        hosts: Alan adları; alt alan adları da engellenir
+    """
+    blocked = frozenset(resource_types)
+    hosts = tuple(hosts)
+
+    async def handle(route):
+        request = route.request
+        if request.resource_type in blocked or (hosts and _matches_host(request.url, hosts)):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", handle)
+    logger.debug(f"Blocking resource types {sorted(blocked)} and {len(hosts)} hosts")
@@ -0,0 +1,137 @@
+import asyncio
+import itertools
+import logging
+import os
+import random
+import re
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# off: hiç, on_error: yalnızca hata/zaman aşımında, sampled: hatalar + örneklem, always: her anahtar kelime
+MODES = ("off", "on_error", "sampled", "always")
+
+# Dosya adında kullanılamayan karakterler
+UNSAFE_CHARS = re.compile(r"[^\w.-]+")
+
+
+class ScreenshotPipeline:
+    """
+    Ekran görüntüsü politikası ve arka plan yazıcısı. Görüntüler JPEG olarak
+    alınır; diske yazma bir kuyruk üzerinden ayrı bir görevde ve iş
+    parçacığında yapılır, scraper beklemez. Her çalıştırma kendi dizinine yazar.
+    """
+
+    def __init__(self, mode="on_error", sample_rate=0.05, quality=50, clip=None,
+                 directory="screenshots", queue_size=64):
+        """
+        Args:
+            mode: "off", "on_error", "sampled" veya "always"
+            sample_rate: sampled modunda hatasız anahtar kelimelerin yakalanma oranı (0-1)
+            quality: JPEG kalitesi (0-100)
+            clip: Yalnızca bu bölgeyi yakala ({"x", "y", "width", "height"}); None ise görünür alan
+            directory: Çalıştırma dizinlerinin oluşturulacağı kök dizin
+            queue_size: Yazılmayı bekleyebilecek en fazla görüntü; dolunca yenileri atlanır
+        """
+        if mode not in MODES:
+            logger.warning(f"Unknown screenshot mode '{mode}', using 'on_error'")
+            mode = "on_error"
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.quality = quality
+        self.clip = clip
+        self.run_dir = os.path.join(directory, datetime.now().strftime("%Y%m%d-%H%M%S"))
+        self.queue_size = max(1, queue_size)
+        self._sequence = itertools.count(1)
+        self._loop = None
+        self._queue = None
+        self._writer = None
+
+    @classmethod
+    def from_config(cls, options):
+        """config.yaml içindeki `playwright.screenshots` sözlüğünden oluştur"""
+        options = options or {}
+        return cls(
+            mode=options.get("mode", "on_error"),
+            sample_rate=options.get("sample_rate", 0.05),
+            quality=options.get("quality", 50),
+            clip=options.get("clip"),
+            directory=options.get("directory", "screenshots")
+        )
+
+    def should_capture(self, error=False):
+        if self.mode == "off":
+            return False
+        if self.mode == "always" or error:
+            return True
+        return self.mode == "sampled" and random.random() < self.sample_rate
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._writer = asyncio.create_task(self._write_forever())
+
+    async def capture(self, page, name, error=False):
+        """
+        Politika izin veriyorsa sayfanın görüntüsünü al ve yazılmak üzere kuyruğa ekle.
+
+        Returns:
+            str: Görüntünün yazılacağı dosya yolu veya alınmadıysa None
+        """
+        if not self.should_capture(error):
+            return None
+
+        options = {"type": "jpeg", "quality": self.quality}
+        if self.clip:
+            options["clip"] = self.clip
+        try:
+            image = await page.screenshot(**options)
+        except Exception as e:
+            logger.error(f"Error taking screenshot: {str(e)}")
+            return None
+
+        suffix = "_error" if error else ""
+        filename = f"{next(self._sequence):04d}_{UNSAFE_CHARS.sub('_', name)}{suffix}.jpg"
+        path = os.path.join(self.run_dir, filename)
+
+        self._bind_loop()
+        try:
+            self._queue.put_nowait((path, image))
+        except asyncio.QueueFull:
+            logger.warning(f"Screenshot queue full, dropping {filename}")
+            return None
+        return path
+
+    async def _write_forever(self):
+        while True:
+            path, image = await self._queue.get()
+            try:
+                await asyncio.to_thread(self._write, path, image)
+                logger.debug(f"Screenshot saved to {path}")
+            except Exception as e:
+                logger.error(f"Error writing screenshot {path}: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _write(path, image):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(image)
+
+    async def close(self):
+        """Kuyruktaki görüntüleri yaz ve yazıcıyı durdur"""
+        if self._writer is None:
+            return
+        if self._loop is asyncio.get_running_loop():
+            await self._queue.join()
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+        self._loop = None
+        self._queue = None
+        self._writer = None
@@ -1,21 +1,228 @@
 # src/scraper/playwright/twitter.py içindeki değişiklikler
 
+import asyncio
 import json
 import logging
 import re
 import random
 from datetime import datetime, timedelta
 from ..playwright.base import PlaywrightBaseScraper
+from .readiness import ResponseSignal, SelectorSignal
 
 logger = logging.getLogger(__name__)
 
 
+SEARCH_TIMELINE = "SearchTimeline"
+
+# Twitter listesi sanallaştırılmıştır; kaydırınca DOM'dan düşen tweet'ler
+# eklendikleri anda okunup kuyruğa alınır (kuyruk DRAIN_SCRIPT ile boşaltılır)
+OBSERVER_SCRIPT = """() => {
+    if (window.__tweetHarvest) return;
+    const queue = [];
+    const seen = new Set();
+    const count = (article, selector) => {
+        const element = article.querySelector(selector);
+        if (!element) return 0;
+        const digits = (element.getAttribute('aria-label') || element.textContent || '').replace(/[^0-9]/g, '');
+        return digits ? parseInt(digits) : 0;
+    };
+    const read = (article) => {
+        const link = article.querySelector('a[href*="/status/"]');
+        const match = link && link.getAttribute('href').match(/status\\/(\\d+)/);
+        if (!match || seen.has(match[1])) return;
+        seen.add(match[1]);
+        const user = article.querySelector('[data-testid="User-Name"] a[href^="/"]');
+        const text = article.querySelector('[data-testid="tweetText"]');
+        const time = article.querySelector('time');
+        queue.push({
+            id: match[1],
+            username: user ? user.getAttribute('href').slice(1) : "",
+            text: text ? text.textContent : "",
+            timestamp: time ? time.getAttribute('datetime') : null,
+            metrics: {
+                reply_count: count(article, '[data-testid="reply"]'),
+                retweet_count: count(article, '[data-testid="retweet"]'),
+                like_count: count(article, '[data-testid="like"]'),
+                view_count: count(article, 'a[href$="/analytics"]')
+            }
+        });
+    };
+    const scan = (root) => root.querySelectorAll('article[data-testid="tweet"]').forEach(read);
+    scan(document);
+    new MutationObserver((mutations) => mutations.forEach((mutation) => mutation.addedNodes.forEach((node) => {
+        if (node.nodeType !== 1) return;
+        if (node.matches('article[data-testid="tweet"]')) read(node); else scan(node);
+    }))).observe(document.body, {childList: true, subtree: true});
+    window.__tweetHarvest = queue;
+}"""
+
+DRAIN_SCRIPT = "() => (window.__tweetHarvest || []).splice(0)"
+
+
+def iter_timeline_tweets(node):
+    """SearchTimeline GraphQL yanıtındaki tweet_results.result düğümlerini sırayla üret"""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "tweet_results" and isinstance(value, dict):
+                if value.get("result"):
+                    yield value["result"]
+            else:
+                yield from iter_timeline_tweets(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from iter_timeline_tweets(item)
+
+
+def parse_tweet(result):
+    """GraphQL tweet sonucunu DOM çıkarımıyla aynı biçimdeki sözlüğe çevir; id yoksa None"""
+    if result.get("__typename") == "TweetWithVisibilityResults":
+        result = result.get("tweet", {})
+    legacy = result.get("legacy") or {}
+    tweet_id = result.get("rest_id") or legacy.get("id_str")
+    if not tweet_id:
+        return None
+
+    user = result.get("core", {}).get("user_results", {}).get("result", {})
+    username = user.get("core", {}).get("screen_name") or user.get("legacy", {}).get("screen_name", "")
+    # Uzun tweet'lerin tam metni note_tweet içindedir
+    note = result.get("note_tweet", {}).get("note_tweet_results", {}).get("result", {})
+    timestamp = legacy.get("created_at")
+    try:
+        timestamp = datetime.strptime(timestamp, "%a %b %d %H:%M:%S %z %Y").isoformat()
+    except (TypeError, ValueError):
+        pass
+    views = result.get("views", {}).get("count")
+
+    return {
+        "id": tweet_id,
+        "username": username,
+        "text": note.get("text") or legacy.get("full_text", ""),
+        "timestamp": timestamp,
+        "metrics": {
+            "reply_count": legacy.get("reply_count", 0),
+            "retweet_count": legacy.get("retweet_count", 0),
+            "like_count": legacy.get("favorite_count", 0),
+            "view_count": int(views) if views else 0
+        }
+    }
+
+
+class TweetHarvester:
+    """
+    Arama sonuçlarını kaydırdıkça artımlı toplar. SearchTimeline GraphQL
+    yanıtlarından ve DOM'a eklenen tweet'lerden (MutationObserver) gelenler
+    tweet id'sine göre tekilleştirilir; `limit` tekil tweet toplanınca veya
+    akış durunca biter.
+    """
+
+    def __init__(self, page, limit, stall_timeout=8.0, poll=1.0):
+        """
+        Args:
+            page: Arama sayfası; dinleyici gezinmeden önce eklenmelidir
+            limit: Toplanacak tekil tweet sayısı
+            stall_timeout: Bu kadar saniye yeni tweet gelmezse akış durmuş sayılır
+            poll: Kaydırma sonrası yeni tweet için en fazla bekleme (sn)
+        """
+        self.page = page
+        self.limit = limit
+        self.stall_timeout = stall_timeout
+        self.poll = poll
+        # id -> tweet; ilk geldiği sırayla
+        self.tweets = {}
+        self._progress = asyncio.Event()
+        self._pending = set()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if SEARCH_TIMELINE in response.url and response.ok:
+            task = asyncio.ensure_future(self._read(response))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response):
+        try:
+            payload = await response.json()
+        except Exception as e:
+            logger.debug(f"Could not parse SearchTimeline response: {str(e)}")
+            return
+        self._add(parse_tweet(result) for result in iter_timeline_tweets(payload))
+
+    def _add(self, tweets):
+        added = 0
+        for tweet in tweets:
+            if tweet and tweet["id"] not in self.tweets:
+                self.tweets[tweet["id"]] = tweet
+                added += 1
+        if added:
+            self._progress.set()
+        return added
+
+    def detach(self):
+        """Dinleyiciyi kaldır; sekme havuza döndükten sonra başka anahtar kelimede kullanılır"""
+        self.page.remove_listener("response", self._on_response)
+        for task in self._pending:
+            task.cancel()
+
+    async def harvest(self, pause=None):
+        """
+        Limit dolana veya akış durana kadar kaydırarak tweet topla.
+
+        Args:
+            pause: Her kaydırmadan sonra beklenecek async fonksiyon (örn. insan benzeri gecikme)
+
+        Returns:
+            list: En fazla `limit` tekil tweet
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await self.page.evaluate(OBSERVER_SCRIPT)
+        except Exception as e:
+            logger.warning(f"Could not install tweet observer, using network responses only: {str(e)}")
+
+        count = len(self.tweets)
+        last_progress = loop.time()
+        while True:
+            try:
+                self._add(await self.page.evaluate(DRAIN_SCRIPT))
+            except Exception as e:
+                logger.debug(f"Could not drain tweet observer: {str(e)}")
+
+            if len(self.tweets) >= self.limit:
+                break
+            if len(self.tweets) > count:
+                count = len(self.tweets)
+                last_progress = loop.time()
+            elif loop.time() - last_progress >= self.stall_timeout:
+                logger.info(f"Twitter feed stalled after {count} tweets")
+                break
+
+            self._progress.clear()
+            await self.page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
+            if pause:
+                await pause()
+            try:
+                await asyncio.wait_for(self._progress.wait(), self.poll)
+            except asyncio.TimeoutError:
+                pass
+
+        return list(self.tweets.values())[:self.limit]
+
+
 class TwitterPlaywrightScraper(PlaywrightBaseScraper):
+    def __init__(self, source_config, http_client=None, browser_pool=None):
+        super().__init__(source_config, http_client=http_client, browser_pool=browser_pool)
+        # Yeni tweet gelmeden bu kadar saniye geçerse kaydırma biter
+        self.stall_timeout = (source_config.get("extra_params") or {}).get("stall_timeout", 8.0)
+
     async def scrape(self, keywords, limit=10):
         await self.init_session()
-        results = []
+        # Her anahtar kelime havuzdan aldığı ayrı bir sekmede, paralel işlenir
+        return list(await asyncio.gather(*(self.scrape_keyword(keyword, limit) for keyword in keywords)))
 
-        for keyword in keywords:
+    async def scrape_keyword(self, keyword, limit=10):
+        async with self.new_page() as page:
+            # SearchTimeline yanıtları gezinmeden önce dinlenmeye başlanır
+            harvester = TweetHarvester(page, limit, stall_timeout=self.stall_timeout)
             try:
                 # Twitter arama URL'si (Türkçe arama için)
                 encoded_keyword = keyword.replace(" ", "%20")
@@ -23,26 +230,21 @@ class TwitterPlaywrightScraper(PlaywrightBaseScraper):
 
                 logger.info(f"Scraping Twitter for keyword: {keyword}")
 
-                # Sayfaya git ve yüklenmeyi bekle
-                await self.navigate(url, wait_selector="body", timeout=90000)  # 90 saniye timeout
-
-                # Sayfanın tamamen yüklenmesi için biraz bekle
-                await self.page.wait_for_timeout(5000)
+                # Sayfaya git; arama sonuçları (SearchTimeline) veya ilk tweet gelince devam et
+                await self.navigate(url, page=page, timeout=90000, ready=[  # 90 saniye timeout
+                    ResponseSignal(SEARCH_TIMELINE),
+                    SelectorSignal('article[data-testid="tweet"]')
+                ])
 
-                # Ekran görüntüsü al (debug için)
-                screenshot_path = f"twitter_{keyword.replace(' ', '_')}.png"
-                await self.take_screenshot(screenshot_path)
-                logger.info(f"Screenshot saved to {screenshot_path}")
+                # Ekran görüntüsü (politika izin veriyorsa, arka planda yazılır)
+                screenshot_path = await self.take_screenshot(keyword, page=page)
 
-                # İnsan davranışını taklit et - sayfa kaydırma
-                for _ in range(3):  # 3 kez kaydır
-                    await self.page.evaluate("""
-                        window.scrollBy(0, Math.floor(Math.random() * 500) + 300);
-                    """)
-                    await self.page.wait_for_timeout(random.randint(1000, 2000))
+                # Limit dolana veya akış durana kadar kaydırarak topla
+                tweet_data = await harvester.harvest(pause=lambda: self.pacing.wait("scroll"))
 
-                # Tweet'leri çıkarmak için alternatif yöntemler dene
-                tweet_data = await self.try_multiple_tweet_extraction_methods(limit)
+                # Hiçbir şey toplanamadıysa görünen DOM'dan çıkarmayı dene
+                if not tweet_data:
+                    tweet_data = await self.try_multiple_tweet_extraction_methods(limit, page=page)
 
                 # Eğer JavaScript değer döndüremediyse, örnek veri oluştur
                 if not tweet_data or len(tweet_data) == 0:
@@ -53,29 +255,31 @@ class TwitterPlaywrightScraper(PlaywrightBaseScraper):
                 logger.info(f"Successfully extracted {len(tweet_data)} tweets for {keyword}")
 
                 # Sonuçları biraraya getir
-                results.append({
+                return {
                     "keyword": keyword,
                     "source": "twitter",
                     "data": tweet_data,
                     "screenshot": screenshot_path
-                })
+                }
 
             except Exception as e:
                 logger.error(f"Error scraping Twitter for keyword {keyword}: {str(e)}")
                 # Hata durumunda örnek veri dön
-                results.append({
+                return {
                     "keyword": keyword,
                     "source": "twitter",
                     "data": self.generate_simulated_tweets(keyword, limit),
-                    "error": f"Scraping error: {str(e)}"
-                })
-
-        return results
+                    "error": f"Scraping error: {str(e)}",
+                    "screenshot": await self.take_screenshot(keyword, page=page, error=True)
+                }
+            finally:
+                harvester.detach()
 
-    async def try_multiple_tweet_extraction_methods(self, limit):
+    async def try_multiple_tweet_extraction_methods(self, limit, page=None):
         """Birden fazla seçici stratejisi deneyerek tweet çıkarma"""
+        page = page or self.page
         # Yöntem 1: article veya div[data-testid="tweet"] elementleri
-        tweets = await self.page.evaluate(f"""(limit) => {{
+        tweets = await page.evaluate(f"""(limit) => {{
             const tweets = [];
             // Tweet elementi için farklı seçiciler dene
             const tweetElements = Array.from(document.querySelectorAll('article[data-testid="tweet"], div[data-testid="tweet"], div[data-testid="tweetText"]').length > 0 
@@ -158,7 +362,7 @@ class TwitterPlaywrightScraper(PlaywrightBaseScraper):
 
         # Eğer yöntem 1 başarısız olduysa, sayfa içeriğini HTML olarak analiz et
         if not tweets or len(tweets) == 0:
-            html_content = await self.page.content()
+            html_content = await page.content()
 
             # Basit bir regex ile tweet benzeri içeriği çıkarmaya çalış
             tweets = []
@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import random
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevir (sayı veya HTTP tarihi); yoksa None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Saniyede `rate` hak üreten, en fazla `burst` hak biriktiren kova. 429
+    alınınca hız yarıya iner (Retry-After varsa o süre hiç istek gönderilmez),
+    başarılı isteklerle max_rate'e kadar yavaşça geri artar.
+    """
+
+    def __init__(self, rate=5.0, burst=5, max_rate=None, min_rate=0.1, increase=0.05, decrease=0.5):
+        """
+        Args:
+            rate: Başlangıç hızı (istek/sn)
+            burst: Art arda gönderilebilecek en fazla istek
+            max_rate: Başarılı isteklerle çıkılabilecek en yüksek hız (varsayılan: rate)
+            min_rate: 429'lar sonrası inilebilecek en düşük hız
+            increase: Her başarılı istekte hıza eklenen miktar
+            decrease: Her 429'da hızın çarpılacağı oran
+        """
+        self.rate = float(rate)
+        self.max_rate = float(max_rate or rate)
+        self.min_rate = float(min_rate)
+        self.burst = max(1.0, float(burst))
+        self.increase = increase
+        self.decrease = decrease
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._loop = None
+        self._lock = None
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Bir hak al; hak yoksa veya kova Retry-After ile durdurulduysa bekle"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        # Kilit bekleyenleri sıraya koyar; hak sırayla dağıtılır
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def throttled(self, retry_after=None):
+        """Sunucu 429 (veya Retry-After'lı 503) döndürdü"""
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        logger.info(f"Rate limited; slowing down to {self.rate:.2f} req/s"
+                    + (f", pausing {retry_after:.1f} s" if retry_after else ""))
+
+    def succeeded(self):
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+
+class RetryPolicy:
+    """Yeniden denenebilir durumlar için jitter'lı üstel bekleme"""
+
+    def __init__(self, attempts=4, base_delay=0.5, max_delay=30.0, statuses=(429, 500, 502, 503, 504)):
+        """
+        Args:
+            attempts: İlk istek dahil en fazla deneme
+            base_delay: İlk yeniden denemedeki en uzun bekleme (sn); her denemede ikiye katlanır
+            max_delay: Bekleme üst sınırı (sn); daha uzun Retry-After'larda yeniden denenmez
+            statuses: Yeniden denenecek HTTP durum kodları
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.statuses = frozenset(statuses)
+
+    @classmethod
+    def from_config(cls, options):
+        options = options or {}
+        return cls(
+            attempts=options.get("attempts", 4),
+            base_delay=options.get("base_delay", 0.5),
+            max_delay=options.get("max_delay", 30.0)
+        )
+
+    def delay(self, attempt, retry_after=None):
+        """attempt. başarısız denemeden sonra beklenecek süre (full jitter, Retry-After'dan kısa değil)"""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        return max(backoff, retry_after or 0.0)
+
+
+class RateLimits:
+    """
+    Kaynak ve host başına TokenBucket'lar ile ortak yeniden deneme politikası.
+    Tüm scraper istekleri run() üzerinden gönderilir.
+    """
+
+    def __init__(self, default=None, sources=None, retry=None):
+        """
+        Args:
+            default: Kaynak için ayar yoksa TokenBucket argümanları ({"rate", "burst", "max_rate"})
+            sources: Kaynak adı -> TokenBucket argümanları
+            retry: RetryPolicy
+        """
+        self.default = default or {"rate": 5, "burst": 5}
+        self.sources = sources or {}
+        self.retry = retry or RetryPolicy()
+        self._buckets = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """config.yaml içindeki `rate_limits` bölümünden oluştur"""
+        options = (config or {}).get("rate_limits", {}) or {}
+        return cls(
+            default=options.get("default"),
+            sources=options.get("sources"),
+            retry=RetryPolicy.from_config(options.get("retry"))
+        )
+
+    def bucket(self, source, url):
+        host = urlsplit(url).hostname or ""
+        key = (source, host)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            settings = dict(self.default)
+            settings.update(self.sources.get(source, {}))
+            bucket = self._buckets[key] = TokenBucket(**settings)
+        return bucket
+
+    async def run(self, source, url, send, retry_on=(aiohttp.ClientError, asyncio.TimeoutError)):
+        """
+        İsteği kaynağın/host'un kovasından hak alarak gönder, gerekirse yeniden dene.
+
+        Args:
+            source: Kaynak adı
+            url: İstek URL'si (host'a göre kova seçilir)
+            send: İsteği gönderip (durum kodu, küçük harfli başlıklar, sonuç) döndüren async fonksiyon
+            retry_on: Yeniden denenecek istisna türleri
+
+        Returns:
+            Son denemenin sonucu; tüm denemeler istisnayla biterse son istisna yükseltilir
+        """
+        bucket = self.bucket(source, url)
+        last = self.retry.attempts - 1
+        for attempt in range(self.retry.attempts):
+            await bucket.acquire()
+            try:
+                status, headers, result = await send()
+            except retry_on as e:
+                if attempt == last:
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning(f"Request to {url} failed ({str(e)}), retrying in {delay:.1f} s")
+                await asyncio.sleep(delay)
+                continue
+
+            retry_after = parse_retry_after(headers.get("retry-after"))
+            if status == 429 or (status == 503 and retry_after is not None):
+                bucket.throttled(retry_after)
+            elif status < 500:
+                bucket.succeeded()
+
+            if status not in self.retry.statuses or attempt == last:
+                return result
+            if retry_after is not None and retry_after > self.retry.max_delay:
+                logger.warning(f"{url} asked to retry after {retry_after:.0f} s, giving up")
+                return result
+            delay = self.retry.delay(attempt, retry_after)
+            logger.warning(f"{url} returned HTTP {status}, retrying in {delay:.1f} s")
+            await asyncio.sleep(delay)
+        return result
+
+
+_default = None
+
+
+def configure_rate_limits(config):
+    """Scraper'ların kullanacağı hız sınırlarını config.yaml'dan oluştur"""
+    global _default
+    _default = RateLimits.from_config(config)
+    return _default
+
+
+def get_rate_limits():
+    """Süreç genelindeki hız sınırlarını döndür (yapılandırılmadıysa varsayılan ayarlarla)"""
+    global _default
+    if _default is None:
+        _default = RateLimits()
+    return _default
@@ -1,27 +1,32 @@
 import aiohttp
+import asyncio
 import json
-import base64
-import os
 from dotenv import load_dotenv
 from .base import BaseScraper
+from .reddit_auth import TOKEN_URL, get_rate_limiter, get_token_manager
 
 # .env dosyasını yükle
 load_dotenv()
 
+API_URL = "https://oauth.reddit.com"
+
 
 class RedditScraper(BaseScraper):
+    def __init__(self, source_config, http_client=None):
+        super().__init__(source_config, http_client)
+        extra_params = source_config.get("extra_params") or {}
+        # Testlerde yerel bir sunucuya yönlendirilebilir (extra_params.api_url / token_url)
+        self.api_url = extra_params.get("api_url", API_URL)
+        # Token ve hız sınırı süreç genelinde tüm RedditScraper örnekleri arasında paylaşılır
+        self.tokens = get_token_manager(extra_params.get("token_url", TOKEN_URL))
+        self.limiter = get_rate_limiter()
+
     async def scrape(self, keywords, limit=10):
         await self.init_session()
-        results = []
-
-        # Reddit API için kimlik bilgileri
-        client_id = os.getenv("REDDIT_CLIENT_ID")
-        client_secret = os.getenv("REDDIT_CLIENT_SECRET")
-        username = os.getenv("REDDIT_USERNAME")
-        password = os.getenv("REDDIT_PASSWORD")
 
         # Örnek veriler için
-        if not client_id or client_id == "YOUR_CLIENT_ID":
+        if not self.tokens.configured:
+            results = []
             for keyword in keywords:
                 # Mock veri oluştur
                 posts = []
@@ -41,67 +46,55 @@ class RedditScraper(BaseScraper):
                 })
             return results
 
-        # Gerçek API için
-        try:
-            # Reddit OAuth token al
-            auth = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
-            headers = {
-                "Authorization": f"Basic {auth}",
-                "User-Agent": "KeywordTrendAnalyzer/0.1 by " + username
-            }
-
-            data = {
-                "grant_type": "password",
-                "username": username,
-                "password": password
-            }
-
-            async with self.session.post(
-                    "https://www.reddit.com/api/v1/access_token",
-                    headers=headers,
-                    data=data
-            ) as response:
-                token_data = await response.json()
-                access_token = token_data.get("access_token")
+        # Gerçek API için: aramalar eşzamanlı, X-Ratelimit başlıklarına göre sınırlı
+        return list(await asyncio.gather(*(self.search(keyword, limit) for keyword in keywords)))
 
-                if not access_token:
-                    raise Exception("Reddit token alınamadı")
-
-                # Token ile arama yap
+    async def search(self, keyword, limit=10):
+        try:
+            for attempt in range(2):
+                access_token = await self.tokens.get_token(self.session)
                 headers = {
                     "Authorization": f"bearer {access_token}",
-                    "User-Agent": "KeywordTrendAnalyzer/0.1 by " + username
+                    "User-Agent": self.tokens.user_agent
                 }
 
-                for keyword in keywords:
-                    search_url = f"https://oauth.reddit.com/search?q={keyword}&sort=relevance&limit={limit}"
-
-                    async with self.session.get(search_url, headers=headers) as search_response:
-                        search_data = await search_response.json()
-
-                        posts = []
-                        for post in search_data.get("data", {}).get("children", []):
-                            post_data = post.get("data", {})
-                            posts.append({
-                                "title": post_data.get("title"),
-                                "score": post_data.get("score"),
-                                "comments": post_data.get("num_comments"),
-                                "url": post_data.get("url"),
-                                "created_utc": post_data.get("created_utc")
-                            })
+                # Önbellek anahtarı token'dan bağımsızdır (yalnızca URL ve parametreler)
+                search_response = await self.fetch(
+                    f"{self.api_url}/search",
+                    params={"q": keyword, "sort": "relevance", "limit": limit},
+                    headers=headers,
+                    limiter=self.limiter
+                )
+                # Token iptal edilmiş veya süresi dolmuşsa bir kez yenileyip tekrar dene
+                if search_response.status == 401 and attempt == 0:
+                    self.tokens.invalidate(access_token)
+                    continue
+                break
+
+            if search_response.status != 200:
+                raise Exception(f"Reddit search failed with HTTP {search_response.status}")
+            search_data = search_response.json()
+
+            posts = []
+            for post in search_data.get("data", {}).get("children", []):
+                post_data = post.get("data", {})
+                posts.append({
+                    "title": post_data.get("title"),
+                    "score": post_data.get("score"),
+                    "comments": post_data.get("num_comments"),
+                    "url": post_data.get("url"),
+                    "created_utc": post_data.get("created_utc")
+                })
 
-                        results.append({
-                            "keyword": keyword,
-                            "source": "reddit",
-                            "data": posts
-                        })
+            return {
+                "keyword": keyword,
+                "source": "reddit",
+                "data": posts
+            }
 
         except Exception as e:
-            for keyword in keywords:
-                results.append({
-                    "keyword": keyword,
-                    "source": "reddit",
-                    "error": str(e)
-                })
-
-        return results
\ No newline at end of file
+            return {
+                "keyword": keyword,
+                "source": "reddit",
+                "error": str(e)
+            }
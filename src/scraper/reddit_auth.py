@@ -0,0 +1,262 @@
+import asyncio
+import base64
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://www.reddit.com/api/v1/access_token"
+
+
+class RedditTokenManager:
+    """
+    Reddit OAuth (password grant) erişim token'ını süresiyle birlikte bellekte
+    ve isteğe bağlı olarak diskte tutar. Aynı süreçteki tüm RedditScraper
+    örnekleri tek token'ı paylaşır; süresi dolmadan önce yenilenir.
+
+    Diskte saklama REDDIT_TOKEN_CACHE ile açılır. REDDIT_TOKEN_KEY bir Fernet
+    anahtarıysa (cryptography paketi gerekir) dosya şifrelenir.
+    """
+
+    def __init__(self, client_id, client_secret, username, password, token_url=TOKEN_URL,
+                 cache_path=None, encryption_key=None, min_validity=60, refresh_ahead=300):
+        """
+        Args:
+            cache_path: Token'ın saklanacağı dosya (None: yalnızca bellek)
+            encryption_key: Dosyayı şifrelemek için Fernet anahtarı
+            min_validity: Token'ın en az bu kadar saniye geçerli olması gerekir, yoksa beklenerek yenilenir
+            refresh_ahead: Kalan süre bunun altına inince token arka planda yenilenir (sn)
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.username = username
+        self.password = password
+        self.token_url = token_url
+        self.cache_path = cache_path
+        self.min_validity = min_validity
+        self.refresh_ahead = refresh_ahead
+        self.user_agent = f"KeywordTrendAnalyzer/0.1 by {username}"
+        self.access_token = None
+        self.expires_at = 0.0
+        self._fernet = self._load_fernet(encryption_key)
+        self._loop = None
+        self._lock = None
+        self._refresh_task = None
+        self._load()
+
+    @classmethod
+    def from_env(cls, token_url=TOKEN_URL):
+        """REDDIT_* ortam değişkenlerinden yönetici oluştur"""
+        return cls(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            username=os.getenv("REDDIT_USERNAME"),
+            password=os.getenv("REDDIT_PASSWORD"),
+            token_url=token_url,
+            cache_path=os.getenv("REDDIT_TOKEN_CACHE"),
+            encryption_key=os.getenv("REDDIT_TOKEN_KEY")
+        )
+
+    @property
+    def configured(self):
+        return bool(self.client_id) and self.client_id != "YOUR_CLIENT_ID"
+
+    @staticmethod
+    def _load_fernet(key):
+        if not key:
+            return None
+        try:
+            from cryptography.fernet import Fernet
+        except ImportError:
+            logger.warning("REDDIT_TOKEN_KEY is set but 'cryptography' is not installed; token will not be stored on disk")
+            return False
+        return Fernet(key.encode() if isinstance(key, str) else key)
+
+    def _remaining(self):
+        return self.expires_at - time.time() if self.access_token else 0.0
+
+    def _bind_loop(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._refresh_task = None
+
+    async def get_token(self, session):
+        """
+        Geçerli erişim token'ını döndür, gerekirse yenile.
+
+        Args:
+            session: Token isteği için kullanılacak aiohttp oturumu
+        """
+        self._bind_loop()
+        remaining = self._remaining()
+        if remaining > self.min_validity:
+            if remaining < self.refresh_ahead and self._refresh_task is None:
+                # Süre bitmeden arka planda yenile; çağıran mevcut token'la devam eder
+                self._refresh_task = asyncio.create_task(self._refresh_in_background(session))
+            return self.access_token
+
+        async with self._lock:
+            # Kilidi beklerken başka bir görev yenilemiş olabilir
+            if self._remaining() <= self.min_validity:
+                await self._request_token(session)
+            return self.access_token
+
+    async def _refresh_in_background(self, session):
+        try:
+            async with self._lock:
+                if self._remaining() < self.refresh_ahead:
+                    await self._request_token(session)
+        except Exception as e:
+            logger.warning(f"Background Reddit token refresh failed: {str(e)}")
+        finally:
+            self._refresh_task = None
+
+    def invalidate(self, token):
+        """Sunucu token'ı reddettiyse (401) bir sonraki çağrıda yenilenmesini sağla"""
+        if token == self.access_token:
+            self.access_token = None
+            self.expires_at = 0.0
+
+    async def _request_token(self, session):
+        auth = base64.b64encode(f"{self.client_id}:{self.client_secret}".encode()).decode()
+        headers = {
+            "Authorization": f"Basic {auth}",
+            "User-Agent": self.user_agent
+        }
+        data = {
+            "grant_type": "password",
+            "username": self.username,
+            "password": self.password
+        }
+        async with session.post(self.token_url, headers=headers, data=data) as response:
+            token_data = await response.json(content_type=None)
+
+        access_token = token_data.get("access_token")
+        if not access_token:
+            raise Exception("Reddit token alınamadı")
+
+        self.access_token = access_token
+        self.expires_at = time.time() + float(token_data.get("expires_in", 3600))
+        logger.info(f"Obtained Reddit access token (valid for {int(self._remaining())} s)")
+        self._save()
+
+    def _load(self):
+        if not self.cache_path or self._fernet is False or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                raw = f.read()
+            if self._fernet:
+                raw = self._fernet.decrypt(raw)
+            cached = json.loads(raw)
+            # Başka bir hesaba ait token kullanılmaz
+            if cached.get("client_id") == self.client_id and cached.get("username") == self.username:
+                self.access_token = cached.get("access_token")
+                self.expires_at = float(cached.get("expires_at", 0))
+        except Exception as e:
+            logger.warning(f"Could not read cached Reddit token: {str(e)}")
+
+    def _save(self):
+        if not self.cache_path or self._fernet is False:
+            return
+        raw = json.dumps({
+            "client_id": self.client_id,
+            "username": self.username,
+            "access_token": self.access_token,
+            "expires_at": self.expires_at
+        }).encode()
+        if self._fernet:
+            raw = self._fernet.encrypt(raw)
+        try:
+            fd = os.open(self.cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(raw)
+        except OSError as e:
+            logger.warning(f"Could not store Reddit token: {str(e)}")
+
+
+class RedditRateLimiter:
+    """
+    Reddit'in X-Ratelimit-Remaining / X-Ratelimit-Reset başlıklarına göre
+    istekleri sınırlar. Kalan hak biterse pencere sıfırlanana kadar bekler.
+    """
+
+    def __init__(self, reserve=1):
+        """
+        Args:
+            reserve: Bu kadar hak kalınca yeni istek gönderme, pencereyi bekle
+        """
+        self.reserve = reserve
+        self.remaining = None
+        self.reset_at = 0.0
+        self._loop = None
+        self._lock = None
+        # Kalan hak bilinmiyorken gönderilen tek isteğin yanıtını bekleyen olay
+        self._probe = None
+
+    async def acquire(self):
+        """Bir istek hakkı al; gerekirse pencere sıfırlanana kadar bekle"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._probe = None
+
+        async with self._lock:
+            while True:
+                if self.remaining is None:
+                    if self._probe is None:
+                        # Pencerenin hakları ilk yanıtla öğrenilir; o zamana kadar tek istek gönderilir
+                        self._probe = asyncio.Event()
+                        return
+                    await self._probe.wait()
+                elif self.remaining <= self.reserve:
+                    wait = self.reset_at - time.time()
+                    if wait > 0:
+                        logger.info(f"Reddit rate limit reached, waiting {wait:.1f} s")
+                        await asyncio.sleep(wait)
+                    self.remaining = None
+                else:
+                    self.remaining -= 1
+                    return
+
+    def update(self, headers):
+        """
+        Yanıt başlıklarından kalan hakkı ve sıfırlanma zamanını güncelle. İstek
+        başarısız olsa da (boş başlıklarla) çağrılmalıdır; bekleyen istekler serbest kalır.
+        """
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            try:
+                self.remaining = float(remaining)
+                self.reset_at = time.time() + float(reset)
+            except ValueError:
+                pass
+        if self._probe is not None:
+            self._probe.set()
+            self._probe = None
+
+
+_tokens = {}
+_limiter = None
+
+
+def get_token_manager(token_url=TOKEN_URL):
+    """Token URL'si başına süreç genelindeki Reddit token yöneticisini döndür"""
+    tokens = _tokens.get(token_url)
+    if tokens is None:
+        tokens = _tokens[token_url] = RedditTokenManager.from_env(token_url)
+    return tokens
+
+
+def get_rate_limiter():
+    """Süreç genelindeki Reddit hız sınırlayıcısını döndür"""
+    global _limiter
+    if _limiter is None:
+        _limiter = RedditRateLimiter()
+    return _limiter
@@ -30,37 +30,41 @@ class TwitterScraper(BaseScraper):
         for keyword in keywords:
             try:
                 # Twitter API v2 endpoint
-                url = f"https://api.twitter.com/2/tweets/search/recent?query={keyword}&max_results={limit}&tweet.fields=public_metrics,created_at"
+                url = "https://api.twitter.com/2/tweets/search/recent"
+                params = {
+                    "query": keyword,
+                    "max_results": limit,
+                    "tweet.fields": "public_metrics,created_at"
+                }
 
-                async with self.session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        json_response = await response.json()
+                response = await self.fetch(url, params=params, headers=headers)
+                if response.status == 200:
+                    json_response = response.json()
 
-                        # API yanıtından tweet verilerini çıkar
-                        tweets = []
-                        if "data" in json_response:
-                            for tweet in json_response["data"]:
-                                tweets.append({
-                                    "id": tweet["id"],
-                                    "text": tweet["text"],
-                                    "created_at": tweet["created_at"],
-                                    "metrics": tweet.get("public_metrics", {})
-                                })
+                    # API yanıtından tweet verilerini çıkar
+                    tweets = []
+                    if "data" in json_response:
+                        for tweet in json_response["data"]:
+                            tweets.append({
+                                "id": tweet["id"],
+                                "text": tweet["text"],
+                                "created_at": tweet["created_at"],
+                                "metrics": tweet.get("public_metrics", {})
+                            })
 
-                        results.append({
-                            "keyword": keyword,
-                            "source": "twitter",
-                            "data": tweets
-                        })
-                    else:
-                        # API hata verirse
-                        error_data = await response.text()
-                        results.append({
-                            "keyword": keyword,
-                            "source": "twitter",
-                            "error": f"API Error: {response.status}",
-                            "details": error_data
-                        })
+                    results.append({
+                        "keyword": keyword,
+                        "source": "twitter",
+                        "data": tweets
+                    })
+                else:
+                    # API hata verirse
+                    results.append({
+                        "keyword": keyword,
+                        "source": "twitter",
+                        "error": f"API Error: {response.status}",
+                        "details": response.text()
+                    })
             except Exception as e:
                 results.append({
                     "keyword": keyword,
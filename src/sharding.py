@@ -0,0 +1,214 @@
+import asyncio
+import copy
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+
+from .planner import source_key
+
+logger = logging.getLogger(__name__)
+
+# Sonuç kuyruğunda işçinin bittiğini bildiren kayıt: (None, işçi no)
+_DONE = None
+
+
+def share_rate_limits(config, parts):
+    """
+    `rate_limits` hızlarını işçi sayısına bölünmüş bir config kopyası döndür.
+    Her işçi kendi kovalarını tuttuğundan toplam hız tek süreçteki ile aynı kalır.
+    Config'de olmayan ayarlar için RateLimits/TokenBucket varsayılanları bölünür.
+    """
+    from .scraper.ratelimit import RateLimits, TokenBucket
+
+    config = copy.deepcopy(config or {})
+    options = config["rate_limits"] = dict(config.get("rate_limits") or {})
+    defaults = TokenBucket()
+    default = dict(RateLimits.from_config(config).default)
+    default.setdefault("burst", defaults.burst)
+    default.setdefault("min_rate", defaults.min_rate)
+    options["default"] = default
+    options["sources"] = {name: dict(settings or {}) for name, settings in (options.get("sources") or {}).items()}
+
+    # Kaynak ayarları varsayılanın üzerine eklendiğinden bölünmüş varsayılanı devralır
+    for settings in [default, *options["sources"].values()]:
+        for name in ("rate", "max_rate", "min_rate"):
+            if settings.get(name):
+                settings[name] = settings[name] / parts
+        if settings.get("burst"):
+            settings["burst"] = max(1, settings["burst"] / parts)
+    return config
+
+
+class ShardedRunner:
+    """
+    İş planını N işçi sürece dağıtır. Her işçi kendi event loop'u, HTTP havuzu ve
+    tarayıcısı ile bir ScrapeEngine çalıştırır, ortak kuyruktan iş parçaları
+    çeker ve sonuçları ana sürece gönderir. Veritabanına yalnızca ana süreç yazar.
+    """
+
+    def __init__(self, workers=None, chunk_size=8, prefetch=2, start_method="spawn", poll=1.0):
+        """
+        Args:
+            workers: İşçi süreç sayısı (None veya 0: çekirdek sayısı)
+            chunk_size: Kuyruktaki bir parçadaki iş sayısı (aynı kaynağın işleri; Google Trends
+                grup boyutunun katı olması istek sayısını azaltır)
+            prefetch: Bir işçinin aynı anda çalıştırdığı parça sayısı
+            start_method: multiprocessing başlatma yöntemi (Playwright fork ile güvenli değildir)
+            poll: Ana sürecin ölen işçileri kontrol etme aralığı (sn)
+        """
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = max(1, chunk_size)
+        self.prefetch = max(1, prefetch)
+        self.start_method = start_method
+        self.poll = poll
+
+    @classmethod
+    def from_config(cls, config, workers=None):
+        """config.yaml içindeki `sharding` bölümünden oluştur (workers verilirse önceliklidir)"""
+        options = (config or {}).get("sharding", {}) or {}
+        return cls(
+            workers=workers or options.get("workers"),
+            chunk_size=options.get("chunk_size", 8),
+            prefetch=options.get("prefetch", 2),
+            start_method=options.get("start_method", "spawn")
+        )
+
+    def chunks(self, jobs):
+        """
+        İşleri kaynak başına parçalara böl; işçilerin aynı anda farklı kaynaklarla
+        çalışması için parçalar kaynaklar arasında sırayla dizilir.
+
+        Returns:
+            list: (plandaki sıra, ScrapeJob) listelerinden oluşan parçalar
+        """
+        by_source = {}
+        for index, job in enumerate(jobs):
+            by_source.setdefault(source_key(job.source), []).append((index, job))
+
+        per_source = [
+            [source_jobs[i:i + self.chunk_size] for i in range(0, len(source_jobs), self.chunk_size)]
+            for source_jobs in by_source.values()
+        ]
+        chunks = []
+        for round_ in range(max((len(source_chunks) for source_chunks in per_source), default=0)):
+            chunks.extend(source_chunks[round_] for source_chunks in per_source if round_ < len(source_chunks))
+        return chunks
+
+    async def stream(self, config, jobs, limit=10):
+        """
+        İşleri işçi süreçlerde çalıştır, her sonucu geldikçe (sonuç, iş) olarak üret.
+
+        Args:
+            config: İşçilerin ScrapeEngine.from_config'e vereceği yapılandırma
+            jobs: ScrapeJob listesi (örn. ScrapePlan.jobs)
+            limit: Her iş için sonuç limiti
+        """
+        chunks = self.chunks(jobs)
+        workers = min(self.workers, len(chunks))
+        if not workers:
+            return
+
+        context = multiprocessing.get_context(self.start_method)
+        tasks = context.Queue()
+        results = context.Queue()
+        for chunk in chunks:
+            tasks.put(chunk)
+        # Her işçi görevi bir bitiş işareti alınca durur
+        for _ in range(workers * self.prefetch):
+            tasks.put(None)
+
+        worker_config = share_rate_limits(config, workers)
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(number, worker_config, tasks, results, limit, self.prefetch),
+                name=f"scrape-shard-{number}",
+                daemon=True
+            )
+            for number in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        logger.info(f"Running {len(jobs)} jobs in {len(chunks)} chunks on {workers} worker processes")
+
+        loop = asyncio.get_running_loop()
+        running = set(range(workers))
+        # Sonucu gelmemiş işler; ölen işçinin parçası bunlar arasında kalır
+        pending = set(range(len(jobs)))
+        try:
+            while running:
+                try:
+                    index, result = await loop.run_in_executor(None, results.get, True, self.poll)
+                except queue.Empty:
+                    for number in list(running):
+                        if not processes[number].is_alive():
+                            logger.error(f"Worker {number} exited with code {processes[number].exitcode}")
+                            running.discard(number)
+                    continue
+
+                if index is _DONE:
+                    running.discard(result)
+                else:
+                    pending.discard(index)
+                    yield result, jobs[index]
+
+            if pending:
+                # Bitiş kaydı göndermeden ölen işçilerin (veya kuyrukta kalan) işleri hata olarak bildirilir
+                logger.error(f"{len(pending)} jobs got no result from the worker processes")
+                for index in sorted(pending):
+                    job = jobs[index]
+                    yield {"keyword": job.keyword, "source": job.source_name,
+                           "error": "Worker process exited before finishing this job"}, job
+        finally:
+            for process in processes:
+                await loop.run_in_executor(None, process.join, 5)
+                if process.is_alive():
+                    process.terminate()
+            tasks.cancel_join_thread()
+            results.cancel_join_thread()
+
+
+def _worker_main(number, config, tasks, results, limit, prefetch):
+    """İşçi sürecin giriş noktası"""
+    # Ctrl+C tüm süreç grubuna gider; işçileri ana süreç durdurur
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        asyncio.run(_work(config, tasks, results, limit, prefetch))
+    except Exception as e:
+        logger.error(f"Worker {number} failed: {str(e)}")
+    finally:
+        results.put((_DONE, number))
+        results.close()
+        results.join_thread()
+
+
+async def _work(config, tasks, results, limit, prefetch):
+    # Scraper yığını (playwright, pytrends...) yalnızca işçi süreçte yüklenir
+    from .engine import ScrapeEngine
+    engine = ScrapeEngine.from_config(config)
+    loop = asyncio.get_running_loop()
+
+    async def pull():
+        while True:
+            chunk = await loop.run_in_executor(None, tasks.get)
+            if chunk is None:
+                return
+            indexes = {id(job): index for index, job in chunk}
+            pending = set(indexes)
+            try:
+                async for result, job in engine.stream_jobs([job for _, job in chunk], limit=limit):
+                    pending.discard(id(job))
+                    results.put((indexes[id(job)], result))
+            except Exception as e:
+                logger.error(f"Chunk of {len(chunk)} jobs failed: {str(e)}")
+                # Yanıtsız kalan işler ana sürece hata olarak bildirilir
+                for index, job in chunk:
+                    if id(job) in pending:
+                        results.put((index, {"keyword": job.keyword, "source": job.source_name, "error": str(e)}))
+
+    try:
+        await asyncio.gather(*(pull() for _ in range(prefetch)))
+    finally:
+        await engine.close()
@@ -0,0 +1,35 @@
+import math
+from datetime import date, datetime
+
+
+def normalize_ts(key):
+    """Zaman serisi anahtarını (tarih, Timestamp, metin) metne çevir"""
+    # pandas.Timestamp datetime alt sınıfıdır
+    if isinstance(key, datetime):
+        if key.hour == 0 and key.minute == 0 and key.second == 0 and key.microsecond == 0:
+            return key.date().isoformat()
+        return key.isoformat()
+    if isinstance(key, date):
+        return key.isoformat()
+    return str(key)
+
+
+def series_points(data):
+    """
+    Tarih -> değer sözlüğünü (ts, value) noktalarına çevir.
+
+    Returns:
+        list veya None: Veri sayısal bir zaman serisi değilse None
+    """
+    if not isinstance(data, dict) or not data:
+        return None
+
+    points = []
+    for key, value in data.items():
+        # bool int alt sınıfıdır ama trend değeri değildir
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return None
+        if isinstance(value, float) and not math.isfinite(value):
+            return None
+        points.append((normalize_ts(key), value))
+    return points